@@ -0,0 +1,177 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+from threading import Lock
+from typing import Callable, Any
+from pathlib import Path
+import json
+import time
+import os
+
+from modules import Logger
+from modules import request
+from modules.request import Response, Api
+from modules.filesystem import Directory
+
+
+MAX_WORKERS: int = 3
+RESULT_TIMEOUT: float = 30
+MAX_RESULTS: int = 256
+
+
+executor: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix="activity_watcher.activity_api")
+
+
+# Each lookup is requested in the background as soon as it is submitted, so the game, thumbnail and user thumbnail requests run at the same time
+# Results are kept for the endpoint's TTL, and an ID that is already being requested shares the pending request
+class CachedResolver:
+    name: str
+    url: Callable[[str], str]
+    parse: Callable[[dict], dict[str, Any]]
+    ttl: float
+
+    results: dict[str, tuple[float, Any]]
+    pending: dict[str, Future]
+    lock: Lock
+
+
+    def __init__(self, name: str, url: Callable[[str], str], parse: Callable[[dict], dict[str, Any]], ttl: float) -> None:
+        self.name = name
+        self.url = url
+        self.parse = parse
+        self.ttl = ttl
+        self.results = {}
+        self.pending = {}
+        self.lock = Lock()
+
+
+    def get(self, id: str) -> Any:
+        return self.submit(id).result(timeout=RESULT_TIMEOUT)
+
+
+    def submit(self, id: str) -> Future:
+        id = str(id)
+        with self.lock:
+            cached: tuple[float, Any] | None = self.results.get(id)
+            if cached is not None and cached[0] > time.monotonic():
+                future: Future = Future()
+                future.set_result(cached[1])
+                return future
+
+            pending: Future | None = self.pending.get(id)
+            if pending is not None:
+                return pending
+
+            future = executor.submit(self._resolve, id)
+            self.pending[id] = future
+            return future
+
+
+    def _resolve(self, id: str) -> Any:
+        try:
+            response: Response = request.get(self.url(id), dont_log_cached_request=True)
+            results: dict[str, Any] = self.parse(response.json())
+            if id not in results:
+                raise KeyError(f"No {self.name} found for ID: {id}")
+
+        except Exception as e:
+            Logger.error(f"Failed to resolve {self.name} for ID: {id}! {type(e).__name__}: {e}", prefix="activity_watcher.CachedResolver._resolve()")
+            with self.lock:
+                self.pending.pop(id, None)
+            raise
+
+        now: float = time.monotonic()
+        with self.lock:
+            self._prune(now)
+            self.results[id] = (now + self.ttl, results[id])
+            self.pending.pop(id, None)
+        return results[id]
+
+
+    # Only called with the lock held, expired results are removed first
+    # If there are still too many, the results that expire first are removed
+    def _prune(self, now: float) -> None:
+        self.results = {id: result for id, result in self.results.items() if result[0] > now}
+        if len(self.results) < MAX_RESULTS:
+            return
+
+        for id, _ in sorted(self.results.items(), key=lambda item: item[1][0])[:len(self.results) - MAX_RESULTS + 1]:
+            del self.results[id]
+
+
+def _parse_games(data: dict) -> dict[str, dict]:
+    return {str(item["id"]): item for item in data["data"]}
+
+
+def _parse_thumbnails(data: dict) -> dict[str, str]:
+    return {str(item["targetId"]): str(item["imageUrl"]) for item in data["data"]}
+
+
+games: CachedResolver = CachedResolver("game", Api.Roblox.Activity.game, _parse_games, ttl=60)
+thumbnails: CachedResolver = CachedResolver("thumbnail", Api.Roblox.Activity.thumbnail, _parse_thumbnails, ttl=3600)
+user_thumbnails: CachedResolver = CachedResolver("user thumbnail", Api.Roblox.Activity.user_thumbnail, _parse_thumbnails, ttl=3600)
+
+
+# region universe IDs
+# A place always belongs to the same universe, so the mapping is saved to disk
+class UniverseIdCache:
+    FILENAME: str = "universe_ids.json"
+
+    filepath: Path
+    data: dict[str, str] | None
+    lock: Lock
+
+
+    def __init__(self, directory: str | Path = Directory.CACHE) -> None:
+        self.filepath = Path(directory) / self.FILENAME
+        self.data = None
+        self.lock = Lock()
+
+
+    def get(self, place_id: str) -> str:
+        place_id = str(place_id)
+        with self.lock:
+            if self.data is None:
+                self.data = self._read_file()
+            universe_id: str | None = self.data.get(place_id)
+        if universe_id is not None:
+            return universe_id
+
+        response: Response = request.get(Api.Roblox.Activity.universe_id(place_id), cached=True, dont_log_cached_request=True)
+        universe_id = str(response.json()["universeId"])
+
+        with self.lock:
+            self.data[place_id] = universe_id
+            self._save()
+        return universe_id
+
+
+    def _save(self) -> None:
+        temp: Path = self.filepath.with_name(f"{self.FILENAME}.{os.getpid()}.tmp")
+        try:
+            self.filepath.parent.mkdir(parents=True, exist_ok=True)
+            with open(temp, "w") as file:
+                json.dump(self.data, file)
+            os.replace(temp, self.filepath)
+
+        except Exception as e:
+            Logger.warning(f"Failed to save universe ID cache! {type(e).__name__}: {e}", prefix="activity_watcher.UniverseIdCache._save()")
+            if temp.is_file():
+                temp.unlink()
+
+
+    def _read_file(self) -> dict[str, str]:
+        if not self.filepath.is_file():
+            return {}
+
+        try:
+            with open(self.filepath, "r") as file:
+                data: dict = json.load(file)
+            if not isinstance(data, dict):
+                raise TypeError(f"Expected dict, got {type(data).__name__}")
+            return data
+
+        except Exception as e:
+            Logger.warning(f"Failed to read universe ID cache! {type(e).__name__}: {e}", prefix="activity_watcher.UniverseIdCache._read_file()")
+            return {}
+
+
+universe_ids: UniverseIdCache = UniverseIdCache()
\ No newline at end of file
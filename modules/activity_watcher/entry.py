@@ -1,35 +1,89 @@
 from datetime import datetime, timezone
+import calendar
 
 
+# The second and its epoch are stored together, so a reader on another thread never sees one without the other
+_last: tuple[str | None, float] = (None, 0)
+
+
+# Timestamps look like 2024-01-01T12:34:56.789Z, the epoch of the last second is reused since most lines share it
+def _parse_timestamp(data: str) -> float:
+    global _last
+    timestamp: str = data.split(",", 1)[0]
+
+    try:
+        if len(timestamp) != 24 or timestamp[19] != "." or timestamp[23] != "Z":
+            raise ValueError(timestamp)
+
+        second: str = timestamp[:19]
+        last_second, epoch = _last
+        if second != last_second:
+            epoch = calendar.timegm((int(second[0:4]), int(second[5:7]), int(second[8:10]), int(second[11:13]), int(second[14:16]), int(second[17:19])))
+            _last = (second, epoch)
+        return epoch + int(timestamp[20:23]) / 1000
+
+    except ValueError:
+        return datetime.strptime(timestamp, "%Y-%m-%dT%H:%M:%S.%fZ").replace(tzinfo=timezone.utc).timestamp()
+
+
+# Fields are only parsed when they are used, most lines are skipped based on their first prefix
 class Entry:
-    timestamp: float
-    prefixes: list[str] = []
+    __slots__ = ("original", "_timestamp", "_first_prefix", "_prefixes", "_message")
+
     original: str
-    message: str
-    level: str | None = None
 
 
     def __init__(self, data: str):
-        self.prefixes = []
-
         self.original = data.strip()
-        
-        self.timestamp = datetime.strptime(data.split(",")[0], "%Y-%m-%dT%H:%M:%S.%fZ").replace(tzinfo=timezone.utc).timestamp()
+        self._timestamp: float | None = None
+        self._first_prefix: str | None = None
+        self._prefixes: list[str] | None = None
+        self._message: str | None = None
 
-        split_data: list[str] = data.split()[1:]
-        for item in split_data:
-            if item.startswith("[") and item.endswith("]"):
-                self.prefixes.append(item)
+
+    @property
+    def timestamp(self) -> float:
+        if self._timestamp is None:
+            self._timestamp = _parse_timestamp(self.original)
+        return self._timestamp
+
+
+    @property
+    def first_prefix(self) -> str:
+        if self._first_prefix is None:
+            if self._prefixes is not None:
+                self._first_prefix = self._prefixes[0] if self._prefixes else ""
             else:
-                break
-
-        self.message = " ".join(data.split(" ")[1:])
-        for prefix in self.prefixes:
-            self.message = self.message.replace(prefix, "", 1)
-        self.message = self.message.strip()
-        
-        level = item.split()[0].split(",")[-1]
-        try:
-            int(level)
-        except ValueError:
-            self.level = level
\ No newline at end of file
+                parts: list[str] = self.original.split(None, 2)
+                self._first_prefix = parts[1] if len(parts) > 1 and parts[1].startswith("[") and parts[1].endswith("]") else ""
+        return self._first_prefix
+
+
+    @property
+    def prefixes(self) -> list[str]:
+        if self._prefixes is None:
+            prefixes: list[str] = []
+            for item in self.original.split()[1:]:
+                if item.startswith("[") and item.endswith("]"):
+                    prefixes.append(item)
+                else:
+                    break
+            self._prefixes = prefixes
+        return self._prefixes
+
+
+    @property
+    def message(self) -> str:
+        if self._message is None:
+            parts: list[str] = self.original.split(" ", 1)
+            message: str = parts[1] if len(parts) > 1 else ""
+            for prefix in self.prefixes:
+                message = message.replace(prefix, "", 1)
+            self._message = message.strip()
+        return self._message
+
+
+    @property
+    def level(self) -> str | None:
+        level: str = self.original.split(None, 1)[0].split(",")[-1]
+        return None if level.isdigit() else level
\ No newline at end of file
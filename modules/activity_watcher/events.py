@@ -0,0 +1,148 @@
+from typing import Literal, Callable
+import json
+import re
+
+from modules import Logger
+
+from .entry import Entry
+from .log_data import LogData
+
+
+# region events
+class GameJoin:
+    timestamp: float
+    place_id: str | None
+    job_id: str | None
+
+    def __init__(self, timestamp: float, place_id: str | None, job_id: str | None) -> None:
+        self.timestamp = timestamp
+        self.place_id = place_id
+        self.job_id = job_id
+
+
+class GameLeave:
+    pass
+
+
+class PrivateServer:
+    pass
+
+
+class ReservedServer:
+    pass
+
+
+class BloxstrapRPC:
+    content: dict
+
+    def __init__(self, content: dict) -> None:
+        self.content = content
+
+
+class JoinLoadTime:
+    user_id: str
+    place_id: str
+    universe_id: str
+
+    def __init__(self, user_id: str, place_id: str, universe_id: str) -> None:
+        self.user_id = user_id
+        self.place_id = place_id
+        self.universe_id = universe_id
+
+
+Event = GameJoin | GameLeave | PrivateServer | ReservedServer | BloxstrapRPC | JoinLoadTime
+# endregion
+
+
+# region handlers
+def _player_game_join(entry: Entry) -> GameJoin | None:
+    if LogData.Player.GameJoin.keyword not in entry.message:
+        return None
+    match = re.search(r"game '([a-f0-9\-]+)' place (\d+)", entry.message)
+    if match is None:
+        return GameJoin(entry.timestamp, None, None)
+    return GameJoin(entry.timestamp, match.group(2), match.group(1))
+
+
+def _player_game_leave(entry: Entry) -> GameLeave | None:
+    return GameLeave() if LogData.Player.GameLeave.keyword in entry.message else None
+
+
+def _player_join_load_time(entry: Entry) -> JoinLoadTime | None:
+    if LogData.Player.GameJoinLoadTime.keyword not in entry.message:
+        return None
+    data: dict = dict(
+        item.removesuffix(",").split(":", 1)
+        for item in entry.message.removeprefix("Report game_join_loadtime: ").split()
+    )
+    return JoinLoadTime(data["userid"], data["placeid"], data["universeid"])
+
+
+def _player_private_server(entry: Entry) -> PrivateServer | None:
+    return PrivateServer() if LogData.Player.GamePrivateServer.keyword in entry.message else None
+
+
+def _player_reserved_server(entry: Entry) -> ReservedServer | None:
+    return ReservedServer() if LogData.Player.GameReservedServer.keyword in entry.message else None
+
+
+def _bloxstrap_rpc(entry: Entry) -> BloxstrapRPC | None:
+    if LogData.Player.BloxstrapRPC.bloxstrap_rpc_prefix not in entry.prefixes:
+        return None
+    try:
+        return BloxstrapRPC(json.loads(entry.message))
+    except Exception as e:
+        Logger.error(f"Failed to read BloxstrapRPC message! {type(e).__name__}: {e}", prefix="activity_watcher.events._bloxstrap_rpc()")
+        return None
+
+
+def _studio_game_join(entry: Entry) -> GameJoin | None:
+    if LogData.Studio.GameJoin.keyword not in entry.message:
+        return None
+    place_id: str = entry.message.removeprefix("open place (identifier = ").removesuffix(") [start]")
+    return GameJoin(entry.timestamp, place_id, None)
+
+
+def _studio_game_leave(entry: Entry) -> GameLeave | None:
+    return GameLeave() if LogData.Studio.GameLeave.keyword in entry.message else None
+
+
+Handler = Callable[[Entry], Event | None]
+
+
+# Handlers are grouped by prefix, so most log lines are skipped with a single lookup
+def _build_handlers(items: list[tuple[str, Handler]]) -> dict[str, list[Handler]]:
+    handlers: dict[str, list[Handler]] = {}
+    for prefix, handler in items:
+        handlers.setdefault(prefix, []).append(handler)
+    return handlers
+
+
+HANDLERS: dict[str, dict[str, list[Handler]]] = {
+    "Player": _build_handlers([
+        (LogData.Player.GameLeave.prefix, _player_game_leave),
+        (LogData.Player.GamePrivateServer.prefix, _player_private_server),
+        (LogData.Player.GameReservedServer.prefix, _player_reserved_server),
+        (LogData.Player.BloxstrapRPC.prefix, _bloxstrap_rpc),
+        (LogData.Player.GameJoinLoadTime.prefix, _player_join_load_time),
+        (LogData.Player.GameJoin.prefix, _player_game_join)
+    ]),
+    "Studio": _build_handlers([
+        (LogData.Studio.GameLeave.prefix, _studio_game_leave),
+        (LogData.Player.BloxstrapRPC.prefix, _bloxstrap_rpc),
+        (LogData.Studio.GameJoin.prefix, _studio_game_join)
+    ])
+}
+# endregion
+
+
+def parse(entry: Entry, mode: Literal["Player", "Studio"]) -> Event | None:
+    handlers: list[Handler] | None = HANDLERS[mode].get(entry.first_prefix)
+    if handlers is None:
+        return None
+
+    for handler in handlers:
+        event: Event | None = handler(entry)
+        if event is not None:
+            return event
+    return None
\ No newline at end of file
@@ -1,8 +1,5 @@
-import os
-import re
-import json
 from typing import Literal
-from pathlib import Path
+from concurrent.futures import Future
 
 from modules.config import integrations
 from modules.filesystem import Directory
@@ -11,24 +8,82 @@ from modules.request import Response, Api
 
 from .entry import Entry
 from .log_data import LogData
+from .log_tail import LogTail
+from .events import Event, GameJoin, GameLeave, PrivateServer, ReservedServer, BloxstrapRPC, JoinLoadTime
+from . import activity_api, events
+
+
+# The status of the current session, events are applied in the order they were logged
+class Status:
+    default: bool
+    timestamp: float | None
+    user_id: str | None
+    place_id: str | None
+    root_place_id: str | None
+    universe_id: str | None
+    job_id: str | None
+    name: str
+    creator: str
+    private_server: bool
+    reserved_server: bool
+    bloxstrap_rpc: bool
+    bloxstrap_rpc_content: dict | None
+
+
+    def __init__(self) -> None:
+        self.default = True
+        self.timestamp = None
+        self.user_id = None
+        self.place_id = None
+        self.root_place_id = None
+        self.universe_id = None
+        self.job_id = None
+        self.name = "???"
+        self.creator = "???"
+        self.private_server = False
+        self.reserved_server = False
+        self.bloxstrap_rpc = False
+        self.bloxstrap_rpc_content = None
+
+
+    def apply(self, event: Event) -> None:
+        match event:
+            case GameJoin():
+                self.default = False
+                self.timestamp = event.timestamp
+                self.universe_id = None
+                self.job_id = event.job_id
+                if event.place_id is not None:
+                    self.place_id = event.place_id
+                self._reset_flags()
+
+            case GameLeave():
+                self.default = True
+                self._reset_flags()
+
+            case PrivateServer():
+                self.private_server = True
+
+            case ReservedServer():
+                self.reserved_server = True
+
+            case BloxstrapRPC():
+                self.bloxstrap_rpc = True
+                self.bloxstrap_rpc_content = event.content
+
+            case JoinLoadTime():
+                self.user_id = event.user_id
+                self.place_id = event.place_id
+                self.universe_id = event.universe_id
+
+
+    def _reset_flags(self) -> None:
+        self.private_server = False
+        self.reserved_server = False
+        self.bloxstrap_rpc = False
 
 
 class LogReader:
-    class Status:
-        default: bool = False
-        timestamp: float | None = None
-        user_id: str | None = None
-        place_id: str | None = None
-        root_place_id: str | None = None
-        universe_id: str | None = None
-        job_id: str | None = None
-        name: str = "???"
-        creator: str = "???"
-        private_server: bool = False
-        reserved_server: bool = False
-        bloxstrap_rpc: bool = False
-        bloxstrap_rpc_content: dict | None = None
-
     class AssetKeys:
         DEFAULT: str = "modloader"
         PLAYER: str = "roblox"
@@ -37,38 +92,56 @@ class LogReader:
 
     data: dict = {}
     mode: Literal["Player", "Studio"]
+    log_tail: LogTail
+    last_entry: Entry | None
+    status: Status
 
 
     def __init__(self, mode: Literal["Player", "Studio"]):
         self.mode = mode
+        self.log_tail = LogTail(Directory.ROBLOX_LOGS, mode)
+        self.last_entry = None
+        self.status = Status()
     
 
     def get_status(self) -> dict | None | Literal["DEFAULT"]:
-        log: list[Entry] = self._read_latest_log()
+        log: list[Entry] = self.log_tail.read()
+        if self.log_tail.rotated:
+            self._reset_status()
+        if log:
+            self.last_entry = log[-1]
 
-        if self._is_old_log(log):
+        if self._is_old_log():
             return None
         
         self._update_status(log)
 
-        if self.Status.default:
+        if self.status.default:
             return "DEFAULT"
 
         small_image: str | None = self.AssetKeys.STUDIO if self.mode == "Studio" else self.AssetKeys.PLAYER
         small_text: str | None = f"Roblox {self.mode}"
 
-        if self.Status.universe_id is not None:
-            response: Response = request.get(Api.Roblox.Activity.thumbnail(self.Status.universe_id), cached=True, dont_log_cached_request=True)
-            data: dict = response.json()
-            thumbnail: str = str(data["data"][0]["imageUrl"])
+        show_user_profile: bool = False if self.mode == "Studio" else integrations.get_value("show_user_profile_in_rpc")
+        activity_joining: bool = False if self.mode == "Studio" else integrations.get_value("activity_joining")
+        do_bloxstrap_rpc: bool = integrations.get_value("bloxstrap_rpc")
 
-            response = request.get(Api.Roblox.Activity.game(self.Status.universe_id), cached=True, dont_log_cached_request=True)
-            data = response.json()
-            self.Status.root_place_id = str(data["data"][0]["rootPlaceId"])
-            self.Status.name = str(data["data"][0]["name"])
-            self.Status.creator = str(data["data"][0]["creator"]["name"])
+        # Lookups are submitted first so they are requested at the same time
+        if self.status.universe_id is not None:
+            thumbnail_future: Future = activity_api.thumbnails.submit(self.status.universe_id)
+            game_future: Future = activity_api.games.submit(self.status.universe_id)
+        if show_user_profile and self.status.user_id is not None:
+            user_thumbnail_future: Future = activity_api.user_thumbnails.submit(self.status.user_id)
+
+        if self.status.universe_id is not None:
+            thumbnail: str = thumbnail_future.result(timeout=activity_api.RESULT_TIMEOUT)
+
+            data: dict = game_future.result(timeout=activity_api.RESULT_TIMEOUT)
+            self.status.root_place_id = str(data["rootPlaceId"])
+            self.status.name = str(data["name"])
+            self.status.creator = str(data["creator"]["name"])
 
-            large_text = self.Status.name
+            large_text = self.status.name
         else:
             thumbnail = self.AssetKeys.STUDIO if self.mode == "Studio" else self.AssetKeys.PLAYER
             large_text = f"Roblox {self.mode}"
@@ -77,10 +150,10 @@ class LogReader:
             small_text = None
         
         self.data = {
-            "start": self.Status.timestamp,
+            "start": self.status.timestamp,
             "end": None,
-            "details": f"{'Editing' if self.mode == 'Studio' else 'Playing'} {self.Status.name}...",
-            "state": f"by {self.Status.creator}",
+            "details": f"{'Editing' if self.mode == 'Studio' else 'Playing'} {self.status.name}...",
+            "state": f"by {self.status.creator}",
             "large_image": thumbnail,
             "large_text": large_text,
             "small_image": small_image,
@@ -88,39 +161,32 @@ class LogReader:
             "buttons": []
         }
 
-        if self.Status.root_place_id is not None:
+        if self.status.root_place_id is not None:
             self.data["buttons"].append({
                     "label": "View on Roblox",
-                    "url": Api.Roblox.Activity.page(self.Status.root_place_id)
+                    "url": Api.Roblox.Activity.page(self.status.root_place_id)
             })
 
-        show_user_profile: bool = False if self.mode == "Studio" else integrations.get_value("show_user_profile_in_rpc")
-        activity_joining: bool = False if self.mode == "Studio" else integrations.get_value("activity_joining")
-        do_bloxstrap_rpc: bool = integrations.get_value("bloxstrap_rpc")
-
-        if activity_joining and self.Status.job_id is not None and self.Status.root_place_id is not None and not self.Status.reserved_server:
+        if activity_joining and self.status.job_id is not None and self.status.root_place_id is not None and not self.status.reserved_server:
             self.data["buttons"].insert(0, {
                 "label": "Join Game",
-                "url": Api.Roblox.Activity.deeplink(self.Status.root_place_id, self.Status.job_id)
+                "url": Api.Roblox.Activity.deeplink(self.status.root_place_id, self.status.job_id)
             })
         
         if self.data["buttons"] == []:
             self.data["buttons"] = None
         
-        if show_user_profile and self.Status.user_id is not None:
-            response = request.get(Api.Roblox.Activity.user_thumbnail(self.Status.user_id), cached=True, dont_log_cached_request=True)
-            data = response.json()
-            self.data["small_image"] = str(data["data"][0]["imageUrl"])
-
-            response = request.get(Api.Roblox.Activity.user(self.Status.user_id), cached=True, dont_log_cached_request=True)
+        if show_user_profile and self.status.user_id is not None:
+            response: Response = request.get(Api.Roblox.Activity.user(self.status.user_id), cached=True, dont_log_cached_request=True)
+            self.data["small_image"] = user_thumbnail_future.result(timeout=activity_api.RESULT_TIMEOUT)
             data = response.json()
             user_name: str = str(data['name'])
             display_name: str = str(data['displayName'])
             self.data["small_text"] = display_name if user_name == display_name else f"{display_name} ({user_name})"
 
-        if do_bloxstrap_rpc and self.Status.bloxstrap_rpc and self.Status.bloxstrap_rpc_content is not None:
-            command: dict | None = self.Status.bloxstrap_rpc_content.get("command")
-            bloxstrap_rpc_data: dict | None = self.Status.bloxstrap_rpc_content.get("data")
+        if do_bloxstrap_rpc and self.status.bloxstrap_rpc and self.status.bloxstrap_rpc_content is not None:
+            command: dict | None = self.status.bloxstrap_rpc_content.get("command")
+            bloxstrap_rpc_data: dict | None = self.status.bloxstrap_rpc_content.get("data")
 
             if command == "SetRichPresence" and bloxstrap_rpc_data is not None:
                 state: str | None = bloxstrap_rpc_data.get("state")
@@ -182,119 +248,30 @@ class LogReader:
         return self.data
 
 
-    def _read_latest_log(self) -> list[Entry]:
-        log_files: list[Path] = [
-            Directory.ROBLOX_LOGS / item.name
-            for item in Directory.ROBLOX_LOGS.iterdir()
-            if item.is_file() and self.mode in item.name
-        ]
-
-        filepath: Path = max(log_files, key=os.path.getmtime)
-
-        log_entry_pattern = r'(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d{3}Z.*?)(?=\d{4}-\d{2}-\d{2}T|$)'
-        with open(filepath, "r", encoding="utf-8", errors="replace") as file:
-            content: str = file.read()
-        
-        entries = re.findall(log_entry_pattern, content, re.DOTALL)
-        return [Entry(data) for data in reversed(entries)]
-
-
-    def _is_old_log(self, log: list[Entry]) -> bool:
-        if not log:
+    def _is_old_log(self) -> bool:
+        if self.last_entry is None:
             return True
 
-        entry: Entry = log[0]
+        entry: Entry = self.last_entry
+        prefix: str = entry.first_prefix
         match self.mode:
             case "Player":
-                return (entry.prefixes[0] == LogData.Player.OldlogFile.prefix and LogData.Player.OldlogFile.keyword in entry.message)
+                return (prefix == LogData.Player.OldlogFile.prefix and LogData.Player.OldlogFile.keyword in entry.message)
             case "Studio":
-                return (entry.prefixes[0] == LogData.Studio.OldLogFile.prefix and LogData.Studio.OldLogFile.keyword in entry.message)
-    
+                return (prefix == LogData.Studio.OldLogFile.prefix and LogData.Studio.OldLogFile.keyword in entry.message)
 
-    def _update_status(self, log: list[Entry]) -> None:
-        self.Status.default = False
-        self.Status.private_server = False
-        self.Status.bloxstrap_rpc = False
-        self.Status.reserved_server = False
 
-        match self.mode:
-            case "Player":
-                for entry in log:
-                    is_game_leave: bool = entry.prefixes[0] == LogData.Player.GameLeave.prefix and LogData.Player.GameLeave.keyword in entry.message
-                    is_game_join: bool = entry.prefixes[0] == LogData.Player.GameJoin.prefix and LogData.Player.GameJoin.keyword in entry.message
-                    is_game_join_loadtime: bool = entry.prefixes[0] == LogData.Player.GameJoinLoadTime.prefix and LogData.Player.GameJoinLoadTime.keyword in entry.message
-                    is_game_private_server: bool = entry.prefixes[0] == LogData.Player.GamePrivateServer.prefix and LogData.Player.GamePrivateServer.keyword in entry.message
-                    is_game_reserved_server: bool = entry.prefixes[0] == LogData.Player.GameReservedServer.prefix and LogData.Player.GameReservedServer.keyword in entry.message
-                    is_bloxstrap_rpc: bool = entry.prefixes[0] == LogData.Player.BloxstrapRPC.prefix and LogData.Player.BloxstrapRPC.bloxstrap_rpc_prefix in entry.prefixes
-
-                    if is_game_leave:
-                        self.Status.default = True
-                        return
-                    
-                    elif is_game_private_server:
-                        self.Status.private_server = True
-                    
-                    elif is_game_reserved_server:
-                        self.Status.reserved_server = True
-
-                    elif is_bloxstrap_rpc:
-                        try:
-                            self.Status.bloxstrap_rpc_content = json.loads(entry.message)
-                            self.Status.bloxstrap_rpc = True
-                        except Exception as e:
-                            from modules import Logger
-                            Logger.error(f"{type(e).__name__}: {e}")
-
-                    elif is_game_join_loadtime:
-                        data: dict = dict(
-                            item.removesuffix(",").split(":", 1)
-                            for item in entry.message.removeprefix("Report game_join_loadtime: ").split()
-                        )
-                        self.Status.user_id = data["userid"]
-                        self.Status.place_id = data["placeid"]
-                        self.Status.universe_id = data["universeid"]
-
-                    elif is_game_join:
-                        self.Status.timestamp = entry.timestamp
-                        pattern = r"game '([a-f0-9\-]+)' place (\d+)"
-                        match = re.search(pattern, entry.message)
-                        if match:
-                            self.Status.job_id = match.group(1)
-                            self.Status.place_id = match.group(2)
-                        else:
-                            self.Status.job_id = None
-                        
-                        if self.Status.place_id is not None:
-                            response: Response = request.get(Api.Roblox.Activity.universe_id(self.Status.place_id), cached=True, dont_log_cached_request=True)
-                            data = response.json()
-                            self.Status.universe_id = str(data["universeId"])
-                        return
-            
-            
-            case "Studio":
-                # TODO: Studio RPC
-                for entry in log:
-                    is_game_leave = entry.prefixes[0] == LogData.Studio.GameLeave.prefix and LogData.Studio.GameLeave.keyword in entry.message
-                    is_game_join = entry.prefixes[0] == LogData.Studio.GameJoin.prefix and LogData.Studio.GameJoin.keyword in entry.message
-                    is_bloxstrap_rpc = entry.prefixes[0] == LogData.Player.BloxstrapRPC.prefix and LogData.Player.BloxstrapRPC.bloxstrap_rpc_prefix in entry.prefixes
-
-                    if is_game_leave:
-                        self.Status.default = True
-                        return
-
-                    elif is_bloxstrap_rpc:
-                        try:
-                            self.Status.bloxstrap_rpc_content = json.loads(entry.message)
-                            self.Status.bloxstrap_rpc = True
-                        except Exception:
-                            continue
-                    
-                    elif is_game_join:
-                        self.Status.timestamp = entry.timestamp
-                        self.Status.place_id = entry.message.removeprefix("open place (identifier = ").removesuffix(") [start]")
-                        
-                        response = request.get(Api.Roblox.Activity.universe_id(self.Status.place_id), cached=True, dont_log_cached_request=True)
-                        data = response.json()
-                        self.Status.universe_id = str(data["universeId"])
-                        return
-        self.Status.default = True
\ No newline at end of file
+    def _reset_status(self) -> None:
+        self.last_entry = None
+        self.status = Status()
+
+
+    def _update_status(self, log: list[Entry]) -> None:
+        for entry in log:
+            event: Event | None = events.parse(entry, self.mode)
+            if event is not None:
+                self.status.apply(event)
+
+        # Only the universe of the current game is needed, not of every game in the log
+        if not self.status.default and self.status.universe_id is None and self.status.place_id is not None:
+            self.status.universe_id = activity_api.universe_ids.get(self.status.place_id)
@@ -0,0 +1,109 @@
+from typing import Literal
+from pathlib import Path
+import time
+import re
+import os
+
+from modules import Logger
+
+from .entry import Entry
+
+
+# Remembers the current log file and offset, so only new lines are read and parsed
+class LogTail:
+    CHUNK_SIZE: int = 1048576
+    ROTATION_CHECK_INTERVAL: float = 2
+    ENTRY_PATTERN: re.Pattern = re.compile(rb"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d{3}Z")
+
+    directory: Path
+    mode: Literal["Player", "Studio"]
+    filepath: Path | None
+    offset: int
+    buffer: bytes
+    last_rotation_check: float
+    rotated: bool
+
+
+    def __init__(self, directory: str | Path, mode: Literal["Player", "Studio"]) -> None:
+        self.directory = Path(directory)
+        self.mode = mode
+        self.filepath = None
+        self.offset = 0
+        self.buffer = b""
+        self.last_rotation_check = 0
+        self.rotated = False
+
+
+    # Returns the entries that were added since the last call, oldest first
+    # rotated is set if the entries came from a different file than the previous call
+    def read(self) -> list[Entry]:
+        self.rotated = False
+        self._check_rotation()
+        if self.filepath is None:
+            return []
+
+        try:
+            size: int = self.filepath.stat().st_size
+        except OSError:
+            self.last_rotation_check = 0
+            return []
+
+        if size < self.offset:
+            Logger.info(f"Log file was truncated: {self.filepath.name}", prefix="activity_watcher.LogTail.read()")
+            self._open(self.filepath)
+        if size == self.offset:
+            return []
+
+        chunks: list[bytes] = [self.buffer]
+        with open(self.filepath, "rb") as file:
+            file.seek(self.offset)
+            while chunk := file.read(self.CHUNK_SIZE):
+                chunks.append(chunk)
+                self.offset += len(chunk)
+        data: bytes = b"".join(chunks)
+
+        # The last line may still be written to, it is kept until it's complete
+        end: int = data.rfind(b"\n") + 1
+        self.buffer = data[end:]
+
+        entries: list[Entry] = []
+        for line in data[:end].splitlines():
+            if not self.ENTRY_PATTERN.match(line):
+                continue
+            try:
+                entries.append(Entry(line.decode("utf-8", errors="replace")))
+            except Exception:
+                continue
+        return entries
+
+
+    def _check_rotation(self) -> None:
+        now: float = time.monotonic()
+        if self.filepath is not None and now - self.last_rotation_check < self.ROTATION_CHECK_INTERVAL:
+            return
+        self.last_rotation_check = now
+
+        latest: os.DirEntry | None = None
+        latest_mtime: float = 0
+        try:
+            with os.scandir(self.directory) as iterator:
+                for item in iterator:
+                    if self.mode not in item.name or not item.is_file():
+                        continue
+                    mtime: float = item.stat().st_mtime
+                    if latest is None or mtime > latest_mtime:
+                        latest = item
+                        latest_mtime = mtime
+        except OSError:
+            return
+
+        if latest is not None and Path(latest.path) != self.filepath:
+            self._open(Path(latest.path))
+
+
+    def _open(self, filepath: Path) -> None:
+        Logger.info(f"Reading log file: {filepath.name}", prefix="activity_watcher.LogTail._open()")
+        self.filepath = filepath
+        self.offset = 0
+        self.buffer = b""
+        self.rotated = True
\ No newline at end of file
@@ -0,0 +1,209 @@
+from typing import Literal
+from pathlib import Path
+from threading import Event, Lock
+import platform
+import select
+import struct
+import time
+import os
+
+from modules import Logger
+
+
+# Blocks until a log file of the given mode changes, so the log reader doesn't have to poll
+# Used as a context manager, so the inotify file descriptor is closed when the watcher is no longer needed
+class LogWatcher:
+    directory: Path
+    mode: Literal["Player", "Studio"]
+    backend: "InotifyBackend | PollingBackend"
+    closed: bool
+    lock: Lock
+
+
+    def __init__(self, directory: str | Path, mode: Literal["Player", "Studio"]) -> None:
+        self.directory = Path(directory)
+        self.mode = mode
+        self.closed = False
+        self.lock = Lock()
+
+        if platform.system() == "Linux":
+            try:
+                self.backend = InotifyBackend(self.directory, mode)
+                return
+            except OSError as e:
+                Logger.warning(f"Failed to start inotify, falling back to polling! {type(e).__name__}: {e}", prefix="activity_watcher.LogWatcher.__init__()")
+        self.backend = PollingBackend(self.directory)
+
+
+    # Returns True if a log file changed or wake() was called, or False after timeout seconds without changes
+    def wait(self, filepath: Path | None, timeout: float) -> bool:
+        return self.backend.wait(filepath, timeout)
+
+
+    # Can be called from any thread (e.g. when Roblox exits), does nothing once the watcher is closed
+    def wake(self) -> None:
+        with self.lock:
+            if not self.closed:
+                self.backend.wake()
+
+
+    def close(self) -> None:
+        with self.lock:
+            if self.closed:
+                return
+            self.closed = True
+            self.backend.close()
+
+
+    def __enter__(self) -> "LogWatcher":
+        return self
+
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+
+class InotifyBackend:
+    IN_MODIFY: int = 0x00000002
+    IN_MOVED_TO: int = 0x00000080
+    IN_CREATE: int = 0x00000100
+    EVENT_HEADER: struct.Struct = struct.Struct("iIII")
+    BUFFER_SIZE: int = 65536
+
+    mode: str
+    fd: int
+    wake_fds: tuple[int, int]
+
+
+    def __init__(self, directory: Path, mode: str) -> None:
+        import ctypes
+        import ctypes.util
+
+        self.mode = mode
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+
+        self.fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), os.strerror(ctypes.get_errno()))
+
+        watch: int = libc.inotify_add_watch(self.fd, os.fsencode(directory), self.IN_MODIFY | self.IN_MOVED_TO | self.IN_CREATE)
+        if watch < 0:
+            errno: int = ctypes.get_errno()
+            os.close(self.fd)
+            raise OSError(errno, os.strerror(errno))
+
+        # wake() writes to this pipe, so select() returns without waiting for the timeout
+        self.wake_fds = os.pipe()
+        for fd in self.wake_fds:
+            os.set_blocking(fd, False)
+
+
+    def wait(self, filepath: Path | None, timeout: float) -> bool:
+        deadline: float = time.monotonic() + timeout
+        while True:
+            remaining: float = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+
+            readable, _, _ = select.select([self.fd, self.wake_fds[0]], [], [], remaining)
+            if self.wake_fds[0] in readable:
+                self._drain_wake_pipe()
+                return True
+            if readable and self._read_events():
+                return True
+
+
+    def wake(self) -> None:
+        try:
+            os.write(self.wake_fds[1], b"\0")
+        except BlockingIOError:
+            pass
+
+
+    def close(self) -> None:
+        for fd in (self.fd, *self.wake_fds):
+            os.close(fd)
+
+
+    def _drain_wake_pipe(self) -> None:
+        try:
+            while os.read(self.wake_fds[0], self.BUFFER_SIZE):
+                pass
+        except BlockingIOError:
+            pass
+
+
+    # Events of other files (e.g. logs of the other mode) are ignored
+    def _read_events(self) -> bool:
+        try:
+            data: bytes = os.read(self.fd, self.BUFFER_SIZE)
+        except BlockingIOError:
+            return False
+
+        changed: bool = False
+        offset: int = 0
+        while offset < len(data):
+            _, _, _, length = self.EVENT_HEADER.unpack_from(data, offset)
+            offset += self.EVENT_HEADER.size
+            name: str = data[offset:offset + length].rstrip(b"\0").decode("utf-8", errors="replace")
+            offset += length
+            if self.mode in name:
+                changed = True
+        return changed
+
+
+# Portable fallback, only the directory and the current log file are checked with stat()
+class PollingBackend:
+    INTERVAL: float = 0.25
+
+    directory: Path
+    snapshot: tuple[int, int] | None
+    woken: Event
+
+
+    def __init__(self, directory: Path) -> None:
+        self.directory = directory
+        self.snapshot = None
+        self.woken = Event()
+
+
+    def wait(self, filepath: Path | None, timeout: float) -> bool:
+        deadline: float = time.monotonic() + timeout
+        if self.snapshot is None:
+            self.snapshot = self._get_snapshot(filepath)
+
+        while True:
+            snapshot: tuple[int, int] = self._get_snapshot(filepath)
+            if snapshot != self.snapshot:
+                self.snapshot = snapshot
+                return True
+
+            remaining: float = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            if self.woken.wait(min(self.INTERVAL, remaining)):
+                self.woken.clear()
+                return True
+
+
+    def wake(self) -> None:
+        self.woken.set()
+
+
+    def close(self) -> None:
+        pass
+
+
+    # New log files change the mtime of the directory, new lines change the size of the file
+    def _get_snapshot(self, filepath: Path | None) -> tuple[int, int]:
+        try:
+            directory_mtime: int = self.directory.stat().st_mtime_ns
+        except OSError:
+            directory_mtime = 0
+
+        try:
+            size: int = filepath.stat().st_size if filepath is not None else 0
+        except OSError:
+            size = 0
+
+        return (directory_mtime, size)
\ No newline at end of file
@@ -0,0 +1,179 @@
+from threading import Thread, Condition
+import copy
+import time
+
+from modules import Logger
+
+from pypresence import Presence
+
+
+# Discord allows 5 presence updates per 20 seconds
+class TokenBucket:
+    capacity: float
+    rate: float
+    tokens: float
+    updated: float
+
+
+    def __init__(self, capacity: float, period: float) -> None:
+        self.capacity = capacity
+        self.rate = capacity / period
+        self.tokens = capacity
+        self.updated = time.monotonic()
+
+
+    # Returns the time to wait before a token is available, a token is only taken if no wait is needed
+    def take(self) -> float:
+        now: float = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0
+        return (1 - self.tokens) / self.rate
+
+
+# Presence updates are sent on a background thread, only the latest pending update is kept
+class PresenceScheduler:
+    UPDATE_LIMIT: int = 5
+    UPDATE_PERIOD: float = 20
+    COALESCE_DELAY: float = 0.5
+
+    client: Presence
+    bucket: TokenBucket
+    condition: Condition
+    thread: Thread | None
+
+    pending: dict | None
+    pending_since: float
+    last_sent: dict | None
+    exception: Exception | None
+    running: bool
+
+    sent: int
+    skipped: int
+    coalesced: int
+    dropped: int
+    rate_limited: int
+
+
+    def __init__(self, client: Presence) -> None:
+        self.client = client
+        self.bucket = TokenBucket(self.UPDATE_LIMIT, self.UPDATE_PERIOD)
+        self.condition = Condition()
+        self.thread = None
+        self.pending = None
+        self.pending_since = 0
+        self.last_sent = None
+        self.exception = None
+        self.running = False
+        self.sent = 0
+        self.skipped = 0
+        self.coalesced = 0
+        self.dropped = 0
+        self.rate_limited = 0
+
+
+    def start(self) -> None:
+        with self.condition:
+            if self.running:
+                return
+            self.running = True
+            self.exception = None
+        self.thread = Thread(target=self._run, daemon=True, name="activity_watcher-presence-scheduler")
+        self.thread.start()
+
+
+    def stop(self) -> None:
+        with self.condition:
+            self.running = False
+            if self.pending is not None:
+                self.dropped += 1
+                self.pending = None
+            self.condition.notify_all()
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+
+
+    # Updates that match the current presence are skipped, errors of the background thread are raised here
+    def submit(self, payload: dict) -> None:
+        with self.condition:
+            if self.exception is not None:
+                exception: Exception = self.exception
+                self.exception = None
+                raise exception
+
+            target: dict | None = self.pending if self.pending is not None else self.last_sent
+            if payload == target:
+                self.skipped += 1
+                return
+
+            if self.pending is not None:
+                self.coalesced += 1
+            else:
+                self.pending_since = time.monotonic()
+            self.pending = copy.deepcopy(payload)
+            self.condition.notify_all()
+
+
+    # The next update is always sent, e.g. after reconnecting
+    def reset(self) -> None:
+        with self.condition:
+            self.last_sent = None
+
+
+    def stats(self) -> dict[str, int]:
+        with self.condition:
+            return {
+                "sent": self.sent,
+                "skipped": self.skipped,
+                "coalesced": self.coalesced,
+                "dropped": self.dropped,
+                "rate_limited": self.rate_limited
+            }
+
+
+    def _run(self) -> None:
+        while True:
+            with self.condition:
+                while self.running and self.pending is None:
+                    self.condition.wait()
+                if not self.running:
+                    return
+
+                # The presence may have changed back before the update was sent
+                if self.pending == self.last_sent:
+                    self.pending = None
+                    self.skipped += 1
+                    continue
+
+                # Changes that follow each other quickly are combined into one update
+                delay: float = self.pending_since + self.COALESCE_DELAY - time.monotonic()
+                if delay > 0:
+                    self.condition.wait_for(lambda: not self.running, timeout=delay)
+                    continue
+
+                wait: float = self.bucket.take()
+                if wait > 0:
+                    self.rate_limited += 1
+                    # Newer updates may replace the pending one while waiting
+                    self.condition.wait_for(lambda: not self.running, timeout=wait)
+                    continue
+
+                payload: dict = self.pending
+                self.pending = None
+
+            try:
+                self.client.update(**payload)
+            except Exception as e:
+                Logger.error(f"Failed to update presence! {type(e).__name__}: {e}", prefix="activity_watcher.PresenceScheduler._run()")
+                with self.condition:
+                    self.exception = e
+                    self.running = False
+                return
+
+            with self.condition:
+                self.last_sent = payload
+                self.sent += 1
\ No newline at end of file
@@ -3,10 +3,13 @@ import time
 
 from modules import Logger
 from modules.config import integrations
-from modules.functions.process_exists import process_exists
+from modules.filesystem import Directory
+from modules.functions.process_monitor import process_monitor
 
 from .exceptions import RobloxNotLaunched
 from .log_reader import LogReader
+from .log_watcher import LogWatcher
+from .presence_scheduler import PresenceScheduler
 
 from pypresence import Presence, DiscordNotFound, PipeClosed
 
@@ -22,13 +25,15 @@ class RichPresenceClient:
             PLAYER: str = "roblox"
             STUDIO: str = "studio"
         COOLDOWN: float = 0.2
+        # Only the settings are checked on a timeout, the watcher is woken up when Roblox exits
+        IDLE_TIMEOUT: float = 1
         ROBLOX_LAUNCH_WAIT_TIME: float = 1 * 60
     
     mode: Literal["Player", "Studio"]
     client: Presence
     timestamp: float = 1
     log_reader: LogReader
-    last_status: dict | Literal["DEFAULT"] = {}
+    scheduler: PresenceScheduler
 
 
     def __init__(self, mode: Literal["Player", "Studio"]) -> None:
@@ -36,6 +41,7 @@ class RichPresenceClient:
         self.log_reader = LogReader(mode)
         Logger.info("Log reader is ready!", prefix="activity_watcher.RichPresenceClient.__init__()")
         self.client = Presence(self.Constants.CLIENT_ID)
+        self.scheduler = PresenceScheduler(self.client)
         Logger.info("Client is ready!", prefix="activity_watcher.RichPresenceClient.__init__()")
 
 
@@ -63,35 +69,60 @@ class RichPresenceClient:
                 self._confirm_roblox_launch()
             if self.timestamp == 1:
                 self.timestamp = time.time()
+            self.scheduler.reset()
+            self.scheduler.start()
             self._set_default_status()
-            while True:
-                if not integrations.get_value("discord_rpc"):
-                    Logger.warning("Discord RPC turned off!", prefix="activity_watcher.RichPresenceClient.mainloop()")
-                    break
-
-                if not process_exists(f"Roblox{self.mode}Beta.exe") and (not process_exists("eurotrucks2.exe") if self.mode == "Player" else True):
-                    Logger.info("Roblox process not found!", prefix="activity_watcher.RichPresenceClient.mainloop()")
-                    break
-
-                new_status: dict | None | Literal["DEFAULT"] = self.log_reader.get_status()
-                if new_status is None:
-                    Logger.info("Log reader returned None!", prefix="activity_watcher.RichPresenceClient.mainloop()")
-                    break
-                elif new_status is None:
-                    time.sleep(self.Constants.COOLDOWN)
-                    continue
-
-                if new_status == "DEFAULT":
-                    self._set_default_status()
-                
-                elif new_status != self.last_status:
-                    self.client.update(**new_status)
-                    self.last_status = new_status
-
-                time.sleep(self.Constants.COOLDOWN)
+            with LogWatcher(Directory.ROBLOX_LOGS, self.mode) as log_watcher:
+                self._wake_on_roblox_exit(log_watcher)
+                changed: bool = True
+                while True:
+                    if not integrations.get_value("discord_rpc"):
+                        Logger.warning("Discord RPC turned off!", prefix="activity_watcher.RichPresenceClient.mainloop()")
+                        break
+
+                    if not self._is_roblox_running():
+                        Logger.info("Roblox process not found!", prefix="activity_watcher.RichPresenceClient.mainloop()")
+                        break
+
+                    if changed:
+                        new_status: dict | None | Literal["DEFAULT"] = self.log_reader.get_status()
+                        if new_status is None:
+                            Logger.info("Log reader returned None!", prefix="activity_watcher.RichPresenceClient.mainloop()")
+                            break
+
+                        if new_status == "DEFAULT":
+                            self._set_default_status()
+
+                        else:
+                            self.scheduler.submit(new_status)
+
+                    # Wait for new log lines instead of polling, the timeout makes sure the settings are still checked
+                    changed = log_watcher.wait(self.log_reader.log_tail.filepath, self.Constants.IDLE_TIMEOUT)
+                    if changed:
+                        time.sleep(self.Constants.COOLDOWN)
         
         except PipeClosed:
+            self.scheduler.stop()
             self._on_pipe_closed()
+            return
+
+        self.scheduler.stop()
+        Logger.info(f"Presence updates: {self.scheduler.stats()}", prefix="activity_watcher.RichPresenceClient.mainloop()")
+
+
+    def _get_process_names(self) -> list[str]:
+        return [f"Roblox{self.mode}Beta.exe", "eurotrucks2.exe"] if self.mode == "Player" else [f"Roblox{self.mode}Beta.exe"]
+
+
+    def _is_roblox_running(self) -> bool:
+        return process_monitor.find_any(*self._get_process_names()) is not None
+
+
+    # The watcher is woken up as soon as Roblox exits, instead of noticing it after the next timeout
+    def _wake_on_roblox_exit(self, log_watcher: LogWatcher) -> None:
+        name: str | None = process_monitor.find_any(*self._get_process_names())
+        if name is not None:
+            process_monitor.wait_for_exit(name, log_watcher.wake)
     
 
     def _on_pipe_closed(self) -> None:
@@ -102,7 +133,7 @@ class RichPresenceClient:
 
 
     def _set_default_status(self) -> None:
-        self.client.update(
+        self.scheduler.submit(dict(
             start=self.timestamp,
             end=None,
             details=f"Roblox {self.mode}",
@@ -112,7 +143,7 @@ class RichPresenceClient:
             small_image=None,
             small_text=None,
             buttons=None
-        )
+        ))
     
 
     def _confirm_roblox_launch(self) -> None:
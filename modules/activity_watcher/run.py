@@ -7,7 +7,7 @@ from modules import Logger
 from modules.info import Help
 from modules.filesystem import Directory
 from modules.config import integrations
-from modules.functions.process_exists import process_exists
+from modules.functions.process_monitor import process_monitor
 
 from .rpc import RichPresenceClient, DiscordNotFound
 from .exceptions import RobloxNotLaunched
@@ -61,11 +61,10 @@ def run(mode: Optional[Literal["Player", "Studio"]] = None) -> None:
 
 def get_rpc_mode(attempts: int = 5) -> Literal["Player", "Studio"] | None:
     for _ in range(attempts):
-        if process_exists("RobloxPlayerBeta.exe"):
-            return "Player"
-        elif process_exists("eurotrucks2.exe"):
-            return "Player"
-        elif process_exists("RobloxStudioBeta.exe"):
-            return "Studio"
+        match process_monitor.find_any("RobloxPlayerBeta.exe", "eurotrucks2.exe", "RobloxStudioBeta.exe"):
+            case "RobloxPlayerBeta.exe" | "eurotrucks2.exe":
+                return "Player"
+            case "RobloxStudioBeta.exe":
+                return "Studio"
         time.sleep(1)
     return None
\ No newline at end of file
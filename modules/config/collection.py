@@ -0,0 +1,149 @@
+from contextlib import contextmanager
+from copy import deepcopy
+from typing import Any, Iterator
+
+from .store import ConfigStore
+
+
+# Items of a list config file, indexed by one of their fields so lookups don't scan the list
+class ConfigCollection:
+    store: ConfigStore
+    field: str
+
+    index: dict[Any, dict]
+    source: list[dict] | None
+    sorted_cache: dict[str, list[dict]]
+    version: int
+
+
+    def __init__(self, store: ConfigStore, field: str) -> None:
+        self.store = store
+        self.field = field
+        self.index = {}
+        self.source = None
+        self.sorted_cache = {}
+        self.version = 0
+
+
+    # The returned item is shared, use update() to change it
+    def get(self, key: Any) -> dict | None:
+        with self.store.lock:
+            return self._sync().get(key)
+
+
+    def __contains__(self, key: Any) -> bool:
+        return self.get(key) is not None
+
+
+    # Sorted lists are cached until the collection changes
+    def sorted_by(self, field: str, default: Any = 0) -> list[dict]:
+        with self.store.lock:
+            self._sync()
+            items: list[dict] | None = self.sorted_cache.get(field)
+            if items is None:
+                items = sorted(self.source, key=lambda item: item.get(field, default))
+                self.sorted_cache[field] = items
+            return items
+
+
+    # Increases whenever the collection may have changed, so derived data can be cached
+    def get_version(self) -> int:
+        with self.store.lock:
+            self._sync()
+            return self.version
+
+
+    # All changes made inside a transaction are saved with a single write
+    # If it raises, the store reads the file again and the index is rebuilt from that
+    @contextmanager
+    def transaction(self) -> Iterator["ConfigCollection"]:
+        with self.store.transaction():
+            self._sync()
+            yield self
+            self.sorted_cache.clear()
+            self.version += 1
+
+
+    # Changes are passed to the store, which applies them again if another process changed the file
+    def insert(self, item: dict, position: int | None = None) -> None:
+        key: Any = item.get(self.field)
+        snapshot: dict = deepcopy(item)
+
+        # The item may be changed later, the data is reapplied from a copy so those changes aren't included
+        def change(data: list[dict]) -> None:
+            new_item: dict = item if data is self.source else deepcopy(snapshot)
+            if position is None:
+                data.append(new_item)
+            else:
+                data.insert(position, new_item)
+
+        with self.transaction():
+            self.store.update(change)
+            existing: dict | None = self.index.get(key)
+            if existing is None:
+                self.index[key] = item
+            elif position is not None:
+                # The first item with a key is indexed, only duplicate keys need to compare positions
+                for entry in self.source:
+                    if entry is item:
+                        self.index[key] = item
+                        break
+                    if entry is existing:
+                        break
+
+
+    def update(self, key: Any, values: dict) -> None:
+        def change(data: list[dict]) -> None:
+            item: dict | None = self._find(data, key)
+            if item is None:
+                raise KeyError(key)
+            item.update(values)
+
+        with self.transaction():
+            self.store.update(change)
+
+
+    def remove(self, key: Any) -> None:
+        def change(data: list[dict]) -> None:
+            data[:] = [item for item in data if item.get(self.field) != key]
+
+        with self.transaction():
+            self.store.update(change)
+            self.index.pop(key, None)
+
+
+    def rename(self, key: Any, value: Any) -> None:
+        def change(data: list[dict]) -> None:
+            item: dict | None = self._find(data, key)
+            if item is None:
+                raise KeyError(key)
+            item[self.field] = value
+
+        with self.transaction():
+            self.store.update(change)
+            self.source = None
+
+
+    # The index is only used for the data in memory, other data (e.g. a newer version of the file) is searched
+    def _find(self, data: list[dict], key: Any) -> dict | None:
+        if data is self.source:
+            return self.index.get(key)
+        for item in data:
+            if isinstance(item, dict) and item.get(self.field) == key:
+                return item
+        return None
+
+
+    # The index is rebuilt when the file was reloaded or replaced
+    def _sync(self) -> dict[Any, dict]:
+        data: list[dict] = self.store.get()
+        if data is not self.source:
+            index: dict[Any, dict] = {}
+            for item in data:
+                if isinstance(item, dict):
+                    index.setdefault(item.get(self.field), item)
+            self.index = index
+            self.source = data
+            self.sorted_cache.clear()
+            self.version += 1
+        return self.index
\ No newline at end of file
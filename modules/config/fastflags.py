@@ -1,24 +1,71 @@
-import json
 from pathlib import Path
 from typing import Optional, Literal
 from copy import deepcopy
+import hashlib
+import json
 
 from modules.filesystem import File
 
+from .store import ConfigStore
+from .collection import ConfigCollection
+
 
 FILEPATH: Path = File.FASTFLAGS
 TEMPLATE: dict = {"description": None, "enabled": False, "enabled_studio": False, "data": {"ExampleFlag": "ExampleValue"}}
 
+store: ConfigStore = ConfigStore(FILEPATH, default=[], delete_if_empty=True)
+collection: ConfigCollection = ConfigCollection(store, "name")
+
+_snapshots: dict[str | None, tuple[int, str, "Snapshot"]] = {}
+
+
+# Merged flags of the enabled profiles, content is only serialized when it is written
+class Snapshot:
+    __slots__ = ("key", "data", "overrides", "_content", "_hash")
+
+    key: str
+    data: dict
+    overrides: dict[str, list[str]]
+
+
+    def __init__(self, key: str, data: dict, overrides: dict[str, list[str]]) -> None:
+        self.key = key
+        self.data = data
+        self.overrides = overrides
+        self._content: str | None = None
+        self._hash: str | None = None
+
+
+    @property
+    def content(self) -> str:
+        if self._content is None:
+            self._content = json.dumps(self.data, indent=4)
+        return self._content
+
+
+    @property
+    def hash(self) -> str:
+        if self._hash is None:
+            self._hash = hashlib.sha256(self.content.encode()).hexdigest()
+        return self._hash
+
 
 def get_active(mode: Optional[Literal["Player", "Studio"]] = None) -> dict:
-    data: list[dict] = read_file()
-
-    if not data:
-        return {}
-    
-    active_profiles: list[dict] = [
-        item.get("data")
-        for item in data
+    return dict(get_snapshot(mode).data)
+
+
+# Snapshots are only compiled again after a profile changed, or when the enabled profiles differ
+def get_snapshot(mode: Optional[Literal["Player", "Studio"]] = None, extra: dict | None = None) -> Snapshot:
+    version: int = collection.get_version()
+    extra_key: str = json.dumps(extra, sort_keys=True)
+
+    cached: tuple[int, str, Snapshot] | None = _snapshots.get(mode)
+    if cached is not None and cached[0] == version and cached[1] == extra_key:
+        return cached[2]
+
+    active_profiles: list[tuple[str, dict]] = [
+        (item.get("name"), item.get("data"))
+        for item in store.get()
         if isinstance(item.get("data"), dict) and item.get("data", {})
         and (
             item.get("enabled", False) if mode == "Player"
@@ -26,129 +73,80 @@ def get_active(mode: Optional[Literal["Player", "Studio"]] = None) -> dict:
             else (item.get("enabled", False) or item.get("enabled_studio", False))
         )
     ]
-    
-    active_fastflags: dict = {}
-    for profile in active_profiles:
-        active_fastflags.update(profile)
+    key: str = hashlib.sha256(json.dumps([mode, active_profiles, extra], sort_keys=True).encode()).hexdigest()
 
-    return active_fastflags
+    snapshot: Snapshot | None = cached[2] if cached is not None else None
+    if snapshot is None or snapshot.key != key:
+        snapshot = _compile(key, active_profiles, extra)
+    _snapshots[mode] = (version, extra_key, snapshot)
+    return snapshot
 
 
 def get_item(key: str) -> dict:
-    data: list[dict] = read_file()
-    
-    for item in data:
-        if item["name"] == key:
-            return item
-
-    raise KeyError(f"Profile not found: {key}")
+    item: dict | None = collection.get(key)
+    if item is None:
+        raise KeyError(f"Profile not found: {key}")
+    return deepcopy(item)
 
 
 def add_item(key: str, description: str | None = None, profile_data: dict = TEMPLATE["data"]) -> None:
-    data: list[dict] = read_file()
     new_item: dict = deepcopy(TEMPLATE)
     new_item["name"] = key
     new_item["description"] = description
-    new_item["data"] = profile_data
+    new_item["data"] = deepcopy(profile_data)
 
-    data.insert(0, new_item)
-    
-    with open(FILEPATH, "w") as file:
-        json.dump(data, file, indent=4)
+    collection.insert(new_item, 0)
 
 
 def remove_item(key: str) -> None:
-    data: list[dict] = read_file()
-    new_data: list[dict] = [item for item in data if item.get("name") != key]
-    
-    if not new_data:
-        if FILEPATH.is_file():
-            FILEPATH.unlink()
-        return
-    with open(FILEPATH, "w") as file:
-        json.dump(new_data, file, indent=4)
+    collection.remove(key)
 
 
 def set_name(key: str, value: str) -> None:
-    data: list[dict] = read_file()
-    
-    for i, item in enumerate(data):
-        if item.get("name") == key:
-            data[i]["name"] = value
-            break
-
-    else:
-        raise KeyError(f"FastFlag proflie not found in config file: {key}")
-
-    with open(FILEPATH, "w") as file:
-        json.dump(data, file, indent=4)
+    _check_profile(key)
+    collection.rename(key, value)
 
 
 def set_description(key: str, value: str | None) -> None:
-    data: list[dict] = read_file()
-    
-    for i, item in enumerate(data):
-        if item.get("name") == key:
-            data[i]["description"] = value
-            break
-
-    else:
-        raise KeyError(f"FastFlag proflie not found in config file: {key}")
-
-    with open(FILEPATH, "w") as file:
-        json.dump(data, file, indent=4)
+    _check_profile(key)
+    collection.update(key, {"description": value})
 
 
 def set_enabled(key: str, value: bool) -> None:
-    data: list[dict] = read_file()
-    
-    for i, item in enumerate(data):
-        if item.get("name") == key:
-            data[i]["enabled"] = value
-            break
-    
-    else:
-        raise KeyError(f"FastFlag proflie not found in config file: {key}")
-    
-    with open(FILEPATH, "w") as file:
-        json.dump(data, file, indent=4)
+    _check_profile(key)
+    collection.update(key, {"enabled": value})
 
 
 def set_enabled_studio(key: str, value: bool) -> None:
-    data: list[dict] = read_file()
-    
-    for i, item in enumerate(data):
-        if item.get("name") == key:
-            data[i]["enabled_studio"] = value
-            break
-    
-    else:
-        raise KeyError(f"FastFlag proflie not found in config file: {key}")
-    
-    with open(FILEPATH, "w") as file:
-        json.dump(data, file, indent=4)
+    _check_profile(key)
+    collection.update(key, {"enabled_studio": value})
 
 
 def set_data(key: str, value: dict) -> None:
-    data: list[dict] = read_file()
-    
-    for i, item in enumerate(data):
-        if item.get("name") == key:
-            data[i]["data"] = value
-            break
-
-    else:
+    _check_profile(key)
+    collection.update(key, {"data": deepcopy(value)})
+
+
+def read_file() -> list[dict]:
+    return store.copy()
+
+
+def _check_profile(key: str) -> None:
+    if key not in collection:
         raise KeyError(f"FastFlag proflie not found in config file: {key}")
 
-    with open(FILEPATH, "w") as file:
-        json.dump(data, file, indent=4)
 
+# Later profiles override earlier ones, overrides lists every profile that sets a flag in that order
+def _compile(key: str, active_profiles: list[tuple[str, dict]], extra: dict | None) -> Snapshot:
+    active_fastflags: dict = {}
+    owners: dict[str, str] = {}
+    overrides: dict[str, list[str]] = {}
+    for name, profile in active_profiles:
+        for flag in profile.keys() & owners.keys():
+            overrides.setdefault(flag, [owners[flag]]).append(name)
+        owners.update(dict.fromkeys(profile, name))
+        active_fastflags.update(profile)
+    if extra:
+        active_fastflags.update(extra)
 
-def read_file() -> list[dict]:
-    if not FILEPATH.is_file():
-        return []
-    
-    with open(FILEPATH, "r") as file:
-        data: list = json.load(file)
-    
-    return data
\ No newline at end of file
+    return Snapshot(key, active_fastflags, overrides)
\ No newline at end of file
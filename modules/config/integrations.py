@@ -1,51 +1,55 @@
 import sys
-import json
 from pathlib import Path
 from typing import Any
+from copy import deepcopy
 
 from modules.filesystem import File, restore_from_meipass
 
+from .store import ConfigStore
+
 
 FILEPATH: Path = File.INTEGRATIONS
 IS_FROZEN: bool = getattr(sys, "frozen", False)
 
 
+def _restore(filepath: Path) -> None:
+    if not IS_FROZEN:
+        raise FileNotFoundError(f"No such file or directory: {filepath}")
+    restore_from_meipass(filepath)
+
+
+store: ConfigStore = ConfigStore(FILEPATH, restore=_restore)
+
+
 def reset_all() -> None:
     restore_from_meipass(FILEPATH)
+    store.reload()
 
 
 def get_value(key: str) -> Any:
-    item: dict = get_item(key)
+    item: dict = _get_item(store.get(), key)
     return item["value"]
 
 
 def set_value(key: str, value: Any) -> None:
-    item: dict = get_item(key)
-    item["value"] = value
-    data: dict = read_file()
-    data[key] = item
+    def change(data: dict) -> None:
+        item: dict = _get_item(data, key)
+        item["value"] = value
 
-    with open(FILEPATH, "w") as file:
-        json.dump(data, file, indent=4)
+    store.update(change)
 
 
 def get_item(key: str) -> dict:
-    data: dict = read_file()
-    
+    return deepcopy(_get_item(store.get(), key))
+
+
+def read_file() -> dict:
+    return store.copy()
+
+
+def _get_item(data: dict, key: str) -> dict:
     try:
         return data[key]
 
     except KeyError:
-        raise KeyError(f"Integration not found: {key}")
-
-
-def read_file() -> dict:
-    if not FILEPATH.is_file():
-        if not IS_FROZEN:
-            raise FileNotFoundError(f"No such file or directory: {FILEPATH}")
-        restore_from_meipass(FILEPATH)
-    
-    with open(FILEPATH, "r") as file:
-        data: dict = json.load(file)
-    
-    return data
\ No newline at end of file
+        raise KeyError(f"Integration not found: {key}")
\ No newline at end of file
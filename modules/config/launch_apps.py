@@ -1,23 +1,25 @@
-import json
 from typing import Literal, Optional
 from pathlib import Path
 from copy import deepcopy
 
 from modules.filesystem import File
 
+from .store import ConfigStore
+from .collection import ConfigCollection
+
 
 FILEPATH: Path = File.LAUNCH_INTEGRATIONS
 TEMPLATE: dict = {"launch_args": None, "enabled": False, "enabled_studio": False}
 
+store: ConfigStore = ConfigStore(FILEPATH, default=[], delete_if_empty=True)
+collection: ConfigCollection = ConfigCollection(store, "filepath")
 
-def get_item(key: str) -> dict:
-    data: list[dict] = read_file()
-    
-    for item in data:
-        if item.get("filepath") == key:
-            return item
 
-    raise KeyError(f"App not found: {key}")
+def get_item(key: str) -> dict:
+    item: dict | None = collection.get(key)
+    if item is None:
+        raise KeyError(f"App not found: {key}")
+    return deepcopy(item)
 
 
 def get_active(mode: Optional[Literal["Player", "Studio"]] = None) -> list[dict]:
@@ -56,79 +58,36 @@ def get_active(mode: Optional[Literal["Player", "Studio"]] = None) -> list[dict]
 
 def add_item(filepath: str | Path) -> None:
     filepath = Path(filepath)
-    data: list[dict] = read_file()
     new_item: dict = deepcopy(TEMPLATE)
     # new_item["name"] = filepath.name
     new_item["filepath"] = str(filepath.resolve())
 
-    data.insert(0, new_item)
-    
-    with open(FILEPATH, "w") as file:
-        json.dump(data, file, indent=4)
+    collection.insert(new_item, 0)
 
 
 def remove_item(key: str) -> None:
-    data: list[dict] = read_file()
-    new_data: list[dict] = [item for item in data if item.get("filepath") != key]
-    
-    if not new_data:
-        if FILEPATH.is_file():
-            FILEPATH.unlink()
-        return
-    with open(FILEPATH, "w") as file:
-        json.dump(new_data, file, indent=4)
+    collection.remove(key)
 
 
 def set_enabled(key: str, value: bool) -> None:
-    data: list[dict] = read_file()
-    
-    for i, item in enumerate(data):
-        if item.get("filepath") == key:
-            data[i]["enabled"] = value
-            break
-    
-    else:
-        raise KeyError(f"App not found in config file: {key}")
-    
-    with open(FILEPATH, "w") as file:
-        json.dump(data, file, indent=4)
+    _check_app(key)
+    collection.update(key, {"enabled": value})
 
 
 def set_enabled_studio(key: str, value: bool) -> None:
-    data: list[dict] = read_file()
-    
-    for i, item in enumerate(data):
-        if item.get("filepath") == key:
-            data[i]["enabled_studio"] = value
-            break
-    
-    else:
-        raise KeyError(f"App not found in config file: {key}")
-    
-    with open(FILEPATH, "w") as file:
-        json.dump(data, file, indent=4)
+    _check_app(key)
+    collection.update(key, {"enabled_studio": value})
 
 
 def set_args(key: str, value: str | None) -> None:
-    data: list[dict] = read_file()
-    
-    for i, item in enumerate(data):
-        if item.get("filepath") == key:
-            data[i]["launch_args"] = value
-            break
+    _check_app(key)
+    collection.update(key, {"launch_args": value})
 
-    else:
-        raise KeyError(f"App not found in config file: {key}")
 
-    with open(FILEPATH, "w") as file:
-        json.dump(data, file, indent=4)
+def read_file() -> list[dict]:
+    return store.copy()
 
 
-def read_file() -> list[dict]:
-    if not FILEPATH.is_file():
-        return []
-    
-    with open(FILEPATH, "r") as file:
-        data: list[dict] = json.load(file)
-    
-    return data
\ No newline at end of file
+def _check_app(key: str) -> None:
+    if key not in collection:
+        raise KeyError(f"App not found in config file: {key}")
\ No newline at end of file
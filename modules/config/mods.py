@@ -1,17 +1,22 @@
-import json
 from copy import deepcopy
-from typing import Literal, Optional
+from typing import Any, Literal, Optional
 from pathlib import Path
 
 from modules.filesystem import File
 
+from .store import ConfigStore
+from .collection import ConfigCollection
+
 
 FILEPATH: Path = File.MODS
 TEMPLATE: dict = {"priority": 0, "enabled": False, "enabled_studio": False}
 
+store: ConfigStore = ConfigStore(FILEPATH, default=[], delete_if_empty=True)
+collection: ConfigCollection = ConfigCollection(store, "name")
+
 
 def get_active(mode: Optional[Literal["Player", "Studio"]] = None) -> list[str]:
-    data: list[dict] = read_file()
+    data: list[dict] = collection.sorted_by("priority")
 
     if not data:
         return []
@@ -19,7 +24,7 @@ def get_active(mode: Optional[Literal["Player", "Studio"]] = None) -> list[str]:
     if mode == "Player":
         active_mods: list[str] = [
             item.get("name")
-            for item in sorted(data, key=lambda item: item.get("priority", 0))
+            for item in data
             if item.get("enabled", False) is True
             and isinstance(item.get("name"), str)
         ]
@@ -27,7 +32,7 @@ def get_active(mode: Optional[Literal["Player", "Studio"]] = None) -> list[str]:
     elif mode == "Studio":
         active_mods = [
             item.get("name")
-            for item in sorted(data, key=lambda item: item.get("priority", 0))
+            for item in data
             if item.get("enabled_studio", False) is True
             and isinstance(item.get("name"), str)
         ]
@@ -35,7 +40,7 @@ def get_active(mode: Optional[Literal["Player", "Studio"]] = None) -> list[str]:
     else:
         active_mods = [
             item.get("name")
-            for item in sorted(data, key=lambda item: item.get("priority", 0))
+            for item in data
             if (item.get("enabled", False) is True or item.get("enabled_studio", False) is True)
             and isinstance(item.get("name"), str)
         ]
@@ -44,125 +49,61 @@ def get_active(mode: Optional[Literal["Player", "Studio"]] = None) -> list[str]:
 
 
 def get_item(key: str) -> dict:
-    data: list[dict] = read_file()
-    
-    for item in data:
-        if item.get("name") == key:
-            return item
-
-    raise KeyError(f"Profile not found: {key}")
+    item: dict | None = collection.get(key)
+    if item is None:
+        raise KeyError(f"Profile not found: {key}")
+    return deepcopy(item)
 
 
 def remove_item(key: str) -> None:
-    data: list[dict] = read_file()
-    new_data: list[dict] = [item for item in remove_default_values(data) if item.get("name") != key]
-    
-    if not new_data:
-        if FILEPATH.is_file():
-            FILEPATH.unlink()
-        return
-    with open(FILEPATH, "w") as file:
-        json.dump(new_data, file, indent=4)
+    with collection.transaction():
+        collection.remove(key)
+        _remove_default_items()
 
 
 def set_name(key: str, value: str) -> None:
-    data: list[dict] = read_file()
-    
-    for i, item in enumerate(data):
-        if item.get("name") == key:
-            data[i]["name"] = value
-            break
-    
-    else:
-        return
-    
-    new_data: list[dict] = remove_default_values(data)
-    
-    if not new_data:
-        if FILEPATH.is_file():
-            FILEPATH.unlink()
-        return
-    with open(FILEPATH, "w") as file:
-        json.dump(new_data, file, indent=4)
+    with collection.transaction():
+        if key not in collection:
+            return
+        collection.rename(key, value)
+        _remove_default_items()
 
 
 def set_priority(key: str, value: int) -> None:
-    data: list[dict] = read_file()
-    
-    for i, item in enumerate(data):
-        if item.get("name") == key:
-            data[i]["priority"] = value
-            break
-    
-    else:
-        new_item = deepcopy(TEMPLATE)
-        new_item["name"] = key
-        new_item["priority"] = value
-        data.append(new_item)
-    
-    new_data: list[dict] = remove_default_values(data)
-    
-    if not new_data:
-        if FILEPATH.is_file():
-            FILEPATH.unlink()
-        return
-    with open(FILEPATH, "w") as file:
-        json.dump(new_data, file, indent=4)
+    _set_value(key, "priority", value)
 
 
 def set_enabled(key: str, value: bool) -> None:
-    data: list[dict] = read_file()
-    
-    for i, item in enumerate(data):
-        if item.get("name") == key:
-            data[i]["enabled"] = value
-            break
-    
-    else:
-        new_item = deepcopy(TEMPLATE)
-        new_item["name"] = key
-        new_item["enabled"] = value
-        data.append(new_item)
-    
-    new_data: list[dict] = remove_default_values(data)
-    
-    if not new_data:
-        if FILEPATH.is_file():
-            FILEPATH.unlink()
-        return
-    with open(FILEPATH, "w") as file:
-        json.dump(new_data, file, indent=4)
+    _set_value(key, "enabled", value)
 
 
 def set_enabled_studio(key: str, value: bool) -> None:
-    data: list[dict] = read_file()
-    
-    for i, item in enumerate(data):
-        if item.get("name") == key:
-            data[i]["enabled_studio"] = value
-            break
-    
-    else:
-        new_item = deepcopy(TEMPLATE)
-        new_item["name"] = key
-        new_item["enabled_studio"] = value
-        data.append(new_item)
-    
-    new_data: list[dict] = remove_default_values(data)
-    with open(FILEPATH, "w") as file:
-        json.dump(new_data, file, indent=4)
+    _set_value(key, "enabled_studio", value)
 
 
 def read_file() -> list[dict]:
-    if not FILEPATH.is_file():
-        return []
-    
-    with open(FILEPATH, "r") as file:
-        data: list = json.load(file)
-
-    return data
+    return store.copy()
 
 
 def remove_default_values(data: list[dict]) -> list[dict]:
     new_data: list[dict] = [item for item in data if item.get("enabled", TEMPLATE["enabled"]) != TEMPLATE["enabled"] or item.get("enabled_studio", TEMPLATE["enabled_studio"]) != TEMPLATE["enabled_studio"] or item.get("priority", TEMPLATE["priority"]) != TEMPLATE["priority"]]
-    return new_data
\ No newline at end of file
+    return new_data
+
+
+# Mods without an item use the default values, items are removed again once all of their values are default
+def _set_value(key: str, field: str, value: Any) -> None:
+    with collection.transaction():
+        if key not in collection:
+            new_item: dict = deepcopy(TEMPLATE)
+            new_item["name"] = key
+            collection.insert(new_item)
+
+        collection.update(key, {field: value})
+        _remove_default_items()
+
+
+# Only called inside a transaction, removes every item that only has default values (not just the one that was changed)
+def _remove_default_items() -> None:
+    default_items: list[dict] = [item for item in store.get() if not remove_default_values([item])]
+    for item in default_items:
+        collection.remove(item.get("name"))
\ No newline at end of file
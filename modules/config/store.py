@@ -0,0 +1,405 @@
+from threading import RLock, Timer
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator
+from pathlib import Path
+from copy import deepcopy
+import atexit
+import marshal
+import shutil
+import json
+import time
+import os
+
+from modules import Logger
+from modules.filesystem import file_lock
+
+
+HISTORY_SIZE: int = 5
+
+
+# Config files are read once and kept in memory, changes are written shortly after in a single write
+class ConfigStore:
+    WRITE_DELAY: float = 0.5
+    CHECK_INTERVAL: float = 1
+    USE_BINARY_CACHE: bool = True
+
+    filepath: Path
+    default: Any
+    restore: Callable[[Path], None] | None
+    delete_if_empty: bool
+
+    data: Any
+    loaded: bool
+    signature: tuple[int, int] | None
+    last_check: float
+    timer: Timer | None
+    dirty: bool
+    pending: list[Callable[[Any], Any]]
+    changes: list[Callable[[Any], Any]] | None
+    lock: RLock
+
+
+    def __init__(self, filepath: Path, default: Any = None, restore: Callable[[Path], None] | None = None, delete_if_empty: bool = False) -> None:
+        self.filepath = filepath
+        self.default = default
+        self.restore = restore
+        self.delete_if_empty = delete_if_empty
+        self.data = None
+        self.loaded = False
+        self.signature = None
+        self.last_check = 0
+        self.timer = None
+        self.dirty = False
+        self.pending = []
+        self.changes = None
+        self.lock = RLock()
+        _stores.append(self)
+
+
+    # Restores the given previous version, 1 is the version before the last write
+    def rollback(self, steps: int = 1) -> bool:
+        with self.lock:
+            history: list[Path] = get_history(self.filepath)
+            if len(history) < steps:
+                return False
+            self.set(_read_json(history[steps - 1], self._get_type()))
+            self.flush()
+            return not self.dirty
+
+
+    # The returned data is shared, use update() to change it
+    def get(self) -> Any:
+        with self.lock:
+            if not self.loaded or (not self.dirty and self.changes is None and self._is_changed()):
+                self._load()
+            return self.data
+
+
+    def copy(self) -> Any:
+        return deepcopy(self.get())
+
+
+    # The data is copied, so changes made to it afterwards aren't applied again when the file is merged
+    def set(self, data: Any) -> None:
+        snapshot: Any = deepcopy(data)
+        self.update(lambda _: deepcopy(snapshot))
+
+
+    # Changes are applied right away and kept until they are written, so they can be applied again
+    # on top of the file if another process changed it in the meantime
+    # A change gets the data and either modifies it or returns the data that replaces it
+    def update(self, change: Callable[[Any], Any]) -> None:
+        with self.lock:
+            data: Any = self.get()
+            try:
+                result: Any = change(data)
+            except Exception:
+                self._revert()
+                raise
+
+            if result is not None:
+                self.data = result
+            if self.changes is not None:
+                self.changes.append(change)
+                return
+            self.pending.append(change)
+            self._schedule_write()
+
+
+    # Changes made inside a transaction are only kept if it completes, they are saved with a single write
+    @contextmanager
+    def transaction(self) -> Iterator[Any]:
+        with self.lock:
+            if self.changes is not None:
+                yield self.get()
+                return
+
+            self.changes = []
+            try:
+                yield self.get()
+            except BaseException:
+                self.changes = None
+                self._revert()
+                raise
+
+            changes: list[Callable[[Any], Any]] = self.changes
+            self.changes = None
+            if changes:
+                self.pending.extend(changes)
+                self._schedule_write()
+
+
+    def reload(self) -> None:
+        with self.lock:
+            self.dirty = False
+            self.pending = []
+            self._cancel_timer()
+            self._load()
+
+
+    def flush(self) -> None:
+        with self.lock:
+            self._cancel_timer()
+            if not self.dirty:
+                return
+            self._write()
+
+
+    # The file is only checked with stat() once per CHECK_INTERVAL
+    def _is_changed(self) -> bool:
+        now: float = time.monotonic()
+        if now - self.last_check < self.CHECK_INTERVAL:
+            return False
+        self.last_check = now
+        return self._get_signature() != self.signature
+
+
+    def _get_signature(self) -> tuple[int, int] | None:
+        try:
+            stat: os.stat_result = self.filepath.stat()
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+
+    # Files are replaced atomically, so reading doesn't need the lock
+    def _load(self) -> None:
+        if not self.filepath.is_file():
+            if self.restore is None:
+                self.data = deepcopy(self.default)
+                self.loaded = True
+                self.signature = None
+                return
+            self.restore(self.filepath)
+
+        signature: tuple[int, int] | None = self._get_signature()
+        try:
+            self.data = self._read_cache(signature)
+            if self.data is None:
+                self.data = _read_json(self.filepath, self._get_type())
+                self._write_cache(signature)
+        except ValueError as e:
+            Logger.warning(f"{self.filepath.name} is corrupt! {type(e).__name__}: {e}", prefix="config.ConfigStore._load()")
+            self._recover()
+            # Compared in _write(), so the corrupt file is replaced without being kept in the history
+            signature = None if self.dirty else self._get_signature()
+        self.loaded = True
+        self.signature = signature
+        self.last_check = time.monotonic()
+
+
+    # The JSON file stays the source of truth, the cache is only used if it was made from the same version of it
+    def _read_cache(self, signature: tuple[int, int] | None) -> Any:
+        if not self.USE_BINARY_CACHE or signature is None:
+            return None
+
+        try:
+            with open(_get_cache_path(self.filepath), "rb") as file:
+                header, data = marshal.loads(file.read())
+        except (OSError, EOFError, ValueError, TypeError):
+            return None
+
+        if header != (marshal.version, *signature) or not isinstance(data, self._get_type()):
+            return None
+        return data
+
+
+    def _write_cache(self, signature: tuple[int, int] | None) -> None:
+        if not self.USE_BINARY_CACHE or signature is None:
+            return
+
+        target: Path = _get_cache_path(self.filepath)
+        temp: Path = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+        try:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            with open(temp, "wb") as file:
+                file.write(marshal.dumps(((marshal.version, *signature), self.data)))
+            os.replace(temp, target)
+
+        except (OSError, ValueError) as e:
+            Logger.warning(f"Failed to write cache of {self.filepath.name}! {type(e).__name__}: {e}", prefix="config.ConfigStore._write_cache()")
+            temp.unlink(missing_ok=True)
+
+
+    # The newest valid previous version is used, the original file is only restored if there is none
+    def _recover(self) -> None:
+        for path in get_history(self.filepath):
+            try:
+                self.data = _read_json(path, self._get_type())
+            except (OSError, ValueError):
+                continue
+            Logger.warning(f"Restoring {self.filepath.name} from {path.name}", prefix="config.ConfigStore._recover()")
+            self._schedule_write()
+            return
+
+        if self.restore is None:
+            self.data = deepcopy(self.default)
+            self._schedule_write()
+            return
+        self.restore(self.filepath)
+        self.data = _read_json(self.filepath, self._get_type())
+
+
+    # The file is read again and the changes that weren't written yet are applied to it
+    def _revert(self) -> None:
+        self._load()
+        self.data = self._apply(self.data, self.pending + (self.changes or []))
+
+
+    # Changes that no longer apply (e.g. the item was removed by another process) are skipped
+    def _apply(self, data: Any, changes: list[Callable[[Any], Any]]) -> Any:
+        for change in changes:
+            try:
+                result: Any = change(data)
+            except Exception as e:
+                Logger.warning(f"Failed to apply change to {self.filepath.name}! {type(e).__name__}: {e}", prefix="config.ConfigStore._apply()")
+                continue
+            if result is not None:
+                data = result
+        return data
+
+
+    # Settings are stored as a dict, other config files as a list (see default)
+    def _get_type(self) -> type:
+        return type(self.default) if self.default is not None else dict
+
+
+    def _schedule_write(self) -> None:
+        self.dirty = True
+        if self.timer is not None:
+            return
+        self.timer = Timer(self.WRITE_DELAY, self.flush)
+        self.timer.daemon = True
+        self.timer.start()
+
+
+    def _cancel_timer(self) -> None:
+        if self.timer is not None:
+            self.timer.cancel()
+            self.timer = None
+
+
+    # The whole read-modify-write happens under the lock, so changes of other processes (e.g. the menu and the launcher) are not lost
+    def _write(self) -> None:
+        try:
+            with file_lock(_get_lock_path(self.filepath)):
+                is_valid: bool = self._merge() if self._get_signature() != self.signature else True
+
+                if self.delete_if_empty and not self.data:
+                    if self.filepath.is_file():
+                        if is_valid:
+                            _add_to_history(self.filepath, move=True)
+                        else:
+                            self.filepath.unlink()
+                    self.signature = None
+
+                else:
+                    _replace(self.filepath, self.data, is_valid)
+                    self.signature = self._get_signature()
+
+            self.dirty = False
+            self.pending = []
+            self._write_cache(self.signature)
+
+        except Exception as e:
+            Logger.error(f"Failed to write {self.filepath.name}! {type(e).__name__}: {e}", prefix="config.ConfigStore._write()")
+
+
+    # Only called with the lock held, a file that can't be read is replaced with the data in memory
+    # Returns False if the file on disk is corrupt
+    def _merge(self) -> bool:
+        if self.filepath.is_file():
+            try:
+                data: Any = _read_json(self.filepath, self._get_type())
+            except (OSError, ValueError) as e:
+                Logger.warning(f"Failed to read {self.filepath.name}, overwriting it! {type(e).__name__}: {e}", prefix="config.ConfigStore._merge()")
+                return False
+        elif self.restore is None:
+            data = deepcopy(self.default)
+        else:
+            return True
+
+        Logger.info(f"{self.filepath.name} was changed by another process, applying {len(self.pending)} change(s) to it", prefix="config.ConfigStore._merge()")
+        self.data = self._apply(data, self.pending)
+        return True
+
+
+_stores: list[ConfigStore] = []
+
+
+# Used for config files that are written without a store, e.g. during startup
+def write_json(filepath: Path, data: Any) -> None:
+    with file_lock(_get_lock_path(filepath)):
+        _replace(filepath, data)
+
+
+# Previous versions of a config file, newest first
+def get_history(filepath: Path) -> list[Path]:
+    directory: Path = _get_history_directory(filepath)
+    if not directory.is_dir():
+        return []
+    prefix: str = f"{filepath.stem}."
+    return sorted((path for path in directory.iterdir() if path.name.startswith(prefix) and path.suffix == filepath.suffix), key=lambda path: path.name, reverse=True)
+
+
+def _get_lock_path(filepath: Path) -> Path:
+    return filepath.parent / ".lock"
+
+
+def _get_history_directory(filepath: Path) -> Path:
+    return filepath.parent / "history"
+
+
+def _get_cache_path(filepath: Path) -> Path:
+    return filepath.parent / "cache" / f"{filepath.name}.marshal"
+
+
+def _read_json(filepath: Path, data_type: type) -> Any:
+    with open(filepath, "r") as file:
+        data: Any = json.load(file)
+    if not isinstance(data, data_type):
+        raise ValueError(f"Expected {data_type.__name__}, got {type(data).__name__}")
+    return data
+
+
+# The new content is written to a temporary file first, the current file is kept in the history
+# The file is never truncated, a crash leaves either the old or the new version
+def _replace(filepath: Path, data: Any, keep_history: bool = True) -> None:
+    temp: Path = filepath.with_name(f"{filepath.name}.tmp")
+    try:
+        filepath.parent.mkdir(parents=True, exist_ok=True)
+        with open(temp, "w") as file:
+            json.dump(data, file, indent=4)
+        if keep_history and filepath.is_file():
+            _add_to_history(filepath)
+        os.replace(temp, filepath)
+
+    finally:
+        temp.unlink(missing_ok=True)
+
+
+# Versions are hardlinked instead of copied, the file itself is replaced and not modified in place
+def _add_to_history(filepath: Path, move: bool = False) -> None:
+    directory: Path = _get_history_directory(filepath)
+    directory.mkdir(parents=True, exist_ok=True)
+    target: Path = directory / f"{filepath.stem}.{time.time_ns()}{filepath.suffix}"
+
+    if move:
+        os.replace(filepath, target)
+    else:
+        try:
+            os.link(filepath, target)
+        except OSError:
+            shutil.copy2(filepath, target)
+
+    for path in get_history(filepath)[HISTORY_SIZE:]:
+        path.unlink(missing_ok=True)
+
+
+@atexit.register
+def flush_all() -> None:
+    for store in _stores:
+        try:
+            store.flush()
+        except Exception:
+            continue
\ No newline at end of file
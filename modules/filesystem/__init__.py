@@ -1,7 +1,10 @@
 from .directories import Directory
 from .files import File
 from .restore import restore_from_meipass
-from .extract import extract
+from .extract import extract, extract_member, get_member_path
 from .compress import compress
 from .open import open
-from .download import download
\ No newline at end of file
+from .download import download
+from .checksum import md5
+from .link import link, break_link
+from .lock import file_lock
\ No newline at end of file
@@ -0,0 +1,18 @@
+from pathlib import Path
+import hashlib
+
+
+CHUNK_SIZE: int = 1048576
+
+
+def md5(path: str | Path) -> str:
+    return md5_digest(path).hexdigest()
+
+
+# The hash object can be updated further, e.g. to continue the hash of a partial download
+def md5_digest(path: str | Path) -> "hashlib._Hash":
+    digest = hashlib.md5()
+    with open(path, "rb") as file:
+        while chunk := file.read(CHUNK_SIZE):
+            digest.update(chunk)
+    return digest
\ No newline at end of file
@@ -7,6 +7,8 @@ class Directory:
     INSTALLER: Path = ROOT / "Installer"
     UNINSTALLER: Path = ROOT / "Uninstaller"
     DOWNLOADS: Path = ROOT / "Downloads"
+    PACKAGE_CACHE: Path = DOWNLOADS / "PackageCache"
+    CACHE: Path = ROOT / "Cache"
     CONFIG: Path = ROOT / "config"
     RESOURCES: Path = ROOT / "resources"
     VERSIONS: Path = ROOT / "Versions"
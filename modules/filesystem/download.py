@@ -1,42 +1,140 @@
 from pathlib import Path
+from typing import Callable, Optional
+from threading import Event
+from urllib.error import HTTPError
 import urllib.request
+import hashlib
+import random
 import os
 import time
 
 from modules import Logger
 
-from .exceptions import FileDownloadError
+from .exceptions import FileDownloadError, FileDownloadCancelledError
+from .checksum import md5_digest
 
 
 COOLDOWN: float = 2
+MAX_COOLDOWN: float = 30
+CHUNK_SIZE: int = 65536
+TIMEOUT: float = 15
+PROGRESS_INTERVAL: float = 0.5
 
 
-def download(source: str, destination: str | Path, attempts: int = 3) -> None:
+def download(source: str, destination: str | Path, attempts: int = 3, chunk_callback: Optional[Callable[[int], None]] = None, cancel_event: Optional[Event] = None, md5: Optional[str] = None, size: Optional[int] = None, progress_callback: Optional[Callable[[int, Optional[int], float, Optional[float]], None]] = None) -> None:
     destination = Path(destination)
     temp: Path = destination.with_suffix(".tmp")
     exception: Exception | None = None
+    failed_attempts: int = 0
 
-    for _ in range(attempts):
+    # Attempts that made progress are not counted, so a flaky connection can keep resuming the same file
+    while failed_attempts < attempts:
+        resumed_from: int = temp.stat().st_size if temp.is_file() else 0
         try:
-            Logger.info(f"Downloading file: {source}", prefix="filesystem.download()")
+            Logger.info(f"Downloading file: {source}" + (f" (resuming from {resumed_from} bytes)" if resumed_from else ""), prefix="filesystem.download()")
             destination.parent.mkdir(parents=True, exist_ok=True)
-            
+
             if not os.access(destination.parent, os.W_OK):
                 raise FileDownloadError(f"Write permissions denied for {destination.parent}")
 
-            try:
-                urllib.request.urlretrieve(source, temp)
-                os.replace(temp, destination)
-                return
-            except Exception as e:
-                if temp.is_file():
-                    temp.unlink()
-                raise
+            digest: str | None = _stream_to_file(source, temp, chunk_callback, cancel_event, size, progress_callback, md5 is not None)
+            _validate(source, temp, md5, digest, size)
+            os.replace(temp, destination)
+            return
+
+        except FileDownloadCancelledError:
+            Logger.warning(f"File download cancelled: {source}", prefix="filesystem.download()")
+            raise
 
         except Exception as e:
             Logger.error(f"File download failed! {type(e).__name__}: {e}", prefix="filesystem.download()")
             exception = e
-            time.sleep(COOLDOWN)
-    
+            if not temp.is_file() or temp.stat().st_size <= resumed_from:
+                failed_attempts += 1
+
+            cooldown: float = min(MAX_COOLDOWN, COOLDOWN * 2 ** max(0, failed_attempts - 1)) + random.uniform(0, COOLDOWN)
+            if cancel_event is None:
+                time.sleep(cooldown)
+            elif cancel_event.wait(cooldown):
+                raise FileDownloadCancelledError(f"File download cancelled: {source}")
+
     if exception is not None:
-        raise exception
\ No newline at end of file
+        raise exception
+
+
+def _stream_to_file(source: str, target: Path, chunk_callback: Optional[Callable[[int], None]], cancel_event: Optional[Event], size: Optional[int], progress_callback: Optional[Callable[[int, Optional[int], float, Optional[float]], None]], compute_md5: bool) -> str | None:
+    offset: int = target.stat().st_size if target.is_file() else 0
+    if size is not None and offset >= size:
+        if offset > size:
+            target.unlink()
+            raise FileDownloadError(f"Partial file is larger than expected ({offset} > {size} bytes)")
+        return md5_digest(target).hexdigest() if compute_md5 else None
+
+    request: urllib.request.Request = urllib.request.Request(source)
+    if offset:
+        request.add_header("Range", f"bytes={offset}-")
+
+    try:
+        response = urllib.request.urlopen(request, timeout=TIMEOUT)
+    except HTTPError as e:
+        # The server refused the range, start over on the next attempt
+        if e.code == 416:
+            target.unlink(missing_ok=True)
+        raise
+
+    with response:
+        if offset and response.status != 206:
+            offset = 0
+
+        # The hash of a resumed download includes the bytes that were already on disk
+        digest = (md5_digest(target) if offset else hashlib.md5()) if compute_md5 else None
+
+        total: int | None = size
+        if total is None:
+            content_length: str | None = response.headers.get("Content-Length")
+            total = offset + int(content_length) if content_length is not None else None
+
+        downloaded: int = offset
+        start: float = time.monotonic()
+        last_progress: float = 0
+
+        with open(target, "ab" if offset else "wb") as file:
+            while True:
+                if cancel_event is not None and cancel_event.is_set():
+                    raise FileDownloadCancelledError(f"File download cancelled: {source}")
+
+                chunk: bytes = response.read(CHUNK_SIZE)
+                if not chunk:
+                    break
+
+                file.write(chunk)
+                downloaded += len(chunk)
+                if digest is not None:
+                    digest.update(chunk)
+                if chunk_callback is not None:
+                    chunk_callback(len(chunk))
+
+                if progress_callback is not None:
+                    now: float = time.monotonic()
+                    if now - last_progress >= PROGRESS_INTERVAL:
+                        last_progress = now
+                        rate: float = (downloaded - offset) / max(now - start, 1e-6)
+                        eta: float | None = (total - downloaded) / rate if total is not None and rate > 0 else None
+                        progress_callback(downloaded, total, rate, eta)
+
+    if total is not None and downloaded < total:
+        raise FileDownloadError(f"Connection closed after {downloaded} of {total} bytes")
+
+    return digest.hexdigest() if digest is not None else None
+
+
+def _validate(source: str, target: Path, md5: Optional[str], digest: Optional[str], size: Optional[int]) -> None:
+    if size is not None:
+        actual_size: int = target.stat().st_size
+        if actual_size != size:
+            target.unlink()
+            raise FileDownloadError(f"Size mismatch for {source}! Expected {size} bytes, got {actual_size} bytes")
+
+    if md5 is not None and (digest is None or digest.lower() != md5.lower()):
+        target.unlink()
+        raise FileDownloadError(f"MD5 mismatch for {source}! Expected {md5}, got {digest}")
\ No newline at end of file
@@ -8,4 +8,7 @@ class FileCompressError(Exception):
     pass
 
 class FileDownloadError(Exception):
+    pass
+
+class FileDownloadCancelledError(FileDownloadError):
     pass
\ No newline at end of file
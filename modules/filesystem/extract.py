@@ -1,5 +1,6 @@
 import os
-from zipfile import ZipFile
+import shutil
+from zipfile import ZipFile, ZipInfo
 from pathlib import Path
 
 from modules import Logger
@@ -9,6 +10,9 @@ from .exceptions import FileExtractError
 # from py7zr import SevenZipFile
 
 
+CHUNK_SIZE: int = 1048576
+
+
 def extract(source: str | Path, destination: str | Path, ignore_filetype: bool = False) -> None:
     source = Path(source)
     destination = Path(destination)
@@ -39,4 +43,26 @@ def extract(source: str | Path, destination: str | Path, ignore_filetype: bool =
         #         archive.extractall(destination)
 
         case _:
-            raise FileExtractError(f"Unsupported file format: {source.name}")
\ No newline at end of file
+            raise FileExtractError(f"Unsupported file format: {source.name}")
+
+
+# Member names may be absolute or contain "..", they are sanitized like ZipFile.extract() does so the path stays inside the destination
+# Roblox packages use backslashes as separators
+def get_member_path(destination: str | Path, filename: str) -> Path:
+    name: str = os.path.splitdrive(filename.replace("\\", "/"))[1]
+    return Path(destination, *(part for part in name.split("/") if part not in ("", ".", "..")))
+
+
+# The member is written to a temporary file first and then replaces the target
+# A target that is hardlinked (e.g. to a mod or the package cache) is replaced instead of written through
+def extract_member(archive: ZipFile, info: ZipInfo, path: str | Path) -> Path:
+    path = Path(path)
+    temp: Path = path.with_name(f"{path.name}.tmp")
+    try:
+        with archive.open(info) as source, open(temp, "wb") as file:
+            shutil.copyfileobj(source, file, CHUNK_SIZE)
+        os.replace(temp, path)
+
+    finally:
+        temp.unlink(missing_ok=True)
+    return path
\ No newline at end of file
@@ -0,0 +1,75 @@
+from pathlib import Path
+from typing import Literal
+import platform
+import shutil
+import os
+
+from modules import Logger
+
+
+FICLONE: int = 0x40049409
+_same_device_cache: dict[tuple[int, int], bool] = {}
+_reflink_supported: bool = True
+
+
+# Tries a reflink first, then a hardlink, then falls back to a normal copy
+def link(source: str | Path, destination: str | Path) -> Literal["reflink", "hardlink", "copy"]:
+    source = Path(source)
+    destination = Path(destination)
+    destination.parent.mkdir(parents=True, exist_ok=True)
+
+    if _is_same_device(source.parent, destination.parent):
+        destination.unlink(missing_ok=True)
+
+        if _reflink(source, destination):
+            return "reflink"
+
+        try:
+            os.link(source, destination)
+            return "hardlink"
+        except OSError as e:
+            Logger.debug(f"Failed to create hardlink, falling back to copy! {type(e).__name__}: {e}", prefix="filesystem.link()")
+
+    destination.unlink(missing_ok=True)
+    shutil.copy2(source, destination)
+    return "copy"
+
+
+# Replaces a hardlinked file with an independent copy, so writing to it won't change the other links
+def break_link(path: str | Path) -> None:
+    path = Path(path)
+    if not path.is_file() or path.stat().st_nlink <= 1:
+        return
+
+    temp: Path = path.with_name(f"{path.name}.tmp")
+    shutil.copy2(path, temp)
+    os.replace(temp, path)
+
+
+def _is_same_device(source: Path, destination: Path) -> bool:
+    key: tuple[int, int] = (source.stat().st_dev, destination.stat().st_dev)
+    if key not in _same_device_cache:
+        _same_device_cache[key] = key[0] == key[1]
+        if not _same_device_cache[key]:
+            Logger.info(f"{source} and {destination} are on different filesystems, files will be copied", prefix="filesystem.link()")
+    return _same_device_cache[key]
+
+
+# Copy-on-write clones are only attempted on Linux (FICLONE), they don't share writes with the source
+def _reflink(source: Path, destination: Path) -> bool:
+    global _reflink_supported
+    if not _reflink_supported or platform.system() != "Linux":
+        return False
+
+    import fcntl
+
+    try:
+        with open(source, "rb") as source_file, open(destination, "wb") as destination_file:
+            fcntl.ioctl(destination_file.fileno(), FICLONE, source_file.fileno())
+        shutil.copystat(source, destination)
+        return True
+
+    except OSError:
+        _reflink_supported = False
+        destination.unlink(missing_ok=True)
+        return False
\ No newline at end of file
@@ -0,0 +1,49 @@
+from contextlib import contextmanager
+from typing import Iterator
+from pathlib import Path
+import platform
+import errno
+import os
+
+if platform.system() == "Windows":
+    import msvcrt
+else:
+    import fcntl
+
+
+# Advisory lock between processes (e.g. the menu and the launcher), blocks until the lock is free
+@contextmanager
+def file_lock(path: str | Path) -> Iterator[None]:
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd: int = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+
+    try:
+        if platform.system() == "Windows":
+            _lock_windows(fd)
+        else:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+
+        try:
+            yield
+
+        finally:
+            if platform.system() == "Windows":
+                os.lseek(fd, 0, os.SEEK_SET)
+                msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+            else:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+
+    finally:
+        os.close(fd)
+
+
+# LK_LOCK only retries for about 10 seconds before it raises, keep trying so the lock blocks like flock()
+def _lock_windows(fd: int) -> None:
+    while True:
+        try:
+            msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+            return
+        except OSError as e:
+            if e.errno != errno.EDEADLOCK:
+                raise
\ No newline at end of file
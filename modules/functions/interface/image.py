@@ -45,6 +45,10 @@ def load(light: str | Path, dark: str | Path | None = None, size: tuple[int, int
         return ""
 
 
+def is_loaded_from_url(url: str, size: tuple[int, int]) -> bool:
+    return f"{url}-{size}" in _image_cache
+
+
 def load_from_url(url: str, size: tuple[int, int]) -> CTkImage | Literal[""]:
     key: str = f"{url}-{size}"
     cached_image = _image_cache.get(key)
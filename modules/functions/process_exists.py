@@ -1,18 +0,0 @@
-import psutil
-from psutil import NoSuchProcess
-
-
-class ProcessCheckError(Exception):
-    pass
-
-
-def process_exists(process: str) -> bool:
-    for p in psutil.process_iter():
-        try:
-            if p.name() == process:
-                return True
-
-        except NoSuchProcess:
-            continue
-
-    return False
\ No newline at end of file
@@ -0,0 +1,81 @@
+from threading import Lock, Thread
+from typing import Callable
+
+import psutil
+from psutil import NoSuchProcess, AccessDenied
+
+
+# Processes are looked up by name once, after that only their handle (PID + creation time) is checked
+class ProcessMonitor:
+    handles: dict[str, psutil.Process]
+    lock: Lock
+
+
+    def __init__(self) -> None:
+        self.handles = {}
+        self.lock = Lock()
+
+
+    def get(self, name: str) -> psutil.Process | None:
+        return self.find(name).get(name)
+
+
+    # Names without a running handle are resolved with a single scan
+    # Only found processes are kept, a process that just started is found by the next call
+    def find(self, *names: str) -> dict[str, psutil.Process]:
+        with self.lock:
+            found: dict[str, psutil.Process] = {}
+            missing: set[str] = set()
+            for name in names:
+                handle: psutil.Process | None = self.handles.get(name)
+                if handle is not None and handle.is_running():
+                    found[name] = handle
+                    continue
+                self.handles.pop(name, None)
+                missing.add(name)
+
+            if not missing:
+                return found
+
+            for process in psutil.process_iter(["name"]):
+                name = process.info["name"]
+                if name in missing and name not in found:
+                    found[name] = process
+                    self.handles[name] = process
+            return found
+
+
+    def is_running(self, name: str) -> bool:
+        return self.get(name) is not None
+
+
+    # Returns the name of the first given process that is running
+    def find_any(self, *names: str) -> str | None:
+        found: dict[str, psutil.Process] = self.find(*names)
+        for name in names:
+            if name in found:
+                return name
+        return None
+
+
+    # Calls callback on a background thread once the process exits, returns False if it isn't running
+    def wait_for_exit(self, name: str, callback: Callable[[], None]) -> bool:
+        handle: psutil.Process | None = self.get(name)
+        if handle is None:
+            return False
+
+        def wait() -> None:
+            try:
+                handle.wait()
+            except (NoSuchProcess, AccessDenied):
+                pass
+            with self.lock:
+                if self.handles.get(name) is handle:
+                    del self.handles[name]
+            callback()
+
+        Thread(target=wait, daemon=True, name=f"process-monitor-{name}").start()
+        return True
+
+
+process_monitor: ProcessMonitor = ProcessMonitor()
\ No newline at end of file
@@ -0,0 +1,109 @@
+from pathlib import Path
+from threading import Lock
+import json
+import time
+import os
+
+from modules import Logger
+from modules import request
+from modules.request import Response
+from modules.filesystem import Directory
+
+
+class DeploymentCache:
+    FILENAME: str = "deployment_cache.json"
+
+    # Time in seconds before a cached response is revalidated
+    CHANNEL_TTL: float = 86400
+    VERSION_TTL: float = 300
+    FILEMAP_TTL: float = 3600
+    MANIFEST_TTL: float = float("inf")  # Manifests never change for a version
+    MAX_AGE: float = 30 * 86400
+
+    directory: Path
+    filepath: Path
+    data: dict[str, dict]
+    lock: Lock
+
+
+    def __init__(self, directory: str | Path = Directory.CACHE) -> None:
+        self.directory = Path(directory)
+        self.filepath = self.directory / self.FILENAME
+        self.lock = Lock()
+        self.data = self._read_file()
+
+
+    # Returns the cached response if it is still fresh, otherwise it is revalidated with its ETag
+    # The cached response is used if the request fails, so the launcher still works offline
+    def get(self, url: str, ttl: float) -> str:
+        with self.lock:
+            entry: dict | None = self.data.get(url)
+
+        if entry is not None and time.time() - entry["fetched"] < ttl:
+            Logger.info(f"Cached deployment info: {url}", prefix="launcher.DeploymentCache.get()")
+            return entry["text"]
+
+        headers: dict[str, str] = {}
+        if entry is not None and entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+
+        # Only try once if there is a fallback, so going offline doesn't slow down launches
+        try:
+            response: Response = request.get(url, attempts=1 if entry is not None else 3, headers=headers)
+
+        except Exception as e:
+            if entry is None:
+                raise
+            Logger.warning(f"Failed to get deployment info, using last known value! {type(e).__name__}: {e}", prefix="launcher.DeploymentCache.get()")
+            return entry["text"]
+
+        if response.status_code == 304 and entry is not None:
+            text: str = entry["text"]
+        else:
+            text = response.text
+
+        with self.lock:
+            etag: str | None = response.headers.get("ETag") or (entry.get("etag") if entry is not None else None)
+            self.data[url] = {"text": text, "etag": etag, "fetched": time.time()}
+        return text
+
+
+    def delete(self) -> None:
+        with self.lock:
+            self.data = {}
+        self.filepath.unlink(missing_ok=True)
+
+
+    # Responses that weren't fetched in MAX_AGE are removed, e.g. manifests of old versions
+    def save(self) -> None:
+        temp: Path = self.filepath.with_name(f"{self.FILENAME}.{os.getpid()}.tmp")
+        now: float = time.time()
+        with self.lock:
+            data: dict[str, dict] = {key: value for key, value in self.data.items() if now - value["fetched"] < self.MAX_AGE}
+
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            with open(temp, "w") as file:
+                json.dump(data, file)
+            os.replace(temp, self.filepath)
+
+        except Exception as e:
+            Logger.warning(f"Failed to save deployment cache! {type(e).__name__}: {e}", prefix="launcher.DeploymentCache.save()")
+            if temp.is_file():
+                temp.unlink()
+
+
+    def _read_file(self) -> dict[str, dict]:
+        if not self.filepath.is_file():
+            return {}
+
+        try:
+            with open(self.filepath, "r") as file:
+                data: dict = json.load(file)
+            if not isinstance(data, dict):
+                raise TypeError(f"Expected dict, got {type(data).__name__}")
+            return data
+
+        except Exception as e:
+            Logger.warning(f"Failed to read deployment cache! {type(e).__name__}: {e}", prefix="launcher.DeploymentCache._read_file()")
+            return {}
\ No newline at end of file
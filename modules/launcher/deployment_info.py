@@ -1,10 +1,12 @@
 from typing import Literal
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, Future
+import json
 
-from modules import request
-from modules.request import Api, Response
+from modules.request import Api
 from modules.filesystem.directories import Directory
-from modules.functions.roblox import user_channel
+
+from .deployment_cache import DeploymentCache
 
 
 class Deployment:
@@ -35,33 +37,41 @@ class Deployment:
         self.binaryType = f"WindowsStudio64" if mode == "Studio" else f"WindowsPlayer"
         self.executable_name = f"Roblox{mode}Beta.exe"
 
-        self.channel = user_channel.get(self.binaryType)
-        self.version, self.git_hash = self._get_version_info(self.binaryType, self.channel)
-        self.base_directory = Directory.VERSIONS / self.version
-        self.executable_path = self.base_directory / self.executable_name
-        self.app_settings_path = self.base_directory / "AppSettings.xml"
+        cache: DeploymentCache = DeploymentCache()
+
+        # The filemap doesn't depend on the version, so it is fetched while the version is being resolved
+        with ThreadPoolExecutor(max_workers=2, thread_name_prefix="launcher.Deployment") as executor:
+            filemap_future: Future[dict] = executor.submit(self._get_filemap, cache)
+
+            self.channel = self._get_channel(self.binaryType, cache)
+            self.version, self.git_hash = self._get_version_info(self.binaryType, self.channel, cache)
+            self.base_directory = Directory.VERSIONS / self.version
+            self.executable_path = self.base_directory / self.executable_name
+            self.app_settings_path = self.base_directory / "AppSettings.xml"
+
+            manifest_future: Future[str] = executor.submit(cache.get, Api.Roblox.Deployment.manifest(self.version), cache.MANIFEST_TTL)
+            self.filemap = filemap_future.result()
+            self.manifest_version, self.package_manifest = self._get_files(manifest_future.result())
+
+        cache.save()
+
 
-        self.filemap = self._get_filemap()
-        self.manifest_version, self.package_manifest = self._get_files(self.version)
+    def _get_channel(self, binaryType: str, cache: DeploymentCache) -> str:
+        data: dict = json.loads(cache.get(Api.Roblox.Deployment.channel(binaryType), cache.CHANNEL_TTL))
+        return data["channelName"]
 
 
-    def _get_version_info(self, binaryType: str, channel: str) -> tuple[str,str]:
-        if channel is None:
-            channel = user_channel.get(binaryType)
-        response: Response = request.get(Api.Roblox.Deployment.latest(binaryType, channel), cached=True)
-        data: dict = response.json()
+    def _get_version_info(self, binaryType: str, channel: str, cache: DeploymentCache) -> tuple[str,str]:
+        data: dict = json.loads(cache.get(Api.Roblox.Deployment.latest(binaryType, channel), cache.VERSION_TTL))
         return (data["clientVersionUpload"], data["version"])
 
 
-    def _get_filemap(self) -> dict:
-        response: Response = request.get(Api.GitHub.FILEMAP, cached=True)
-        data: dict = response.json()
+    def _get_filemap(self, cache: DeploymentCache) -> dict:
+        data: dict = json.loads(cache.get(Api.GitHub.FILEMAP, cache.FILEMAP_TTL))
         return data
 
 
-    def _get_files(self, version: str) -> tuple[str, list[dict]]:
-        response: Response = request.get(Api.Roblox.Deployment.manifest(version), cached=True)
-        text: str = response.text
+    def _get_files(self, text: str) -> tuple[str, list[dict]]:
         lines: list[str] = text.splitlines()
 
         manifest_version: str = lines[0]
@@ -0,0 +1,88 @@
+from pathlib import Path
+from threading import Lock
+import json
+import os
+
+from modules import Logger
+
+
+class DownloadIndex:
+    FILENAME: str = "index.json"
+
+    directory: Path
+    filepath: Path
+    data: dict[str, dict]
+    lock: Lock
+
+
+    def __init__(self, directory: str | Path) -> None:
+        self.directory = Path(directory)
+        self.filepath = self.directory / self.FILENAME
+        self.lock = Lock()
+        self.data = self._read_file()
+
+
+    def is_verified(self, hash: str) -> bool:
+        entry: dict | None = self.data.get(hash)
+        if entry is None or not entry.get("verified", False):
+            return False
+
+        try:
+            stat: os.stat_result = (self.directory / hash).stat()
+        except OSError:
+            return False
+
+        return entry.get("size") == stat.st_size and entry.get("mtime") == stat.st_mtime_ns
+
+
+    def set_verified(self, hash: str, verified: bool = True) -> None:
+        stat: os.stat_result = (self.directory / hash).stat()
+        with self.lock:
+            self.data[hash] = {
+                "size": stat.st_size,
+                "mtime": stat.st_mtime_ns,
+                "verified": verified
+            }
+
+
+    def remove(self, hash: str) -> None:
+        with self.lock:
+            self.data.pop(hash, None)
+
+
+    def prune(self, hashes: list[str]) -> None:
+        with self.lock:
+            self.data = {key: value for key, value in self.data.items() if key in hashes}
+
+
+    def save(self) -> None:
+        temp: Path = self.filepath.with_name(f"{self.FILENAME}.{os.getpid()}.tmp")
+        with self.lock:
+            data: dict[str, dict] = dict(self.data)
+
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            with open(temp, "w") as file:
+                json.dump(data, file, indent=4)
+            os.replace(temp, self.filepath)
+
+        except Exception as e:
+            Logger.warning(f"Failed to save download index! {type(e).__name__}: {e}", prefix="launcher.DownloadIndex.save()")
+            if temp.is_file():
+                temp.unlink()
+
+
+    def _read_file(self) -> dict[str, dict]:
+        if not self.filepath.is_file():
+            return {}
+
+        try:
+            with open(self.filepath, "r") as file:
+                data: dict = json.load(file)
+            if not isinstance(data, dict):
+                raise TypeError(f"Expected dict, got {type(data).__name__}")
+            return data
+
+        except Exception as e:
+            Logger.warning(f"Failed to read download index! {type(e).__name__}: {e}", prefix="launcher.DownloadIndex._read_file()")
+            return {}
\ No newline at end of file
@@ -0,0 +1,188 @@
+from pathlib import Path
+from typing import Iterable, Optional
+from threading import Lock
+from zipfile import ZipFile
+import shutil
+import json
+import zlib
+import os
+
+from modules import Logger
+from modules.filesystem import extract_member, get_member_path
+
+
+class InstallState:
+    FILENAME: str = "install_state.json"
+    VERSION: int = 1
+    CHUNK_SIZE: int = 1048576
+    # Written by the fastflags task and by Roblox itself, never removed
+    IGNORED_DIRECTORIES: tuple[str, ...] = ("ClientSettings/",)
+
+    directory: Path
+    filepath: Path
+    packages: dict[str, dict]
+    files: dict[str, dict]
+    lock: Lock
+
+
+    def __init__(self, directory: str | Path, load: bool = True) -> None:
+        self.directory = Path(directory)
+        self.filepath = self.directory / self.FILENAME
+        self.packages = {}
+        self.files = {}
+        self.lock = Lock()
+        if load:
+            self._read_file()
+
+
+    def is_empty(self) -> bool:
+        return not self.packages
+
+
+    def add_package(self, hash: str, file: str, target: str | Path) -> None:
+        with self.lock:
+            self.packages[hash] = {"file": file, "target": self._key(Path(target))}
+
+
+    def record(self, path: str | Path, package_hash: str, crc: int | None = None) -> None:
+        path = Path(path)
+        stat: os.stat_result = path.stat()
+        if crc is None:
+            crc = self._crc32(path)
+
+        with self.lock:
+            self.files[self._key(path)] = {
+                "package": package_hash,
+                "size": stat.st_size,
+                "mtime": stat.st_mtime_ns,
+                "crc": crc
+            }
+
+
+    # Delete every file that came from a package which is no longer part of the manifest
+    def remove_package(self, hash: str) -> None:
+        Logger.info(f"Removing files of old package: {self.packages.get(hash, {}).get('file', hash)}", prefix="launcher.InstallState.remove_package()")
+        with self.lock:
+            self.packages.pop(hash, None)
+            keys: list[str] = [key for key, entry in self.files.items() if entry["package"] == hash]
+            for key in keys:
+                del self.files[key]
+                (self.directory / key).unlink(missing_ok=True)
+
+
+    # Restore individual files from the downloaded packages they came from
+    def restore_files(self, keys: list[str], package_directory: Path) -> None:
+        grouped_keys: dict[str, set[str]] = {}
+        for key in keys:
+            grouped_keys.setdefault(self.files[key]["package"], set()).add(key)
+
+        for hash, package_keys in grouped_keys.items():
+            package: dict = self.packages[hash]
+            source: Path = package_directory / hash
+            target: Path = self.directory / package.get("target", "")
+
+            if not package["file"].endswith(".zip"):
+                for key in package_keys:
+                    (self.directory / key).unlink(missing_ok=True)
+                    self.record(shutil.copy(source, target), hash)
+                continue
+
+            with ZipFile(source, "r") as archive:
+                for info in archive.infolist():
+                    path: Path = get_member_path(target, info.filename)
+                    if info.is_dir() or self._key(path) not in package_keys:
+                        continue
+
+                    path.parent.mkdir(parents=True, exist_ok=True)
+                    self.record(extract_member(archive, info, path), hash, info.CRC)
+
+
+    # Files are compared by size and mtime first, the CRC is only checked if the mtime changed
+    def get_modified_files(self, ignore: Optional[set[str]] = None) -> dict[str, set[str]]:
+        modified: dict[str, set[str]] = {}
+
+        for key, entry in self.files.items():
+            if ignore is not None and key in ignore:
+                continue
+
+            path: Path = self.directory / key
+            try:
+                stat: os.stat_result = path.stat()
+            except OSError:
+                modified.setdefault(entry["package"], set()).add(key)
+                continue
+
+            if stat.st_size != entry["size"]:
+                modified.setdefault(entry["package"], set()).add(key)
+
+            elif stat.st_mtime_ns != entry["mtime"]:
+                if self._crc32(path) != entry["crc"]:
+                    modified.setdefault(entry["package"], set()).add(key)
+                else:
+                    entry["mtime"] = stat.st_mtime_ns
+
+        return modified
+
+
+    # Remove files that were added by mods, only the given files are removed (e.g. the files recorded in the mod overlay)
+    # Other files that aren't part of a package were created by Roblox or the fastflags task and are left alone
+    def remove_untracked_files(self, keys: Iterable[str]) -> None:
+        for key in keys:
+            if key in self.files or key.startswith(self.IGNORED_DIRECTORIES):
+                continue
+
+            path: Path = self.directory / key
+            if path.is_file():
+                Logger.info(f"Removing untracked file: {key}", prefix="launcher.InstallState.remove_untracked_files()")
+                path.unlink(missing_ok=True)
+
+
+    def save(self) -> None:
+        temp: Path = self.filepath.with_suffix(".tmp")
+        with self.lock:
+            data: dict = {"version": self.VERSION, "packages": dict(self.packages), "files": dict(self.files)}
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        with open(temp, "w") as file:
+            json.dump(data, file)
+        os.replace(temp, self.filepath)
+
+
+    # Without an install state, every file is restored on the next launch
+    def delete(self) -> None:
+        with self.lock:
+            self.packages = {}
+            self.files = {}
+        self.filepath.unlink(missing_ok=True)
+
+
+    def _key(self, path: Path) -> str:
+        return path.relative_to(self.directory).as_posix()
+
+
+    def _crc32(self, path: Path) -> int:
+        crc: int = 0
+        with open(path, "rb") as file:
+            while chunk := file.read(self.CHUNK_SIZE):
+                crc = zlib.crc32(chunk, crc)
+        return crc
+
+
+    def _read_file(self) -> None:
+        if not self.filepath.is_file():
+            return
+
+        try:
+            with open(self.filepath, "r") as file:
+                data: dict = json.load(file)
+
+            if data.get("version") != self.VERSION:
+                raise ValueError(f"Unsupported install state version: {data.get('version')}")
+
+            self.packages = data["packages"]
+            self.files = data["files"]
+
+        except Exception as e:
+            Logger.warning(f"Failed to read install state! {type(e).__name__}: {e}", prefix="launcher.InstallState._read_file()")
+            self.packages = {}
+            self.files = {}
\ No newline at end of file
@@ -0,0 +1,104 @@
+from pathlib import Path
+import json
+import os
+
+from modules import Logger
+
+
+class ModOverlay:
+    FILENAME: str = "mod_overlay.json"
+    VERSION: int = 1
+
+    directory: Path
+    filepath: Path
+    files: dict[str, dict]
+
+
+    def __init__(self, directory: str | Path, load: bool = True) -> None:
+        self.directory = Path(directory)
+        self.filepath = self.directory / self.FILENAME
+        self.files = {}
+        if load:
+            self._read_file()
+
+
+    def is_applied(self, key: str, mod: str, source: Path) -> bool:
+        entry: dict | None = self.files.get(key)
+        if entry is None or entry["mod"] != mod:
+            return False
+
+        try:
+            source_stat: os.stat_result = source.stat()
+            target_stat: os.stat_result = (self.directory / key).stat()
+        except OSError:
+            return False
+
+        return (
+            entry["source_size"] == source_stat.st_size and entry["source_mtime"] == source_stat.st_mtime_ns
+            and entry["size"] == target_stat.st_size and entry["mtime"] == target_stat.st_mtime_ns
+        )
+
+
+    def set_applied(self, key: str, mod: str, source: Path, package: str | None) -> None:
+        source_stat: os.stat_result = source.stat()
+        target_stat: os.stat_result = (self.directory / key).stat()
+        self.files[key] = {
+            "mod": mod,
+            "package": package,
+            "source_size": source_stat.st_size,
+            "source_mtime": source_stat.st_mtime_ns,
+            "size": target_stat.st_size,
+            "mtime": target_stat.st_mtime_ns
+        }
+
+
+    def remove(self, key: str) -> None:
+        self.files.pop(key, None)
+
+
+    # Overlay files that haven't been changed since they were applied
+    def get_intact_files(self) -> set[str]:
+        intact_files: set[str] = set()
+        for key, entry in self.files.items():
+            try:
+                stat: os.stat_result = (self.directory / key).stat()
+            except OSError:
+                continue
+            if stat.st_size == entry["size"] and stat.st_mtime_ns == entry["mtime"]:
+                intact_files.add(key)
+        return intact_files
+
+
+    def save(self) -> None:
+        if not self.files:
+            self.delete()
+            return
+
+        temp: Path = self.filepath.with_suffix(".tmp")
+        self.directory.mkdir(parents=True, exist_ok=True)
+        with open(temp, "w") as file:
+            json.dump({"version": self.VERSION, "files": self.files}, file)
+        os.replace(temp, self.filepath)
+
+
+    def delete(self) -> None:
+        self.files = {}
+        self.filepath.unlink(missing_ok=True)
+
+
+    def _read_file(self) -> None:
+        if not self.filepath.is_file():
+            return
+
+        try:
+            with open(self.filepath, "r") as file:
+                data: dict = json.load(file)
+
+            if data.get("version") != self.VERSION:
+                raise ValueError(f"Unsupported mod overlay version: {data.get('version')}")
+
+            self.files = data["files"]
+
+        except Exception as e:
+            Logger.warning(f"Failed to read mod overlay! {type(e).__name__}: {e}", prefix="launcher.ModOverlay._read_file()")
+            self.files = {}
\ No newline at end of file
@@ -0,0 +1,178 @@
+from pathlib import Path
+from threading import Lock
+from zipfile import ZipFile
+import shutil
+import json
+import time
+import os
+
+from modules import Logger
+from modules.filesystem import Directory, file_lock, extract_member, get_member_path
+
+
+class PackageCache:
+    INDEX_FILENAME: str = "index.json"
+    LOCK_FILENAME: str = ".lock"
+    MAX_SIZE: int = 8 * 1073741824  # 8 GB
+    # Unknown entries may still be added by another process (e.g. Player and Studio launching at the same time)
+    GRACE_PERIOD: float = 3600
+
+    directory: Path
+    index_filepath: Path
+    lock_filepath: Path
+    index: dict[str, dict]
+    lock: Lock
+
+
+    def __init__(self, directory: str | Path = Directory.PACKAGE_CACHE) -> None:
+        self.directory = Path(directory)
+        self.index_filepath = self.directory / self.INDEX_FILENAME
+        self.lock_filepath = self.directory / self.LOCK_FILENAME
+        self.lock = Lock()
+        self.index = self._read_index()
+
+
+    # Returns the folder with the extracted files of a package, the package is only extracted if it isn't cached yet
+    # Folders are only created by renaming a completely extracted temporary folder, so an existing folder is always complete
+    def get(self, hash: str, source: Path) -> Path:
+        target: Path = self.directory / hash
+
+        with self.lock:
+            entry: dict | None = self.index.get(hash)
+            if target.is_dir():
+                if entry is None:
+                    entry = self.index[hash] = {"size": self._get_size(source)}
+                entry["last_used"] = time.time()
+                return target
+
+        Logger.info(f"Adding package to cache: {hash}", prefix="launcher.PackageCache.get()")
+        temp: Path = self.directory / f"{hash}.{os.getpid()}.tmp"
+        shutil.rmtree(temp, ignore_errors=True)
+        temp.mkdir(parents=True, exist_ok=True)
+
+        # Members are extracted to the same paths that restore_package() uses, backslashes are separators on every platform
+        try:
+            size: int = 0
+            with ZipFile(source, "r") as archive:
+                for info in archive.infolist():
+                    if info.is_dir():
+                        continue
+                    path: Path = get_member_path(temp, info.filename)
+                    path.parent.mkdir(parents=True, exist_ok=True)
+                    extract_member(archive, info, path)
+                    size += info.file_size
+            try:
+                os.replace(temp, target)
+            except OSError:
+                # Another process added the same package in the meantime
+                if not target.is_dir():
+                    raise
+
+        finally:
+            shutil.rmtree(temp, ignore_errors=True)
+
+        with self.lock:
+            self.index[hash] = {"size": size, "last_used": time.time()}
+        return target
+
+
+    # Remove the least recently used packages until the cache fits in MAX_SIZE, packages in keep are never removed
+    def collect_garbage(self, keep: set[str], max_size: int = MAX_SIZE) -> None:
+        if not self.directory.is_dir():
+            return
+
+        with file_lock(self.lock_filepath), self.lock:
+            self.index = self._merge_index()
+
+            now: float = time.time()
+            for path in self.directory.iterdir():
+                if path in (self.index_filepath, self.lock_filepath) or path.name in self.index:
+                    continue
+
+                # Recent entries may be packages that are still being extracted (<hash>.<pid>.tmp) or that weren't saved to the index yet
+                # Temporary folders that are older were left behind by a process that crashed
+                try:
+                    if now - path.stat().st_mtime < self.GRACE_PERIOD:
+                        continue
+                except OSError:
+                    continue
+
+                Logger.info(f"Removing unknown cache entry: {path.name}", prefix="launcher.PackageCache.collect_garbage()")
+                self._remove(path)
+
+            total_size: int = sum(entry["size"] for entry in self.index.values())
+            for hash, entry in sorted(self.index.items(), key=lambda item: item[1]["last_used"]):
+                if total_size <= max_size:
+                    break
+                if hash in keep:
+                    continue
+
+                Logger.info(f"Removing package from cache: {hash}", prefix="launcher.PackageCache.collect_garbage()")
+                self._remove(self.directory / hash)
+                del self.index[hash]
+                total_size -= entry["size"]
+
+            self._write_index(self.index)
+
+
+    # The index on disk is merged first, so entries added by other processes are kept
+    def save(self) -> None:
+        if not self.index and not self.directory.is_dir():
+            return
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        with file_lock(self.lock_filepath), self.lock:
+            self.index = self._merge_index()
+            self._write_index(self.index)
+
+
+    # Only called with both locks held, entries of removed folders (e.g. by another process) are dropped
+    def _merge_index(self) -> dict[str, dict]:
+        index: dict[str, dict] = self._read_index()
+        for hash, entry in self.index.items():
+            existing: dict | None = index.get(hash)
+            if existing is None or existing.get("last_used", 0) < entry["last_used"]:
+                index[hash] = entry
+        return {hash: entry for hash, entry in index.items() if (self.directory / hash).is_dir()}
+
+
+    def _write_index(self, data: dict[str, dict]) -> None:
+        temp: Path = self.index_filepath.with_name(f"{self.INDEX_FILENAME}.{os.getpid()}.tmp")
+        with open(temp, "w") as file:
+            json.dump(data, file, indent=4)
+        os.replace(temp, self.index_filepath)
+
+
+    # Folders are renamed first, so a folder that was only partially deleted is never used as a complete package
+    def _remove(self, path: Path) -> None:
+        if not path.is_dir():
+            path.unlink(missing_ok=True)
+            return
+
+        temp: Path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            os.replace(path, temp)
+        except OSError:
+            return
+        shutil.rmtree(temp, ignore_errors=True)
+
+
+    def _get_size(self, source: Path) -> int:
+        with ZipFile(source, "r") as archive:
+            return sum(info.file_size for info in archive.infolist())
+
+
+    def _read_index(self) -> dict[str, dict]:
+        if not self.index_filepath.is_file():
+            return {}
+
+        try:
+            with open(self.index_filepath, "r") as file:
+                data: dict = json.load(file)
+            if not isinstance(data, dict):
+                raise TypeError(f"Expected dict, got {type(data).__name__}")
+            return data
+
+        except Exception as e:
+            Logger.warning(f"Failed to read package cache index! {type(e).__name__}: {e}", prefix="launcher.PackageCache._read_index()")
+            return {}
\ No newline at end of file
@@ -10,12 +10,14 @@ from modules.info import ProjectData
 from modules.filesystem import Directory
 from modules.config import settings, mods, integrations
 from modules.mod_updater import check_for_mod_updates, update_mods
-from modules.functions.process_exists import process_exists
+from modules.functions.process_monitor import process_monitor
 from modules.functions.kill_process import kill_process
 
 from ..deployment_info import Deployment
+from ..deployment_cache import DeploymentCache
 from .check_downloaded_files import check_downloaded_files
 from .download_missing_files import download_missing_files
+from .download_and_restore_files import download_and_restore_files
 from .restore_default_files import restore_default_files
 from .apply_fastflags import apply_fastflags
 from .apply_mods import apply_mods
@@ -27,6 +29,11 @@ from customtkinter import StringVar
 
 def run(mode: Literal["Player", "Studio"], textvariable: StringVar, versioninfovariable: StringVar, end_signal: Callable, exception_queue: Queue) -> None:
     try:
+        # Cached deployment info is fetched again when Roblox is reinstalled
+        force_reinstallation: bool = settings.get_value("force_roblox_reinstallation")
+        if force_reinstallation:
+            DeploymentCache().delete()
+
         # Get deployment info
         Logger.info("Getting deployment info...")
         textvariable.set("Getting deployment info...")
@@ -35,11 +42,13 @@ def run(mode: Literal["Player", "Studio"], textvariable: StringVar, versioninfov
             versioninfovariable.set(f"{deployment.version} ({deployment.channel})")
 
         # Forced Roblox reinstallation
-        if settings.get_value("force_roblox_reinstallation"):
+        if force_reinstallation:
             Logger.debug("Forced Roblox reinstallation")
             textvariable.set("Forced Roblox reinstallation")
             settings.set_value("force_roblox_reinstallation", False)
             shutil.rmtree(Directory.DOWNLOADS / mode, ignore_errors=True)
+            shutil.rmtree(Directory.PACKAGE_CACHE, ignore_errors=True)
+            shutil.rmtree(deployment.base_directory, ignore_errors=True)
 
         # Check for downloaded files
         Logger.info("Checking Downloads folder...")
@@ -47,31 +56,33 @@ def run(mode: Literal["Player", "Studio"], textvariable: StringVar, versioninfov
         missing_file_hashes: list[str] = check_downloaded_files(deployment, mode)
 
         # Download missing files
-        if missing_file_hashes:
+        pipelined_installation: bool = bool(missing_file_hashes) and settings.get_value("pipelined_installation")
+        if missing_file_hashes and not pipelined_installation:
             Logger.info("Downloading missing files...")
             textvariable.set(f"Downloading Roblox {mode}...")
-            download_missing_files(deployment, mode, missing_file_hashes)
+            download_missing_files(deployment, mode, missing_file_hashes, textvariable)
 
         # Check if Roblox is already running
-        if process_exists(deployment.executable_name):
+        running_process: str | None = process_monitor.find_any(deployment.executable_name, "eurotrucks2.exe")
+        if running_process is not None:
             if settings.get_value("confirm_launch_if_roblox_running"):
                 if not messagebox.askyesno(ProjectData.NAME, "Another Roblox instance is already running!\nDo you still wish to continue?"):
                     return
-            kill_process(deployment.executable_name)
-
-        elif process_exists("eurotrucks2.exe"):
-            if settings.get_value("confirm_launch_if_roblox_running"):
-                if not messagebox.askyesno(ProjectData.NAME, "Another Roblox instance is already running!\nDo you still wish to continue?"):
-                    return
-            kill_process("eurotrucks2.exe")
+            kill_process(running_process)
         
         disable_all_mods: bool = settings.get_value("disable_all_mods")
+
+        # Download and install missing files at the same time
+        if pipelined_installation:
+            Logger.info("Downloading and restoring files...")
+            textvariable.set(f"Downloading Roblox {mode}...")
+            download_and_restore_files(deployment, mode, missing_file_hashes, textvariable, keep_mods=not disable_all_mods)
         
         # Restore default files, if needed
-        if settings.get_value("restore_default_files") or missing_file_hashes or disable_all_mods:
+        elif settings.get_value("restore_default_files") or missing_file_hashes or disable_all_mods:
             Logger.info("Restoring default files...")
             textvariable.set(f"Installing Roblox {mode}...")
-            restore_default_files(deployment, mode)
+            restore_default_files(deployment, mode, keep_mods=not disable_all_mods)
 
         # Update mods, if needed
         if integrations.get_value("mod_updater"):
@@ -2,6 +2,7 @@ from pathlib import Path
 import json
 
 from modules import Logger
+from modules.filesystem import break_link
 
 
 def apply_custom_font(version_folder_root: Path) -> None:
@@ -35,5 +36,6 @@ def apply_custom_font(version_folder_root: Path) -> None:
             faces[i]["assetId"] = new_rbxasset
         data["faces"] = faces
 
+        break_link(json_file)
         with open(json_file, "w") as write_file:
             json.dump(data, write_file, indent=4)
\ No newline at end of file
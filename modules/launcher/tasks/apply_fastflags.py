@@ -1,23 +1,38 @@
 from pathlib import Path
 from typing import Literal
-import json
+import hashlib
 
 from modules import Logger
+from modules.filesystem import break_link
 from modules.config import fastflags, integrations
 
 
+# Needed for RPC to work properly
+REQUIRED_FASTFLAGS: dict = {"FLogNetwork": "7"}
+
+
 def apply_fastflags(version_folder_root: str | Path, mode: Literal["Player", "Studio"]) -> None:
     version_folder_root = Path(version_folder_root)
     
     Logger.info("Applying fastflags...")
-    active_fastflags: dict = fastflags.get_active(mode)
-
-    # Needed for RPC to work properly
-    active_fastflags.update({
-        "FLogNetwork": "7"
-    })
+    snapshot: fastflags.Snapshot = fastflags.get_snapshot(mode, extra=REQUIRED_FASTFLAGS)
+    for flag, profiles in snapshot.overrides.items():
+        Logger.info(f"{flag} is set by multiple profiles, using the value of {profiles[-1]} (overrides {', '.join(profiles[:-1])})")
 
     target: Path = version_folder_root / "ClientSettings" / "ClientAppSettings.json"
+    if _get_hash(target) == snapshot.hash:
+        Logger.info("Fastflags are up to date")
+        return
+
     target.parent.mkdir(parents=True, exist_ok=True)
+    break_link(target)
     with open(target, "w") as file:
-        json.dump(active_fastflags, file, indent=4)
\ No newline at end of file
+        file.write(snapshot.content)
+
+
+def _get_hash(path: Path) -> str | None:
+    try:
+        with open(path, "r") as file:
+            return hashlib.sha256(file.read().encode()).hexdigest()
+    except (OSError, UnicodeDecodeError):
+        return None
\ No newline at end of file
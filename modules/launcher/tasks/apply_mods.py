@@ -1,11 +1,14 @@
 from pathlib import Path
 from typing import Literal
 import shutil
+import os
 
 from modules import Logger
-from modules.filesystem import Directory
-from modules.config import mods
+from modules.filesystem import Directory, link
+from modules.config import mods, settings
 
+from ..install_state import InstallState
+from ..mod_overlay import ModOverlay
 from .apply_custom_font import apply_custom_font
 
 
@@ -16,18 +19,104 @@ def apply_mods(version_folder_root: str | Path, mode: Literal["Player", "Studio"
     active_mods: list[str] = mods.get_active(mode)
     if not active_mods:
         Logger.info("No active mods!")
-        return
-    
+
+    use_links: bool = settings.get_value("link_files")
+    overlay: ModOverlay = ModOverlay(version_folder_root)
+    state: InstallState = InstallState(version_folder_root)
+
+    # Mods are applied in order, so files of later mods replace the files of earlier mods
+    overlay_files: dict[str, tuple[str, Path]] = {}
     for mod in active_mods:
-        Logger.info(f"Applying mod: {mod}...")
         mod_folder: Path = Directory.MODS / mod
+        if not mod_folder.is_dir():
+            Logger.error(f"Failed to apply mod: {mod}! Mod folder not found")
+            continue
+
+        for dirpath, _, filenames in os.walk(mod_folder):
+            for filename in filenames:
+                source: Path = Path(dirpath) / filename
+                key: str = source.relative_to(mod_folder).as_posix()
+                if key not in (InstallState.FILENAME, ModOverlay.FILENAME):
+                    overlay_files[key] = (mod, source)
+
+    # Without an install state, disabled mods can't be undone, so every file is copied like before
+    if state.is_empty():
+        Logger.warning("No install state found, applying all mod files...")
+        overlay.delete()
+        for key, (mod, source) in overlay_files.items():
+            try:
+                copy_file(source, version_folder_root / key, use_links)
+            except Exception as e:
+                Logger.error(f"Failed to apply mod: {mod}! {type(e).__name__}: {e}")
+        apply_custom_font_if_needed(version_folder_root)
+        return
+
+    remove_old_overlay_files(overlay, state, overlay_files, mode)
+
+    applied_count: int = 0
+    for key, (mod, source) in overlay_files.items():
+        if overlay.is_applied(key, mod, source):
+            continue
 
         try:
-            shutil.copytree(mod_folder, version_folder_root, dirs_exist_ok=True)
-        
+            copy_file(source, version_folder_root / key, use_links)
+            package: str | None = state.files[key]["package"] if key in state.files else None
+            overlay.set_applied(key, mod, source, package)
+            applied_count += 1
+
         except Exception as e:
             Logger.error(f"Failed to apply mod: {mod}! {type(e).__name__}: {e}")
-        
+
+    Logger.info(f"Applied {applied_count} file(s), {len(overlay_files) - applied_count} file(s) were already up to date")
+    overlay.save()
+    apply_custom_font_if_needed(version_folder_root)
+
+
+# The target is removed first, it may be a hardlink to a file of another mod
+def copy_file(source: Path, target: Path, use_links: bool) -> None:
+    if use_links:
+        link(source, target)
+        return
+
+    target.parent.mkdir(parents=True, exist_ok=True)
+    target.unlink(missing_ok=True)
+    shutil.copy2(source, target)
+
+
+def apply_custom_font_if_needed(version_folder_root: Path) -> None:
     custom_font_path: Path = version_folder_root / "content" / "fonts" / "CustomFont.ttf"
     if custom_font_path.is_file():
-        apply_custom_font(version_folder_root)
\ No newline at end of file
+        apply_custom_font(version_folder_root)
+
+
+# Files of disabled mods are restored from the downloaded packages, files that were added by mods are removed
+def remove_old_overlay_files(overlay: ModOverlay, state: InstallState, overlay_files: dict[str, tuple[str, Path]], mode: Literal["Player", "Studio"]) -> None:
+    old_files: list[str] = [key for key in overlay.files if key not in overlay_files]
+    if not old_files:
+        return
+
+    Logger.info(f"Removing {len(old_files)} file(s) of disabled mods...")
+    files_to_restore: list[str] = []
+    for key in old_files:
+        if key in state.files:
+            files_to_restore.append(key)
+        else:
+            (overlay.directory / key).unlink(missing_ok=True)
+        overlay.remove(key)
+
+    if not files_to_restore:
+        return
+
+    try:
+        state.restore_files(files_to_restore, Directory.DOWNLOADS / mode)
+        state.save()
+
+    # The files are removed so the mod isn't applied anymore, the install is restored completely on the next launch
+    except Exception as e:
+        Logger.error(f"Failed to restore files of disabled mods! {type(e).__name__}: {e}")
+        for key in files_to_restore:
+            try:
+                (overlay.directory / key).unlink(missing_ok=True)
+            except OSError as e:
+                Logger.error(f"Failed to remove file: {key}! {type(e).__name__}: {e}")
+        state.delete()
\ No newline at end of file
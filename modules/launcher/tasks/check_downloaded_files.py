@@ -1,14 +1,23 @@
 from typing import Literal
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 
-from modules.filesystem import Directory
+from modules import Logger
+from modules.filesystem import Directory, md5
+from modules.config import settings
 
 from ..deployment_info import Deployment
+from ..download_index import DownloadIndex
+from ..package_cache import PackageCache
+
+
+MAX_WORKERS: int = 4
 
 
 def check_downloaded_files(deployment: Deployment, mode: Literal["Player", "Studio"]) -> list[str]:
     directory: Path = Directory.DOWNLOADS / mode
     directory.mkdir(parents=True, exist_ok=True)
+    index: DownloadIndex = DownloadIndex(directory)
 
     required_file_hashes: list[str] = [
         item["hash"]
@@ -19,9 +28,48 @@ def check_downloaded_files(deployment: Deployment, mode: Literal["Player", "Stud
         if not directory.joinpath(hash).is_file()
     ]
 
-    # Remove files for older versions
+    # Only files that are new or that changed since they were last verified need to be hashed again
+    unverified_file_hashes: list[str] = [
+        hash for hash in required_file_hashes
+        if hash not in missing_file_hashes and not index.is_verified(hash)
+    ]
+    if unverified_file_hashes:
+        Logger.info(f"Verifying {len(unverified_file_hashes)} downloaded file(s)...")
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix="launcher.tasks.check_downloaded_files") as executor:
+            results: list[bool] = list(executor.map(lambda hash: verify_file(directory, hash), unverified_file_hashes))
+
+        for hash, is_valid in zip(unverified_file_hashes, results):
+            if is_valid:
+                index.set_verified(hash)
+                continue
+
+            Logger.warning(f"Corrupted file: {hash}")
+            index.remove(hash)
+            directory.joinpath(hash).unlink(missing_ok=True)
+            missing_file_hashes.append(hash)
+
+    # Remove files for older versions, partial downloads of required files are kept so they can be resumed
+    required: set[str] = set(required_file_hashes)
     for filepath in directory.iterdir():
-        if filepath.is_file() and filepath.name not in required_file_hashes:
-            filepath.unlink()
+        if not filepath.is_file() or filepath == index.filepath:
+            continue
+        if filepath.name in required or (filepath.suffix == ".tmp" and filepath.stem in required):
+            continue
+        filepath.unlink()
+
+    index.prune(required_file_hashes)
+    index.save()
+
+    # Remove extracted packages that weren't used recently
+    if settings.get_value("cache_extracted_packages"):
+        PackageCache().collect_garbage(keep=set(required_file_hashes))
+
+    return missing_file_hashes
+
 
-    return missing_file_hashes
\ No newline at end of file
+def verify_file(directory: Path, hash: str) -> bool:
+    try:
+        return md5(directory / hash).lower() == hash.lower()
+    except OSError as e:
+        Logger.warning(f"Failed to verify file: {hash}! {type(e).__name__}: {e}")
+        return False
\ No newline at end of file
@@ -0,0 +1,105 @@
+from typing import Literal, Optional
+from threading import Thread, Event
+from queue import Queue
+import shutil
+import time
+
+from modules import Logger
+
+from ..deployment_info import Deployment
+from ..install_state import InstallState
+from .download_missing_files import download_missing_files
+from .restore_default_files import remove_version_folders, get_modified_packages, restore_package, write_app_settings
+
+from customtkinter import StringVar
+
+
+# Extract each file as soon as it finishes downloading, instead of waiting for all downloads to finish
+# An existing install is updated like in restore_default_files(), only new and modified packages are restored
+def download_and_restore_files(deployment: Deployment, mode: Literal["Player", "Studio"], missing_file_hashes: list[str], textvariable: Optional[StringVar] = None, keep_mods: bool = False) -> None:
+    remove_version_folders(deployment, mode, keep=deployment.base_directory)
+
+    state: InstallState = InstallState(deployment.base_directory)
+    if state.is_empty():
+        Logger.info("No install state found, restoring all files...")
+        shutil.rmtree(deployment.base_directory, ignore_errors=True)
+        state = InstallState(deployment.base_directory, load=False)
+        packages: list[tuple[dict, set[str] | None]] = [(item, None) for item in deployment.package_manifest]
+    else:
+        packages = get_modified_packages(deployment, state, keep_mods)
+
+    restore_queue: Queue = Queue()
+    exception_queue: Queue = Queue()
+    stop_event: Event = Event()
+    restore_durations: list[float] = []
+
+    thread: Thread = Thread(
+        name="launcher.tasks.download_and_restore_files.restore_worker()",
+        target=restore_worker,
+        args=(packages, mode, state, restore_queue, restore_durations, stop_event, exception_queue),
+        daemon=True
+    )
+    thread.start()
+
+    start: float = time.perf_counter()
+    try:
+        # Files that are already downloaded can be restored right away
+        for item, _ in packages:
+            if item["hash"] not in missing_file_hashes:
+                restore_queue.put(item)
+
+        download_missing_files(deployment, mode, missing_file_hashes, textvariable, on_file_downloaded=restore_queue.put, cancel_event=stop_event)
+        download_duration: float = time.perf_counter() - start
+
+    except Exception:
+        stop_event.set()
+        raise
+
+    finally:
+        restore_queue.put(None)
+        thread.join()
+
+    if not exception_queue.empty():
+        raise exception_queue.get()
+
+    write_app_settings(deployment)
+    state.save()
+
+    total_duration: float = time.perf_counter() - start
+    restore_duration: float = sum(restore_durations)
+    time_saved: float = max(0, download_duration + restore_duration - total_duration)
+    Logger.info(f"Download took {download_duration:.2f}s, restoring took {restore_duration:.2f}s, finished after {total_duration:.2f}s (saved {time_saved:.2f}s)")
+
+
+# Files arrive in the order they finish downloading, packages with the same target are still restored in manifest order
+# so the same package wins if they contain the same file, like in restore_packages()
+# Downloaded packages that don't need to be restored (e.g. a corrupt download of an intact package) are skipped
+def restore_worker(packages: list[tuple[dict, set[str] | None]], mode: Literal["Player", "Studio"], state: InstallState, restore_queue: Queue, restore_durations: list[float], stop_event: Event, exception_queue: Queue) -> None:
+    files: dict[str, set[str] | None] = {}
+    remaining: dict[str, list[str]] = {}
+    for item, package_files in packages:
+        files[item["hash"]] = package_files
+        remaining.setdefault(item["target"], []).append(item["hash"])
+    ready: dict[str, dict] = {}
+
+    while True:
+        item: dict | None = restore_queue.get()
+        if item is None or stop_event.is_set():
+            return
+        if item["hash"] not in files:
+            continue
+
+        ready[item["hash"]] = item
+        hashes: list[str] = remaining[item["target"]]
+        while hashes and hashes[0] in ready:
+            item = ready.pop(hashes.pop(0))
+            try:
+                start: float = time.perf_counter()
+                restore_package(item, mode, state, files[item["hash"]])
+                restore_durations.append(time.perf_counter() - start)
+
+            except Exception as e:
+                Logger.error(f"Failed to restore file: {item['file']}! {type(e).__name__}: {e}", prefix="launcher.tasks.download_and_restore_files.restore_worker()")
+                stop_event.set()
+                exception_queue.put(e)
+                return
\ No newline at end of file
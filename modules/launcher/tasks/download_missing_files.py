@@ -1,83 +1,191 @@
 from pathlib import Path
-from typing import Literal
+from typing import Literal, Optional, Callable
+from threading import Thread, Event, Lock
+from queue import Queue, Empty
+import time
 
 from modules import Logger
 from modules.request import Api
 from modules.filesystem import download, Directory
+from modules.filesystem.exceptions import FileDownloadCancelledError
 
 from ..deployment_info import Deployment
+from ..download_index import DownloadIndex
+
+from customtkinter import StringVar
+
+
+MAX_WORKERS: int = 4
+BANDWIDTH_LIMIT: int | None = None  # Bytes per second, None means unlimited
+PROGRESS_UPDATE_INTERVAL: float = 0.25
+DOWNLOAD_ATTEMPTS: int = 5
+
+
+# Token bucket shared by all workers, the clock and sleep functions can be replaced in tests
+class BandwidthLimiter:
+    rate: int
+    allowance: float
+    last_check: float
+    lock: Lock
+    clock: Callable[[], float]
+    sleep: Callable[[float], None]
+
+
+    def __init__(self, rate: int, clock: Callable[[], float] = time.monotonic, sleep: Callable[[float], None] = time.sleep) -> None:
+        self.rate = rate
+        self.allowance = rate
+        self.clock = clock
+        self.sleep = sleep
+        self.last_check = clock()
+        self.lock = Lock()
+
+
+    def consume(self, amount: int) -> None:
+        with self.lock:
+            now: float = self.clock()
+            self.allowance = min(self.rate, self.allowance + (now - self.last_check) * self.rate)
+            self.last_check = now
+            self.allowance -= amount
+            delay: float = -self.allowance / self.rate if self.allowance < 0 else 0
+
+        if delay > 0:
+            self.sleep(delay)
+
+
+# Bytes of partial downloads count as downloaded, but not towards the download rate
+class DownloadProgress:
+    total: int
+    downloaded: int
+    resumed: int
+    textvariable: StringVar | None
+    text: str
+    start: float
+    last_update: float
+    lock: Lock
+
+
+    def __init__(self, total: int, text: str, textvariable: Optional[StringVar] = None, resumed: int = 0) -> None:
+        self.total = total
+        self.downloaded = resumed
+        self.resumed = resumed
+        self.text = text
+        self.textvariable = textvariable
+        self.start = time.monotonic()
+        self.last_update = 0
+        self.lock = Lock()
+
+
+    def add(self, amount: int) -> None:
+        with self.lock:
+            self.downloaded += amount
+            now: float = time.monotonic()
+            if now - self.last_update < PROGRESS_UPDATE_INTERVAL:
+                return
+            self.last_update = now
+        self._update_textvariable()
+
+
+    def complete(self) -> None:
+        self._update_textvariable()
+
+
+    def _update_textvariable(self) -> None:
+        if self.textvariable is None:
+            return
+        downloaded: int = min(self.downloaded, self.total)
+        downloaded_mb: float = round(downloaded / 1048576, 1)
+        total_mb: float = round(self.total / 1048576, 1)
+        rate: float = max(downloaded - self.resumed, 0) / max(time.monotonic() - self.start, 1e-6)
+        rate_mb: float = round(rate / 1048576, 1)
+        eta: str = f", {int((self.total - downloaded) / rate)}s left" if rate > 0 else ""
+        self.textvariable.set(f"{self.text} ({downloaded_mb}/{total_mb} MB at {rate_mb} MB/s{eta})")
+
+
+# Download multiple files simultaneously, largest files first
+# Setting cancel_event stops the remaining downloads without raising an exception
+def download_missing_files(deployment: Deployment, mode: Literal["Player", "Studio"], missing_file_hashes: list[str], textvariable: Optional[StringVar] = None, on_file_downloaded: Optional[Callable[[dict], None]] = None, cancel_event: Optional[Event] = None) -> None:
+    items: list[dict] = sorted(
+        [item for item in deployment.package_manifest if item["hash"] in missing_file_hashes],
+        key=lambda item: item["size"],
+        reverse=True
+    )
+    if not items:
+        return
+
+    directory: Path = Directory.DOWNLOADS / mode
+    resumed: int = sum(_get_partial_size(directory / item["hash"], item["size"]) for item in items)
+    progress: DownloadProgress = DownloadProgress(sum(item["size"] for item in items), f"Downloading Roblox {mode}...", textvariable, resumed)
+    limiter: BandwidthLimiter | None = BandwidthLimiter(BANDWIDTH_LIMIT) if BANDWIDTH_LIMIT else None
+    index: DownloadIndex = DownloadIndex(directory)
+    if cancel_event is None:
+        cancel_event = Event()
+    exception_queue: Queue = Queue()
+    work_queue: Queue = Queue()
+    for item in items:
+        work_queue.put(item)
+
+    threads: list[Thread] = []
+    for i in range(min(MAX_WORKERS, len(items))):
+        thread: Thread = Thread(
+            name=f"launcher.tasks.download_missing_files.worker({i})",
+            target=worker,
+            args=(deployment, mode, work_queue, limiter, index, progress, cancel_event, exception_queue, on_file_downloaded),
+            daemon=True
+        )
+        thread.start()
+        threads.append(thread)
+
+    for thread in threads:
+        thread.join()
+
+    index.save()
+
+    if not exception_queue.empty():
+        raise exception_queue.get()
+
+
+def worker(deployment: Deployment, mode: Literal["Player", "Studio"], work_queue: Queue, limiter: BandwidthLimiter | None, index: DownloadIndex, progress: DownloadProgress, cancel_event: Event, exception_queue: Queue, on_file_downloaded: Optional[Callable[[dict], None]] = None) -> None:
+    while not cancel_event.is_set():
+        try:
+            item: dict = work_queue.get_nowait()
+        except Empty:
+            return
 
-
-# Donload one file at a time
-def download_missing_files(deployment: Deployment, mode: Literal["Player", "Studio"], missing_file_hashes: list[str]) -> None:
-    for item in deployment.package_manifest:
-        if item["hash"] not in missing_file_hashes:
-            continue
-        
         file: str = item["file"]
         hash: str = item["hash"]
         size: int = item["size"]
-
-        size_mb: float = round(size / 1048576, 2)
-        Logger.info(f"Downloading file: {file} (hash: {hash}, size: {size_mb} MB)")
-        download_target: Path = Directory.DOWNLOADS / mode / hash
-        
-        download(Api.Roblox.Deployment.download(deployment.version, file), download_target)
-
-
-
-
-
-
-
-# # Downloading each file simulatneously
-
-
-# from pathlib import Path
-# from typing import Literal
-# from queue import Queue
-# from threading import Thread
-
-# from modules import Logger
-# from modules.request import Api
-# from modules.filesystem import download, Directory
-
-# from ..deployment_info import Deployment
-
-
-# def download_missing_files(deployment: Deployment, mode: Literal["Player", "Studio"], missing_file_hashes: list[str]) -> None:
-#     exception_queue: Queue = Queue()
-#     threads: list[Thread] = []
-
-#     for item in deployment.package_manifest:
-#         if item["hash"] not in missing_file_hashes:
-#             continue
-        
-#         file: str = item["file"]
-#         thread = Thread(name=f"file-download-thread_{file}", target=worker, args=(deployment, mode, item, exception_queue), daemon=True)
-#         threads.append(thread)
-#         thread.start()
-    
-#     for thread in threads:
-#         thread.join()
-    
-#     if not exception_queue.empty():
-#         raise exception_queue.get()
-
-
-# # Download each file simultaneously
-# def worker(deployment: Deployment, mode: Literal["Player", "Studio"], item: dict, exception_queue: Queue) -> None:
-#     try:
-#         file: str = item["file"]
-#         hash: str = item["hash"]
-#         size: int = item["size"]
-
-#         size_mb: float = round(size / 1048576, 2)
-#         Logger.info(f"Downloading file: {file} (hash: {hash}, size: {size_mb} MB)")
-#         download_target: Path = Directory.DOWNLOADS / mode / hash
-        
-#         download(Api.Roblox.Deployment.download(deployment.version, file), download_target)
-
-#     except Exception as e:
-#         Logger.error(f"Failed to download file: {file}! {type(e).__name__}: {e}")
-#         exception_queue.put(e)
\ No newline at end of file
+        source: str = Api.Roblox.Deployment.download(deployment.version, file)
+
+        def on_chunk(amount: int) -> None:
+            if limiter is not None:
+                limiter.consume(amount)
+            progress.add(amount)
+
+        try:
+            size_mb: float = round(size / 1048576, 2)
+            Logger.info(f"Downloading file: {file} (hash: {hash}, size: {size_mb} MB)", prefix="launcher.tasks.download_missing_files.worker()")
+            download_target: Path = Directory.DOWNLOADS / mode / hash
+
+            download(source, download_target, attempts=DOWNLOAD_ATTEMPTS, chunk_callback=on_chunk, cancel_event=cancel_event, md5=hash, size=size)
+            index.set_verified(hash)
+            progress.complete()
+            if on_file_downloaded is not None:
+                on_file_downloaded(item)
+
+        except FileDownloadCancelledError:
+            return
+
+        except Exception as e:
+            Logger.error(f"Failed to download file: {file}! {type(e).__name__}: {e}", prefix="launcher.tasks.download_missing_files.worker()")
+            cancel_event.set()
+            exception_queue.put(e)
+            return
+
+
+# download() resumes from the temporary file, larger files are discarded and downloaded again
+def _get_partial_size(download_target: Path, size: int) -> int:
+    try:
+        partial_size: int = download_target.with_suffix(".tmp").stat().st_size
+    except OSError:
+        return 0
+    return partial_size if partial_size <= size else 0
\ No newline at end of file
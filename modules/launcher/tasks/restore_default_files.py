@@ -1,48 +1,193 @@
-from typing import Literal
+from typing import Literal, Optional
 from pathlib import Path
+from zipfile import ZipFile
+from concurrent.futures import ThreadPoolExecutor
 import shutil
+import time
 
 from modules import Logger
-from modules.filesystem import Directory, extract
+from modules.filesystem import Directory, link, extract_member, get_member_path
+from modules.config import settings
 
 from ..deployment_info import Deployment
+from ..install_state import InstallState
+from ..mod_overlay import ModOverlay
+from ..package_cache import PackageCache
 
 
-def restore_default_files(deployment: Deployment, mode: Literal["Player","Studio"]) -> None:
-    # Remove older and current version(s)
-    if Directory.VERSIONS.is_dir():
-        for directory in Directory.VERSIONS.iterdir():
+MAX_WORKERS: int = 4
 
-            if not directory.is_dir():
-                continue
 
-            executable_path: Path = directory / deployment.executable_name
-            eurotrucks_path: Path = directory / "eurotrucks2.exe"
-            if executable_path.is_file():
-                Logger.info(f"Removing directory: {directory}...")
-                shutil.rmtree(directory, ignore_errors=True)
-            
-            if mode == "Player" and eurotrucks_path.is_file():
-                Logger.info(f"Removing directory: {directory}...")
-                shutil.rmtree(directory, ignore_errors=True)
-
-    # Restore files for current version
-    for item in deployment.package_manifest:
-        file: str = item["file"]
-        hash: str = item["hash"]
-        # size: int = item["size"]
-        # rawsize: int = item["rawsize"]
-        target: Path = Path(item["target"])
-
-        source: Path = Directory.DOWNLOADS / mode / hash
-
-        target.mkdir(parents=True, exist_ok=True)
-        if file.endswith(".zip"):
-            extract(source, target, ignore_filetype=True)
+def restore_default_files(deployment: Deployment, mode: Literal["Player","Studio"], keep_mods: bool = False) -> None:
+    remove_version_folders(deployment, mode, keep=deployment.base_directory)
+
+    state: InstallState = InstallState(deployment.base_directory)
+    if state.is_empty():
+        Logger.info("No install state found, restoring all files...")
+        shutil.rmtree(deployment.base_directory, ignore_errors=True)
+        state = InstallState(deployment.base_directory, load=False)
+        restore_packages([(item, None) for item in deployment.package_manifest], mode, state)
+
+    else:
+        restore_modified_files(deployment, mode, state, keep_mods)
+
+    write_app_settings(deployment)
+    state.save()
+
+
+# Only rewrite the files of changed packages and the files that were overwritten by mods
+# Files of active mods are left alone if keep_mods is True, apply_mods() will only update the files that changed
+def restore_modified_files(deployment: Deployment, mode: Literal["Player","Studio"], state: InstallState, keep_mods: bool = False) -> None:
+    restore_packages(get_modified_packages(deployment, state, keep_mods), mode, state)
+
+
+# Removes the files of old packages and mods, returns the packages that need to be restored in manifest order
+# The files are None for new packages, which are restored completely
+def get_modified_packages(deployment: Deployment, state: InstallState, keep_mods: bool = False) -> list[tuple[dict, set[str] | None]]:
+    Logger.info("Restoring modified files...")
+
+    # The NVIDIA game filter renames the executable, rename it back so it doesn't have to be extracted again
+    eurotrucks_path: Path = deployment.base_directory / "eurotrucks2.exe"
+    if eurotrucks_path.is_file() and not deployment.executable_path.exists():
+        eurotrucks_path.rename(deployment.executable_path)
+
+    required_packages: dict[str, dict] = {item["hash"]: item for item in deployment.package_manifest}
+    for hash in list(state.packages):
+        if hash not in required_packages:
+            state.remove_package(hash)
+
+    overlay: ModOverlay = ModOverlay(deployment.base_directory)
+    previous_overlay_files: set[str] = set(overlay.files)
+    if not keep_mods:
+        overlay.delete()
+    overlay_files: set[str] = overlay.get_intact_files()
+
+    modified_files: dict[str, set[str]] = state.get_modified_files(ignore=overlay_files)
+    state.remove_untracked_files(previous_overlay_files - overlay_files)
+
+    packages: list[tuple[dict, set[str] | None]] = []
+    for hash, item in required_packages.items():
+        if hash not in state.packages:
+            Logger.info(f"Restoring new package: {item['file']}")
+            packages.append((item, None))
+
+        elif hash in modified_files:
+            Logger.info(f"Restoring {len(modified_files[hash])} file(s) from {item['file']}")
+            packages.append((item, modified_files[hash]))
+
+    return packages
+
+
+# Packages are restored simultaneously, but packages with the same target are restored in manifest order
+def restore_packages(packages: list[tuple[dict, set[str] | None]], mode: Literal["Player","Studio"], state: InstallState) -> None:
+    groups: dict[str, list[tuple[dict, set[str] | None]]] = {}
+    for item, files in packages:
+        groups.setdefault(item["target"], []).append((item, files))
+
+    if not groups:
+        return
+
+    # Without links, files would be extracted to the cache and then copied, extracting them directly is faster
+    use_cache: bool = settings.get_value("cache_extracted_packages") and settings.get_value("link_files")
+    package_cache: PackageCache | None = PackageCache() if use_cache else None
+
+    start: float = time.perf_counter()
+    try:
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix="launcher.tasks.restore_packages") as executor:
+            futures = [executor.submit(restore_package_group, group, mode, state, package_cache) for group in groups.values()]
+            for future in futures:
+                future.result()
+    finally:
+        if package_cache is not None:
+            package_cache.save()
+    Logger.info(f"Restored {len(packages)} package(s) in {time.perf_counter() - start:.2f}s")
+
+
+def restore_package_group(group: list[tuple[dict, set[str] | None]], mode: Literal["Player","Studio"], state: InstallState, package_cache: PackageCache | None = None) -> None:
+    for item, files in group:
+        start: float = time.perf_counter()
+        restore_package(item, mode, state, files, package_cache)
+        Logger.info(f"Restored {item['file']} in {time.perf_counter() - start:.2f}s")
+
+
+# Remove older and current version(s)
+def remove_version_folders(deployment: Deployment, mode: Literal["Player","Studio"], keep: Optional[Path] = None) -> None:
+    if not Directory.VERSIONS.is_dir():
+        return
+
+    for directory in Directory.VERSIONS.iterdir():
+
+        if not directory.is_dir() or directory == keep:
+            continue
+
+        executable_path: Path = directory / deployment.executable_name
+        eurotrucks_path: Path = directory / "eurotrucks2.exe"
+        if executable_path.is_file():
+            Logger.info(f"Removing directory: {directory}...")
+            shutil.rmtree(directory, ignore_errors=True)
+
+        if mode == "Player" and eurotrucks_path.is_file():
+            Logger.info(f"Removing directory: {directory}...")
+            shutil.rmtree(directory, ignore_errors=True)
+
+
+# Packages are extracted from the package cache instead of the downloaded file if package_cache is given
+def restore_package(item: dict, mode: Literal["Player","Studio"], state: InstallState, files: Optional[set[str]] = None, package_cache: Optional[PackageCache] = None) -> None:
+    file: str = item["file"]
+    hash: str = item["hash"]
+    # size: int = item["size"]
+    # rawsize: int = item["rawsize"]
+    target: Path = Path(item["target"])
+
+    source: Path = Directory.DOWNLOADS / mode / hash
+
+    target.mkdir(parents=True, exist_ok=True)
+    state.add_package(hash, file, target)
+
+    use_links: bool = settings.get_value("link_files")
+
+    if not file.endswith(".zip"):
+        output: Path = target / source.name
+        if use_links:
+            link(source, output)
         else:
-            shutil.copy(source, target)
+            output.unlink(missing_ok=True)
+            shutil.copy(source, output)
+        state.record(output, hash)
+        return
+
+    if files is None:
+        Logger.info(f"Extracting file: {file}...")
+
+    cache_directory: Path | None = package_cache.get(hash, source) if package_cache is not None else None
+
+    # Parent directories are created once per package instead of once per file
+    created_directories: set[Path] = set()
+    with ZipFile(source, "r") as archive:
+        for info in archive.infolist():
+            if info.is_dir():
+                continue
+
+            path: Path = get_member_path(target, info.filename)
+            if files is not None and path.relative_to(state.directory).as_posix() not in files:
+                continue
+
+            if path.parent not in created_directories:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                created_directories.add(path.parent)
+
+            # Files of mods may be hardlinked, the file is replaced so the mod isn't changed
+            if cache_directory is None:
+                extract_member(archive, info, path)
+                state.record(path, hash, info.CRC)
+                continue
+
+            link(get_member_path(cache_directory, info.filename), path)
+            state.record(path, hash, info.CRC)
+
 
-    # Add AppSettings.xml
+# Add AppSettings.xml
+def write_app_settings(deployment: Deployment) -> None:
     Logger.info("Writing AppSettings.xml")
     deployment.app_settings_path.parent.mkdir(parents=True, exist_ok=True)
     with open(deployment.app_settings_path, "w") as appsettings:
@@ -176,18 +176,19 @@ class FastFlagPresetWindow(ctk.CTkToplevel):
         current_enabled: bool | None = None
         current_enabled_studio: bool | None = None
 
-        if name in [item.get("name") for item in fastflags.read_file()]:
-            existing_item: dict = fastflags.get_item(name)
-            current_enabled = existing_item.get("enabled")
-            current_enabled_studio = existing_item.get("enabled_studio")
-            fastflags.remove_item(name)
-
-        fastflags.add_item(name, description=profile.get("description"), profile_data=profile["data"])
-        
-        if current_enabled is not None:
-            fastflags.set_enabled(name, current_enabled)
-        if current_enabled_studio is not None:
-            fastflags.set_enabled_studio(name, current_enabled_studio)
+        with fastflags.collection.transaction():
+            if name in fastflags.collection:
+                existing_item: dict = fastflags.get_item(name)
+                current_enabled = existing_item.get("enabled")
+                current_enabled_studio = existing_item.get("enabled_studio")
+                fastflags.remove_item(name)
+
+            fastflags.add_item(name, description=profile.get("description"), profile_data=profile["data"])
+            
+            if current_enabled is not None:
+                fastflags.set_enabled(name, current_enabled)
+            if current_enabled_studio is not None:
+                fastflags.set_enabled_studio(name, current_enabled_studio)
 
         self._hide()
         self.on_success()
\ No newline at end of file
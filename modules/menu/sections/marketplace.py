@@ -11,7 +11,7 @@ from modules.info import ProjectData
 from modules.filesystem import Directory, restore_from_meipass, download, extract
 from modules import request
 from modules.request import Api, Response, ConnectionError
-from modules.functions.interface.image import load as load_image, load_from_url as load_image_from_url
+from modules.functions.interface.image import load as load_image, load_from_url as load_image_from_url, is_loaded_from_url as is_image_loaded_from_url
 from modules.mod_updater import check_for_mod_updates, update_mods
 from modules.launcher.deployment_info import Deployment
 from modules.config import settings
@@ -63,6 +63,14 @@ class MarketplaceSection:
             if ignore_thumbnails:
                 return
 
+            # Runs on the preload thread, so the thumbnails are downloaded at the same time without blocking the interface
+            # load_image_from_url() will use the cached responses
+            urls: list[str] = [
+                Api.GitHub.mod_thumbnail(mod["id"]) for mod in self.data
+                if mod.get("id") and mod.get("name") and mod.get("has_thumbnail") is True
+            ]
+            request.get_many([url for url in urls if not is_image_loaded_from_url(url, self.Constants.MOD_THUMBNAIL_SIZE)], attempts=1, cached=True)
+
             # if not settings.get_value("preload_marketplace_thumbnails"):
             #     return
             
@@ -127,7 +135,7 @@ class MarketplaceSection:
         if not download_icon.is_file():
             restore_from_meipass(download_icon)
         download_image = load_image(download_icon)
-        
+
         for i, mod in enumerate(self.data):
             name: str | None = mod.get("name")
             id: str | None = mod.get("id")
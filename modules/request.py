@@ -1,15 +1,33 @@
-from typing import Optional
+from typing import Optional, NamedTuple
+from threading import Lock, BoundedSemaphore, Thread
+from collections import OrderedDict
+import asyncio
+from urllib.parse import urlparse
+import random
 import time
 
 from modules import Logger
 
 import requests
-from requests import Response, ConnectionError
+from requests import Response, ConnectionError, HTTPError
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
 
 
 COOLDOWN: float = 2
+MAX_COOLDOWN: float = 16
 TIMEOUT: tuple[int,int] = (5,15)
-_cache: dict = {}
+MAX_CONNECTIONS_PER_HOST: int = 8
+POOL_HOSTS: int = 16
+RETRY_STATUS_CODES: set[int] = {408, 429, 500, 502, 503, 504}
+
+_session: requests.Session | None = None
+_session_lock: Lock = Lock()
+_host_limits: dict[str, BoundedSemaphore] = {}
+
+_loop: asyncio.AbstractEventLoop | None = None
+_loop_lock: Lock = Lock()
+_in_flight: dict[tuple[asyncio.AbstractEventLoop, str], asyncio.Task] = {}
 
 
 # region APIs
@@ -75,27 +93,252 @@ class Api:
                 return rf"https://thumbnails.roblox.com/v1/users/avatar-bust?userIds={userId}&size={size[0]}x{size[1]}&format={format}&isCircular={circular}"
 
 
+# region cache
+class CacheEntry(NamedTuple):
+    status_code: int
+    headers: dict[str, str]
+    content: bytes
+    encoding: str | None
+    expires: float
+
+
+# Only the decoded body of a response is kept, least recently used responses are removed first
+class ResponseCache:
+    MAX_SIZE: int = 32 * 1048576  # 32 MB
+    DEFAULT_TTL: float = 600
+    NOT_FOUND_TTL: float = 60
+    TTL: dict[str, float] = {  # URL prefix: seconds
+        "https://games.roblox.com/": 60,
+        "https://apis.roblox.com/universes/": 86400,
+        "https://thumbnails.roblox.com/": 3600,
+        "https://users.roblox.com/": 3600,
+        "https://clientsettings.roblox.com/": 300,
+        "https://clientsettingscdn.roblox.com/": 300,
+        "https://raw.githubusercontent.com/": 600
+    }
+
+    entries: OrderedDict[str, CacheEntry]
+    size: int
+    max_size: int
+    lock: Lock
+
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+
+
+    def __init__(self, max_size: int = MAX_SIZE) -> None:
+        self.entries = OrderedDict()
+        self.size = 0
+        self.max_size = max_size
+        self.lock = Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+
+    def get(self, url: str) -> Response | None:
+        with self.lock:
+            entry: CacheEntry | None = self.entries.get(url)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            if entry.expires <= time.monotonic():
+                self._remove(url)
+                self.expirations += 1
+                self.misses += 1
+                return None
+
+            self.entries.move_to_end(url)
+            self.hits += 1
+
+        response: Response = Response()
+        response.url = url
+        response.status_code = entry.status_code
+        response.headers = CaseInsensitiveDict(entry.headers)
+        response.encoding = entry.encoding
+        response._content = entry.content
+        return response
+
+
+    # Successful responses and 404s are cached, other errors may be temporary
+    def set(self, url: str, response: Response) -> None:
+        if not response.ok and response.status_code != 404:
+            return
+
+        content: bytes = response.content
+        if len(content) > self.max_size:
+            return
+
+        ttl: float = self.NOT_FOUND_TTL if response.status_code == 404 else self.get_ttl(url)
+        entry: CacheEntry = CacheEntry(response.status_code, dict(response.headers), content, response.encoding, time.monotonic() + ttl)
+
+        with self.lock:
+            if url in self.entries:
+                self._remove(url)
+            self.entries[url] = entry
+            self.size += len(content)
+
+            while self.size > self.max_size:
+                oldest: str = next(iter(self.entries))
+                self._remove(oldest)
+                self.evictions += 1
+
+
+    def get_ttl(self, url: str) -> float:
+        for prefix, ttl in self.TTL.items():
+            if url.startswith(prefix):
+                return ttl
+        return self.DEFAULT_TTL
+
+
+    def clear(self) -> None:
+        with self.lock:
+            self.entries.clear()
+            self.size = 0
+
+
+    def stats(self) -> dict[str, int]:
+        with self.lock:
+            return {
+                "entries": len(self.entries),
+                "size": self.size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations
+            }
+
+
+    def _remove(self, url: str) -> None:
+        entry: CacheEntry = self.entries.pop(url)
+        self.size -= len(entry.content)
+
+
+_cache: ResponseCache = ResponseCache()
+
+
+# region session
+# A single session is shared so connections are kept alive and reused for each host
+def get_session() -> requests.Session:
+    global _session
+    with _session_lock:
+        if _session is None:
+            session: requests.Session = requests.Session()
+            adapter: HTTPAdapter = HTTPAdapter(pool_connections=POOL_HOSTS, pool_maxsize=MAX_CONNECTIONS_PER_HOST)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _session = session
+        return _session
+
+
+def close_session() -> None:
+    global _session
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+            _session = None
+
+
+def _get_host_limit(url: str) -> BoundedSemaphore:
+    host: str = urlparse(url).netloc
+    with _session_lock:
+        if host not in _host_limits:
+            _host_limits[host] = BoundedSemaphore(MAX_CONNECTIONS_PER_HOST)
+        return _host_limits[host]
+
+
+# Client errors won't change by trying again, except for timeouts and rate limits
+def _should_retry(exception: Exception) -> bool:
+    if isinstance(exception, HTTPError) and exception.response is not None:
+        return exception.response.status_code in RETRY_STATUS_CODES
+    return True
+
+
+# Exponential backoff with jitter, Retry-After is used if the server sends it
+def _get_cooldown(attempt: int, exception: Exception) -> float:
+    if isinstance(exception, HTTPError) and exception.response is not None:
+        retry_after: str | None = exception.response.headers.get("Retry-After")
+        if retry_after is not None and retry_after.isdigit():
+            return min(float(retry_after), MAX_COOLDOWN)
+    cooldown: float = min(COOLDOWN * 2 ** attempt, MAX_COOLDOWN)
+    return cooldown / 2 + random.uniform(0, cooldown / 2)
+
+
 # region get()
-def get(url: str, attempts: int = 3, cached: bool = False, timeout: Optional[tuple[int, int]] = None, dont_log_cached_request: bool = False) -> Response:
-    if cached and url in _cache:
-        if not dont_log_cached_request:
-            Logger.info(f"Cached GET request: {url}")
-        return _cache[url]
+def get(url: str, attempts: int = 3, cached: bool = False, timeout: Optional[tuple[int, int]] = None, dont_log_cached_request: bool = False, headers: Optional[dict[str, str]] = None) -> Response:
+    if cached:
+        cached_response: Response | None = _cache.get(url)
+        if cached_response is not None:
+            if not dont_log_cached_request:
+                Logger.info(f"Cached GET request: {url}")
+            cached_response.raise_for_status()
+            return cached_response
     
     exception: Exception | None = None
+    session: requests.Session = get_session()
+    host_limit: BoundedSemaphore = _get_host_limit(url)
 
-    for _ in range(attempts):
+    for attempt in range(attempts):
         try:
             Logger.info(f"GET request: {url}")
-            response: Response = requests.get(url, timeout=timeout or TIMEOUT)
+            with host_limit:
+                response: Response = session.get(url, timeout=timeout or TIMEOUT, headers=headers)
+            if cached:
+                _cache.set(url, response)
             response.raise_for_status()
-            _cache[url] = response
             return response
 
         except Exception as e:
             Logger.error(f"GET request failed! {type(e).__name__}: {e}")
             exception = e
-            time.sleep(COOLDOWN)
+            if not _should_retry(e):
+                break
+            if attempt < attempts - 1:
+                time.sleep(_get_cooldown(attempt, e))
     
     if exception is not None:
-        raise exception
\ No newline at end of file
+        raise exception
+
+
+# region async
+# Concurrent requests for the same URL share a single request
+async def aget(url: str, attempts: int = 3, cached: bool = False, timeout: Optional[tuple[int, int]] = None, dont_log_cached_request: bool = False, headers: Optional[dict[str, str]] = None) -> Response:
+    if headers:
+        return await asyncio.to_thread(get, url, attempts, cached, timeout, dont_log_cached_request, headers)
+
+    loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+    key: tuple[asyncio.AbstractEventLoop, str] = (loop, url)
+    task: asyncio.Task | None = _in_flight.get(key)
+
+    if task is None:
+        task = loop.create_task(asyncio.to_thread(get, url, attempts, cached, timeout, dont_log_cached_request))
+        _in_flight[key] = task
+        task.add_done_callback(lambda _: _in_flight.pop(key, None))
+
+    # Shielded so a cancelled caller doesn't cancel the request for other callers
+    return await asyncio.shield(task)
+
+
+async def gather_get(urls: list[str], attempts: int = 3, cached: bool = False, timeout: Optional[tuple[int, int]] = None, dont_log_cached_request: bool = False) -> list[Response | Exception]:
+    return await asyncio.gather(*(aget(url, attempts, cached, timeout, dont_log_cached_request) for url in urls), return_exceptions=True)
+
+
+# For thread-based callers, requests are made on a shared background event loop
+def get_many(urls: list[str], attempts: int = 3, cached: bool = False, timeout: Optional[tuple[int, int]] = None, dont_log_cached_request: bool = False) -> list[Response | Exception]:
+    if not urls:
+        return []
+    future = asyncio.run_coroutine_threadsafe(gather_get(urls, attempts, cached, timeout, dont_log_cached_request), _get_loop())
+    return future.result()
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            Thread(target=_loop.run_forever, daemon=True, name="request-event-loop").start()
+        return _loop
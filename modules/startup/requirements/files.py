@@ -4,6 +4,7 @@ import json
 
 from modules import Logger
 from modules.filesystem import File, restore_from_meipass, Directory
+from modules.config.store import write_json
 
 
 IS_FROZEN: bool = getattr(sys, "frozen", False)
@@ -57,8 +58,7 @@ def check_file_content(file: Path) -> None:
                         filtered_data[key]["value"] = current_data[key]["value"]
 
         if current_data != filtered_data:
-            with open(file, "w") as current_file:
-                json.dump(filtered_data, current_file, indent=4)
+            write_json(file, filtered_data)
 
     except Exception as e:
         Logger.warning(f"Failed to verify content of {file.name}! {type(e).__name__}: {e}")
\ No newline at end of file
@@ -0,0 +1,65 @@
+# Verifying downloaded packages without an index (cold) and with an up to date index (warm launch)
+# Run from the project root: python -m tests.benchmarks.bench_check_downloaded_files
+from types import SimpleNamespace, ModuleType
+from unittest.mock import patch
+from pathlib import Path
+import importlib
+import tempfile
+import hashlib
+import random
+import shutil
+
+from modules.filesystem import Directory
+from modules.launcher.download_index import DownloadIndex
+
+from .timing import measure, report
+
+
+# The tasks package exports a function with the same name as the module
+task: ModuleType = importlib.import_module("modules.launcher.tasks.check_downloaded_files")
+
+
+PACKAGE_SIZES: list[int] = [16777216, 8388608, 8388608, 4194304] + [1048576] * 16 + [65536] * 12
+
+
+def create_packages(directory: Path) -> list[dict]:
+    rng: random.Random = random.Random(0)
+    manifest: list[dict] = []
+    for size in PACKAGE_SIZES:
+        data: bytes = rng.randbytes(size)
+        hash: str = hashlib.md5(data).hexdigest()
+        directory.joinpath(hash).write_bytes(data)
+        manifest.append({"file": f"{hash}.zip", "hash": hash, "size": size})
+    return manifest
+
+
+def main() -> None:
+    root: Path = Path(tempfile.mkdtemp())
+    directory: Path = root / "Player"
+    directory.mkdir()
+    deployment: SimpleNamespace = SimpleNamespace(version="version-benchmark", package_manifest=create_packages(directory))
+
+    def remove_index() -> None:
+        directory.joinpath(DownloadIndex.FILENAME).unlink(missing_ok=True)
+
+    def check() -> None:
+        assert not task.check_downloaded_files(deployment, "Player")
+
+    results: dict[str, float] = {}
+    try:
+        # The package cache isn't part of this benchmark, so it is turned off instead of cleaning up the real one
+        with patch.object(Directory, "DOWNLOADS", root), patch.object(task.settings, "get_value", lambda key: False):
+            for workers in (1, 4):
+                with patch.object(task, "MAX_WORKERS", workers):
+                    results[f"cold, {workers} worker(s)"] = measure(check, repeat=3, setup=remove_index)
+            results["warm"] = measure(check, repeat=5)
+
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+    total_mb: float = round(sum(PACKAGE_SIZES) / 1048576, 1)
+    report(f"check_downloaded_files: {len(PACKAGE_SIZES)} packages, {total_mb} MB", results, baseline="cold, 1 worker(s)")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
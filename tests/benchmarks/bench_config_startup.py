@@ -0,0 +1,88 @@
+# File opens and load time of the config files during a launch, without the binary cache, before it exists and once it does
+# Run from the project root: python -m tests.benchmarks.bench_config_startup
+from unittest.mock import patch
+from pathlib import Path
+import tempfile
+import shutil
+import json
+import sys
+
+from modules.config.store import ConfigStore
+
+from .timing import measure, report
+
+
+CONFIG_DIRECTORY: Path = Path(__file__).parent.parent.parent / "config"
+
+
+# Roughly the config a user with many mods and fastflag profiles has
+def create_files(directory: Path) -> dict[str, type]:
+    for name in ("settings.json", "integrations.json"):
+        shutil.copy(CONFIG_DIRECTORY / name, directory / name)
+    data: dict[str, list] = {
+        "mods.json": [{"name": f"Mod {i}", "enabled": True, "enabled_studio": False, "priority": i} for i in range(100)],
+        "fastflags.json": [
+            {"name": f"Profile {i}", "enabled": True, "enabled_studio": False, "data": {f"FFlagBenchmark{j}": "True" for j in range(20)}}
+            for i in range(200)
+        ],
+        "launch_apps.json": [{"filepath": f"C:\\Programs\\App {i}.exe", "enabled": True, "enabled_studio": False, "args": None} for i in range(10)]
+    }
+    for name, items in data.items():
+        with open(directory / name, "w") as file:
+            json.dump(items, file, indent=4)
+    return {"settings.json": dict, "integrations.json": dict, "mods.json": list, "fastflags.json": list, "launch_apps.json": list}
+
+
+# New stores are created every time, like a new launcher process would
+def load_all(directory: Path, files: dict[str, type]) -> None:
+    for name, data_type in files.items():
+        ConfigStore(directory / name, default=data_type()).get()
+
+
+def main() -> None:
+    directory: Path = Path(tempfile.mkdtemp())
+    files: dict[str, type] = create_files(directory)
+    size_kb: float = round(sum((directory / name).stat().st_size for name in files) / 1024, 1)
+
+    # Audit hooks can't be removed, the hook only counts while counting is set
+    opened: list[str] = []
+    counting: list[bool] = [False]
+    def audit(event: str, args: tuple) -> None:
+        if counting[0] and event == "open":
+            opened.append(str(args[0]))
+    sys.addaudithook(audit)
+
+    def count_opens() -> int:
+        opened.clear()
+        counting[0] = True
+        try:
+            load_all(directory, files)
+        finally:
+            counting[0] = False
+        return len(opened)
+
+    def remove_cache() -> None:
+        shutil.rmtree(directory / "cache", ignore_errors=True)
+
+    results: dict[str, float] = {}
+    opens: dict[str, int] = {}
+    try:
+        with patch.object(ConfigStore, "USE_BINARY_CACHE", False):
+            results["JSON only"] = measure(lambda: load_all(directory, files), repeat=10)
+            opens["JSON only"] = count_opens()
+
+        results["cold cache"] = measure(lambda: load_all(directory, files), repeat=10, setup=remove_cache)
+        remove_cache()
+        opens["cold cache"] = count_opens()
+
+        results["warm cache"] = measure(lambda: load_all(directory, files), repeat=10)
+        opens["warm cache"] = count_opens()
+
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+    report(f"Config startup: {len(files)} config files, {size_kb} KB", {f"{name} ({opens[name]} opens)": seconds for name, seconds in results.items()}, baseline=f"JSON only ({opens['JSON only']} opens)")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,68 @@
+# Time of a single config write with ConfigStore (lock, history, atomic replace) and with a plain json.dump()
+# Run from the project root: python -m tests.benchmarks.bench_config_store
+from pathlib import Path
+import tempfile
+import shutil
+import json
+
+from modules.config.store import ConfigStore
+
+from .timing import measure, report
+
+
+WRITES: int = 100
+SETTINGS_FILEPATH: Path = Path(__file__).parent.parent.parent / "config" / "settings.json"
+
+
+def create_files() -> dict[str, dict | list]:
+    with open(SETTINGS_FILEPATH, "r") as file:
+        settings: dict = json.load(file)
+    mods: list[dict] = [{"name": f"Mod {i}", "enabled": True, "enabled_studio": False, "priority": i} for i in range(100)]
+    fastflags: list[dict] = [
+        {"name": f"Profile {i}", "enabled": True, "enabled_studio": False, "data": {f"FFlagBenchmark{j}": "True" for j in range(20)}}
+        for i in range(200)
+    ]
+    return {"settings": settings, "100 mods": mods, "200 fastflag profiles": fastflags}
+
+
+def main() -> None:
+    directory: Path = Path(tempfile.mkdtemp())
+    results: dict[str, float] = {}
+    sizes: list[str] = []
+
+    try:
+        for name, data in create_files().items():
+            filepath: Path = directory / f"{name.replace(' ', '_')}.json"
+            with open(filepath, "w") as file:
+                json.dump(data, file, indent=4)
+            sizes.append(f"{name} {round(filepath.stat().st_size / 1024, 1)} KB")
+
+            # The write method used before ConfigStore, which truncated the file first
+            def dump() -> None:
+                for _ in range(WRITES):
+                    with open(filepath, "w") as file:
+                        json.dump(data, file, indent=4)
+
+            # Settings are a dict, the other files are lists of items
+            def change(data: dict | list, value: int) -> None:
+                item: dict = data[0] if isinstance(data, list) else data
+                item["benchmark"] = value
+
+            store: ConfigStore = ConfigStore(filepath, default=type(data)())
+            store.get()
+            def write() -> None:
+                for i in range(WRITES):
+                    store.update(lambda data: change(data, i))
+                    store.flush()
+
+            results[f"{name}, json.dump"] = measure(dump, repeat=3) / WRITES
+            results[f"{name}, ConfigStore"] = measure(write, repeat=3) / WRITES
+
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+    report(f"Config writes: {', '.join(sizes)}", results)
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,95 @@
+# Serial vs parallel package downloads against a local HTTP server
+# Run from the project root: python -m tests.benchmarks.bench_download_missing_files
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from types import SimpleNamespace, ModuleType
+from unittest.mock import patch
+from threading import Thread
+from pathlib import Path
+import importlib
+import tempfile
+import hashlib
+import random
+import shutil
+import time
+
+from modules.request import Api
+from modules.filesystem import Directory
+
+from .timing import measure, report
+
+
+# The tasks package exports a function with the same name as the module
+task: ModuleType = importlib.import_module("modules.launcher.tasks.download_missing_files")
+
+
+LATENCY: float = 0.05  # Seconds before the first byte of each response
+STREAM_RATE: int = 16 * 1048576  # Bytes per second of a single connection
+PACKAGE_SIZES: list[int] = [4194304, 3145728, 2097152, 1048576] + [262144] * 12 + [32768] * 16
+
+
+# Every response is delayed and throttled, like a CDN with a limited speed per connection
+class Handler(BaseHTTPRequestHandler):
+    files: dict[str, bytes] = {}
+
+
+    def do_GET(self) -> None:
+        data: bytes | None = self.files.get(self.path.lstrip("/"))
+        if data is None:
+            self.send_error(404)
+            return
+
+        time.sleep(LATENCY)
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        chunk_size: int = 65536
+        for i in range(0, len(data), chunk_size):
+            self.wfile.write(data[i:i + chunk_size])
+            time.sleep(chunk_size / STREAM_RATE)
+
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+
+def create_manifest() -> list[dict]:
+    rng: random.Random = random.Random(0)
+    manifest: list[dict] = []
+    for i, size in enumerate(PACKAGE_SIZES):
+        data: bytes = rng.randbytes(size)
+        file: str = f"package{i}.zip"
+        Handler.files[file] = data
+        manifest.append({"file": file, "hash": hashlib.md5(data).hexdigest(), "size": size})
+    return manifest
+
+
+def main() -> None:
+    manifest: list[dict] = create_manifest()
+    deployment: SimpleNamespace = SimpleNamespace(version="version-benchmark", package_manifest=manifest)
+    hashes: list[str] = [item["hash"] for item in manifest]
+
+    server: ThreadingHTTPServer = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    Thread(target=server.serve_forever, daemon=True).start()
+    url: str = f"http://127.0.0.1:{server.server_address[1]}"
+
+    directory: Path = Path(tempfile.mkdtemp())
+    def clear() -> None:
+        shutil.rmtree(directory / "Player", ignore_errors=True)
+
+    results: dict[str, float] = {}
+    try:
+        with patch.object(Directory, "DOWNLOADS", directory), patch.object(Api.Roblox.Deployment, "download", staticmethod(lambda version, file: f"{url}/{file}")):
+            for workers in (1, 2, 4, 8):
+                with patch.object(task, "MAX_WORKERS", workers):
+                    results[f"{workers} worker(s)"] = measure(lambda: task.download_missing_files(deployment, "Player", hashes), repeat=3, setup=clear)
+
+    finally:
+        server.shutdown()
+        shutil.rmtree(directory, ignore_errors=True)
+
+    total_mb: float = round(sum(PACKAGE_SIZES) / 1048576, 1)
+    report(f"download_missing_files: {len(PACKAGE_SIZES)} packages, {total_mb} MB, {int(LATENCY * 1000)} ms latency, {STREAM_RATE // 1048576} MB/s per connection", results, baseline="1 worker(s)")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
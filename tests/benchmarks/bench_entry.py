@@ -0,0 +1,76 @@
+# Parsing log lines with the lazy Entry and with the Entry it replaced
+# Run from the project root: python -m tests.benchmarks.bench_entry
+from datetime import datetime, timezone
+
+from modules.activity_watcher.entry import Entry
+from modules.activity_watcher import events
+
+from .roblox_log import create_log_lines
+from .timing import measure, report
+
+
+LINES: int = 200000
+
+
+# Entry before it was made lazy, every field was parsed in __init__
+class LegacyEntry:
+    timestamp: float
+    prefixes: list[str] = []
+    original: str
+    message: str
+    level: str | None = None
+
+
+    def __init__(self, data: str):
+        self.prefixes = []
+
+        self.original = data.strip()
+        
+        self.timestamp = datetime.strptime(data.split(",")[0], "%Y-%m-%dT%H:%M:%S.%fZ").replace(tzinfo=timezone.utc).timestamp()
+
+        split_data: list[str] = data.split()[1:]
+        for item in split_data:
+            if item.startswith("[") and item.endswith("]"):
+                self.prefixes.append(item)
+            else:
+                break
+
+        self.message = " ".join(data.split(" ")[1:])
+        for prefix in self.prefixes:
+            self.message = self.message.replace(prefix, "", 1)
+        self.message = self.message.strip()
+        
+        level = item.split()[0].split(",")[-1]
+        try:
+            int(level)
+        except ValueError:
+            self.level = level
+
+
+def main() -> None:
+    lines: list[str] = create_log_lines(LINES)
+
+    # The log reader only needs the first prefix of most lines, the other fields are read for the few lines that are events
+    def classify() -> None:
+        for line in lines:
+            events.parse(Entry(line), "Player")
+
+    def parse_all() -> None:
+        for line in lines:
+            entry: Entry = Entry(line)
+            entry.timestamp, entry.prefixes, entry.message, entry.level
+
+    def parse_legacy() -> None:
+        for line in lines:
+            LegacyEntry(line)
+
+    results: dict[str, float] = {
+        "LegacyEntry": measure(parse_legacy, repeat=3),
+        "Entry, all fields": measure(parse_all, repeat=3),
+        "Entry, classified": measure(classify, repeat=3)
+    }
+    report(f"Entry: {LINES} synthetic log lines", results, baseline="LegacyEntry", count=LINES, unit="lines")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,88 @@
+# Replaying a growing Roblox log through LogTail and through a full read of the file on every tick
+# Run from the project root: python -m tests.benchmarks.bench_log_tail
+from typing import Callable
+from pathlib import Path
+import tempfile
+import shutil
+import time
+import re
+import os
+
+from modules.activity_watcher.entry import Entry
+from modules.activity_watcher.log_tail import LogTail
+
+from .roblox_log import create_log_lines
+from .timing import report
+
+
+INITIAL_LINES: int = 100000
+TICKS: int = 20
+LINES_PER_TICK: int = 250
+
+
+# The log reader before LogTail, which read and split the newest log file completely on every tick
+def read_full_log(directory: Path, mode: str) -> list[Entry]:
+    log_files: list[Path] = [
+        directory / item.name
+        for item in directory.iterdir()
+        if item.is_file() and mode in item.name
+    ]
+
+    filepath: Path = max(log_files, key=os.path.getmtime)
+
+    log_entry_pattern = r'(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d{3}Z.*?)(?=\d{4}-\d{2}-\d{2}T|$)'
+    with open(filepath, "r", encoding="utf-8", errors="replace") as file:
+        content: str = file.read()
+
+    entries = re.findall(log_entry_pattern, content, re.DOTALL)
+    return [Entry(data) for data in reversed(entries)]
+
+
+# Lines are appended between ticks like Roblox would, only the reads are timed
+def replay(directory: Path, lines: list[str], read: Callable[[], object]) -> tuple[float, float]:
+    shutil.rmtree(directory, ignore_errors=True)
+    directory.mkdir()
+    filepath: Path = directory / "0.000.0_20240101T120000Z_Player_0a1b2_last.log"
+    filepath.write_text("".join(lines[:INITIAL_LINES]))
+
+    start: float = time.perf_counter()
+    read()
+    first_read: float = time.perf_counter() - start
+
+    ticks: float = 0
+    for i in range(TICKS):
+        offset: int = INITIAL_LINES + i * LINES_PER_TICK
+        with open(filepath, "a") as file:
+            file.write("".join(lines[offset:offset + LINES_PER_TICK]))
+
+        start = time.perf_counter()
+        read()
+        ticks += time.perf_counter() - start
+    return first_read, ticks / TICKS
+
+
+def main() -> None:
+    lines: list[str] = create_log_lines(INITIAL_LINES + TICKS * LINES_PER_TICK)
+    root: Path = Path(tempfile.mkdtemp())
+    directory: Path = root / "logs"
+
+    results: dict[str, float] = {}
+    try:
+        first_read, tick = replay(directory, lines, lambda: read_full_log(directory, "Player"))
+        results["full read, first read"] = first_read
+        results["full read, per tick"] = tick
+
+        log_tail: LogTail = LogTail(directory, "Player")
+        first_read, tick = replay(directory, lines, log_tail.read)
+        results["LogTail, first read"] = first_read
+        results["LogTail, per tick"] = tick
+
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+    size_mb: float = round(len("".join(lines[:INITIAL_LINES]).encode()) / 1048576, 1)
+    report(f"Log reader: {INITIAL_LINES} lines ({size_mb} MB), then {TICKS} ticks of {LINES_PER_TICK} lines", results, baseline="full read, per tick")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,87 @@
+# Per-tick cost of checking a process with ProcessMonitor and with a scan of every process, with hundreds of processes running
+# Run from the project root: python -m tests.benchmarks.bench_process_monitor
+from typing import Callable
+from pathlib import Path
+import subprocess
+import tempfile
+import shutil
+import os
+
+import psutil
+from psutil import NoSuchProcess
+
+from modules.functions.process_monitor import ProcessMonitor
+
+from .timing import measure, report
+
+
+PROCESS_COUNT: int = 300
+CALLS: int = 50
+
+
+# process_exists() before ProcessMonitor, called on every tick of the RPC loop
+def process_exists(process: str) -> bool:
+    for p in psutil.process_iter():
+        try:
+            if p.name() == process:
+                return True
+
+        except NoSuchProcess:
+            continue
+
+    return False
+
+
+# Idle processes that wait for input, the monitored process is a renamed copy that is started last
+def get_command(directory: Path) -> tuple[list[str], list[str], str]:
+    if os.name == "nt":
+        executable: str = shutil.which("cmd")
+        arguments: list[str] = ["/c", "pause"]
+        name: str = "RobloxBench.exe"
+    else:
+        executable = shutil.which("sleep")
+        arguments = ["600"]
+        name = "RobloxBench"
+
+    target: Path = directory / name
+    shutil.copy(executable, target)
+    return [executable, *arguments], [str(target), *arguments], name
+
+
+def main() -> None:
+    directory: Path = Path(tempfile.mkdtemp())
+    command, target_command, name = get_command(directory)
+
+    processes: list[subprocess.Popen] = []
+    try:
+        for _ in range(PROCESS_COUNT):
+            processes.append(subprocess.Popen(command, stdin=subprocess.PIPE, stdout=subprocess.DEVNULL))
+        processes.append(subprocess.Popen(target_command, stdin=subprocess.PIPE, stdout=subprocess.DEVNULL))
+
+        process_count: int = len(psutil.pids())
+        monitor: ProcessMonitor = ProcessMonitor()
+        assert monitor.is_running(name) and process_exists(name)
+
+        def repeat(function: Callable[[], object]) -> float:
+            return measure(lambda: [function() for _ in range(CALLS)], repeat=3) / CALLS
+
+        results: dict[str, float] = {
+            "scan, running": repeat(lambda: process_exists(name)),
+            "scan, not running": repeat(lambda: process_exists("NotRunning.exe")),
+            "scan, 3 names": repeat(lambda: [process_exists(item) for item in ("NotRunning.exe", "eurotrucks2.exe", name)]),
+            "monitor, running": repeat(lambda: monitor.is_running(name)),
+            "monitor, 1 of 3 names running": repeat(lambda: monitor.find_any("NotRunning.exe", "eurotrucks2.exe", name))
+        }
+
+    finally:
+        for process in processes:
+            process.kill()
+        for process in processes:
+            process.wait()
+        shutil.rmtree(directory, ignore_errors=True)
+
+    report(f"Process check per tick: {process_count} processes running", results, baseline="scan, running")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,87 @@
+# Restoring synthetic packages serially, in parallel and after a single file changed
+# Run from the project root: python -m tests.benchmarks.bench_restore_default_files
+from types import SimpleNamespace, ModuleType
+from unittest.mock import patch
+from zipfile import ZipFile, ZIP_DEFLATED
+from pathlib import Path
+import importlib
+import tempfile
+import hashlib
+import random
+import shutil
+
+from modules.filesystem import Directory
+
+from .timing import measure, report
+
+
+# The tasks package exports a function with the same name as the module
+task: ModuleType = importlib.import_module("modules.launcher.tasks.restore_default_files")
+
+
+PACKAGE_COUNT: int = 30
+FILES_PER_PACKAGE: int = 200
+FILE_SIZE: int = 16384
+TARGETS: list[str] = ["", "content", "content/textures", "PlatformContent/pc", "ExtraContent"]
+
+
+# Packages with the same target share a directory, like the real content packages do
+def create_packages(downloads: Path, base_directory: Path) -> list[dict]:
+    rng: random.Random = random.Random(0)
+    words: list[bytes] = [rng.randbytes(8).hex().encode() for _ in range(256)]
+    manifest: list[dict] = []
+    for i in range(PACKAGE_COUNT):
+        temp: Path = downloads / "package.tmp"
+        with ZipFile(temp, "w", ZIP_DEFLATED) as archive:
+            for j in range(FILES_PER_PACKAGE):
+                data: bytes = b" ".join(rng.choices(words, k=FILE_SIZE // 17))
+                archive.writestr(f"package{i}\\file{j}.bin", data)
+
+        hash: str = hashlib.md5(temp.read_bytes()).hexdigest()
+        temp.rename(downloads / hash)
+        target: Path = base_directory / TARGETS[i % len(TARGETS)]
+        manifest.append({"file": f"package{i}.zip", "hash": hash, "target": str(target)})
+    return manifest
+
+
+def main() -> None:
+    root: Path = Path(tempfile.mkdtemp())
+    downloads: Path = root / "Downloads" / "Player"
+    downloads.mkdir(parents=True)
+    base_directory: Path = root / "Versions" / "version-benchmark"
+    deployment: SimpleNamespace = SimpleNamespace(
+        package_manifest=create_packages(downloads, base_directory),
+        base_directory=base_directory,
+        executable_name="RobloxPlayerBeta.exe",
+        executable_path=base_directory / "RobloxPlayerBeta.exe",
+        app_settings_path=base_directory / "AppSettings.xml",
+        APP_SETTINGS_CONTENT=""
+    )
+    modified_file: Path = base_directory / "content" / "package1" / "file0.bin"
+
+    def remove_install() -> None:
+        shutil.rmtree(base_directory, ignore_errors=True)
+
+    def modify_file() -> None:
+        modified_file.write_bytes(b"modified")
+
+    def restore() -> None:
+        task.restore_default_files(deployment, "Player")
+
+    results: dict[str, float] = {}
+    try:
+        # Links and the package cache are turned off, so every file is extracted
+        with patch.object(Directory, "DOWNLOADS", root / "Downloads"), patch.object(Directory, "VERSIONS", root / "Versions"), patch.object(task.settings, "get_value", lambda key: False):
+            for workers in (1, 2, 4):
+                with patch.object(task, "MAX_WORKERS", workers):
+                    results[f"full restore, {workers} worker(s)"] = measure(restore, repeat=3, setup=remove_install)
+            results["one modified file"] = measure(restore, repeat=3, setup=modify_file)
+
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+    report(f"restore_default_files: {PACKAGE_COUNT} packages, {PACKAGE_COUNT * FILES_PER_PACKAGE} files", results, baseline="full restore, 1 worker(s)")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
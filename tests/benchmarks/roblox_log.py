@@ -0,0 +1,38 @@
+from datetime import datetime, timezone
+import random
+
+
+# Most lines of a real log are network and HTTP traces that the activity watcher ignores
+NOISE: list[tuple[str, str]] = [
+    ("[FLog::Network]", "Connection {0} sent {1} bytes, received {2} bytes, ping {3} ms"),
+    ("[FLog::Network]", "Replicator {0}: queue size {1}, pending {2}"),
+    ("[DFLog::HttpTraceLight]", "HttpResponse({0}) time:{1}ms (net {2}ms callback {3}ms) status:200 OK"),
+    ("[DFLog::HttpTraceError]", "HttpResponse({0}) time:{1}ms status:404 Not Found"),
+    ("[FLog::Output]", "Settings Date header was {0} {1} {2}"),
+    ("[FLog::Graphics]", "Frame {0}: {1} draw calls, {2} triangles, {3} ms"),
+    ("[FLog::SingleSurfaceApp]", "handleNotification {0} {1}")
+]
+
+EVENTS: list[tuple[str, str]] = [
+    ("[FLog::Output]", "! Joining game '0a1b2c3d-4e5f-6789-abcd-ef0123456789' place 1818 at 10.0.0.1"),
+    ("[FLog::GameJoinLoadTime]", "Report game_join_loadtime: placeid:1818, universeid:13058, userid:1, time:2048"),
+    ("[FLog::Output]", "[BloxstrapRPC] {\"command\":\"SetRichPresence\",\"data\":{\"details\":\"Benchmarking\"}}"),
+    ("[FLog::SingleSurfaceApp]", "leaveUGCGameInternal")
+]
+
+
+# Lines look like 2024-01-01T12:00:00.000Z,0.000000,1a2b,6 [FLog::Network] message
+def create_log_lines(count: int, seed: int = 0, start: float = 1704110400) -> list[str]:
+    rng: random.Random = random.Random(seed)
+    lines: list[str] = []
+    timestamp: float = start
+    for i in range(count):
+        timestamp += rng.uniform(0, 0.01)
+        if rng.random() < 0.001:
+            prefix, message = EVENTS[rng.randrange(len(EVENTS))]
+        else:
+            prefix, message = NOISE[rng.randrange(len(NOISE))]
+            message = message.format(*(rng.randrange(100000) for _ in range(4)))
+        formatted: str = datetime.fromtimestamp(timestamp, timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%f")[:23] + "Z"
+        lines.append(f"{formatted},{timestamp - start:.6f},{rng.randrange(65536):x},{rng.choice((6, 6, 6, 'Warning'))} {prefix} {message}\n")
+    return lines
\ No newline at end of file
@@ -0,0 +1,27 @@
+from typing import Callable
+import time
+
+
+# Best of several runs, so a single slow run (e.g. a cold disk cache) doesn't decide the result
+def measure(function: Callable[[], object], repeat: int = 5, setup: Callable[[], object] | None = None) -> float:
+    best: float = float("inf")
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start: float = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+# If count is given, the throughput is shown as well (e.g. lines per second)
+def report(title: str, results: dict[str, float], baseline: str | None = None, count: int | None = None, unit: str = "items") -> None:
+    print(title)
+    width: int = max(len(name) for name in results)
+    for name, seconds in results.items():
+        line: str = f"  {name.ljust(width)}  {seconds * 1000:10.2f} ms"
+        if count is not None and seconds > 0:
+            line += f"  {count / seconds:12,.0f} {unit}/s"
+        if baseline is not None and name != baseline and seconds > 0:
+            line += f"  ({results[baseline] / seconds:.1f}x)"
+        print(line)
\ No newline at end of file
@@ -0,0 +1,8 @@
+from pathlib import Path
+import sys
+
+
+# The modules package is imported from the project root, like in main.py
+ROOT: Path = Path(__file__).parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
\ No newline at end of file
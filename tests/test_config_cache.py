@@ -0,0 +1,77 @@
+from pathlib import Path
+import marshal
+import json
+import os
+
+from modules.config.store import ConfigStore, write_json, _get_cache_path
+
+
+def create_store(tmp_path: Path, data: dict) -> ConfigStore:
+    filepath: Path = tmp_path / "config.json"
+    filepath.write_text(json.dumps(data))
+    store: ConfigStore = ConfigStore(filepath, default={})
+    store.CHECK_INTERVAL = 0
+    return store
+
+
+def test_cache_is_written_when_file_is_loaded(tmp_path: Path) -> None:
+    store: ConfigStore = create_store(tmp_path, {"a": 1})
+    store.get()
+
+    with open(_get_cache_path(store.filepath), "rb") as file:
+        header, data = marshal.loads(file.read())
+    stat: os.stat_result = store.filepath.stat()
+    assert header == (marshal.version, stat.st_mtime_ns, stat.st_size)
+    assert data == {"a": 1}
+
+
+def test_cache_is_used_if_file_is_unchanged(tmp_path: Path) -> None:
+    create_store(tmp_path, {"a": 1}).get()
+    store: ConfigStore = ConfigStore(tmp_path / "config.json", default={})
+
+    # The cache is only valid for the same version of the file, so changing its data shows it was used
+    cache_path: Path = _get_cache_path(store.filepath)
+    with open(cache_path, "rb") as file:
+        header, _ = marshal.loads(file.read())
+    cache_path.write_bytes(marshal.dumps((header, {"a": "cached"})))
+
+    assert store.get() == {"a": "cached"}
+
+
+def test_cache_is_ignored_if_file_changed(tmp_path: Path) -> None:
+    store: ConfigStore = create_store(tmp_path, {"a": 1})
+    store.get()
+    write_json(store.filepath, {"a": 22})
+
+    assert ConfigStore(store.filepath, default={}).get() == {"a": 22}
+    assert store.get() == {"a": 22}
+
+
+def test_cache_is_updated_after_write(tmp_path: Path) -> None:
+    store: ConfigStore = create_store(tmp_path, {"a": 1})
+    store.update(lambda data: data.update(a=2))
+    store.flush()
+
+    fresh: ConfigStore = ConfigStore(store.filepath, default={})
+    assert fresh._read_cache(fresh._get_signature()) == {"a": 2}
+
+
+def test_corrupt_or_wrong_type_cache_is_ignored(tmp_path: Path) -> None:
+    store: ConfigStore = create_store(tmp_path, {"a": 1})
+    store.get()
+    cache_path: Path = _get_cache_path(store.filepath)
+    with open(cache_path, "rb") as file:
+        header, _ = marshal.loads(file.read())
+
+    cache_path.write_bytes(b"not marshal data")
+    assert ConfigStore(store.filepath, default={}).get() == {"a": 1}
+
+    cache_path.write_bytes(marshal.dumps((header, ["wrong", "type"])))
+    assert ConfigStore(store.filepath, default={}).get() == {"a": 1}
+
+
+def test_cache_can_be_disabled(tmp_path: Path) -> None:
+    store: ConfigStore = create_store(tmp_path, {"a": 1})
+    store.USE_BINARY_CACHE = False
+    store.get()
+    assert not _get_cache_path(store.filepath).exists()
\ No newline at end of file
@@ -0,0 +1,111 @@
+from pathlib import Path
+import json
+
+import pytest
+
+from modules.config.store import ConfigStore, write_json
+from modules.config.collection import ConfigCollection
+
+
+def create_collection(tmp_path: Path, items: list[dict]) -> ConfigCollection:
+    filepath: Path = tmp_path / "items.json"
+    filepath.write_text(json.dumps(items))
+    store: ConfigStore = ConfigStore(filepath, default=[])
+    store.CHECK_INTERVAL = 0
+    return ConfigCollection(store, "name")
+
+
+# The index must always match a fresh scan of the data
+def assert_consistent(collection: ConfigCollection) -> None:
+    data: list[dict] = collection.store.get()
+    expected: dict = {}
+    for item in data:
+        expected.setdefault(item["name"], item)
+    assert collection._sync().keys() == expected.keys()
+    for key, item in expected.items():
+        assert collection.get(key) is item
+
+
+def test_insert_appends_and_indexes(tmp_path: Path) -> None:
+    collection: ConfigCollection = create_collection(tmp_path, [{"name": "a"}])
+    collection.insert({"name": "b", "value": 1})
+
+    assert [item["name"] for item in collection.store.get()] == ["a", "b"]
+    assert collection.get("b") == {"name": "b", "value": 1}
+    assert_consistent(collection)
+
+
+def test_insert_duplicate_key_at_front_is_indexed(tmp_path: Path) -> None:
+    collection: ConfigCollection = create_collection(tmp_path, [{"name": "a", "value": 1}])
+    collection.insert({"name": "a", "value": 2}, position=0)
+    assert collection.get("a")["value"] == 2
+
+    collection.insert({"name": "a", "value": 3})
+    assert collection.get("a")["value"] == 2
+    assert_consistent(collection)
+
+
+def test_rename_and_remove(tmp_path: Path) -> None:
+    collection: ConfigCollection = create_collection(tmp_path, [{"name": "a"}, {"name": "b"}])
+    collection.rename("a", "c")
+
+    assert collection.get("a") is None
+    assert collection.get("c") is not None
+    assert_consistent(collection)
+
+    collection.remove("b")
+    assert collection.get("b") is None
+    assert [item["name"] for item in collection.store.get()] == ["c"]
+    assert_consistent(collection)
+
+
+def test_update_missing_key_raises(tmp_path: Path) -> None:
+    collection: ConfigCollection = create_collection(tmp_path, [{"name": "a"}])
+    with pytest.raises(KeyError):
+        collection.update("b", {"value": 1})
+    assert_consistent(collection)
+
+
+def test_failed_transaction_keeps_index_consistent(tmp_path: Path) -> None:
+    collection: ConfigCollection = create_collection(tmp_path, [{"name": "a"}])
+    version: int = collection.get_version()
+
+    with pytest.raises(RuntimeError):
+        with collection.transaction():
+            collection.insert({"name": "b"})
+            collection.remove("a")
+            raise RuntimeError
+
+    assert collection.get("a") is not None
+    assert collection.get("b") is None
+    assert collection.get_version() != version
+    assert_consistent(collection)
+
+
+def test_sorted_cache_is_cleared_on_change(tmp_path: Path) -> None:
+    collection: ConfigCollection = create_collection(tmp_path, [{"name": "b", "order": 2}, {"name": "a", "order": 1}])
+    assert [item["name"] for item in collection.sorted_by("order")] == ["a", "b"]
+
+    collection.update("b", {"order": 0})
+    assert [item["name"] for item in collection.sorted_by("order")] == ["b", "a"]
+
+
+def test_index_is_rebuilt_when_file_is_changed_by_another_process(tmp_path: Path) -> None:
+    collection: ConfigCollection = create_collection(tmp_path, [{"name": "a"}])
+    assert collection.get("a") is not None
+
+    write_json(collection.store.filepath, [{"name": "b"}, {"name": "c"}])
+    assert collection.get("a") is None
+    assert collection.get("c") is not None
+    assert_consistent(collection)
+
+
+def test_changes_are_merged_with_file_changed_by_another_process(tmp_path: Path) -> None:
+    collection: ConfigCollection = create_collection(tmp_path, [{"name": "a", "value": 1}])
+    collection.insert({"name": "b"})
+    collection.update("a", {"value": 2})
+    write_json(collection.store.filepath, [{"name": "a", "value": 1}, {"name": "c"}])
+    collection.store.flush()
+
+    assert json.loads(collection.store.filepath.read_text()) == [{"name": "a", "value": 2}, {"name": "c"}, {"name": "b"}]
+    assert_consistent(collection)
\ No newline at end of file
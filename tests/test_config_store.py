@@ -0,0 +1,115 @@
+from pathlib import Path
+from typing import Any
+import json
+import time
+
+import pytest
+
+from modules.config.store import ConfigStore, get_history, write_json
+
+
+def create_store(tmp_path: Path, data: Any = None, default: Any = None) -> ConfigStore:
+    filepath: Path = tmp_path / "config.json"
+    if data is not None:
+        filepath.write_text(json.dumps(data))
+    store: ConfigStore = ConfigStore(filepath, default={} if default is None else default)
+    store.WRITE_DELAY = 0.1
+    store.CHECK_INTERVAL = 0
+    return store
+
+
+def read(store: ConfigStore) -> Any:
+    return json.loads(store.filepath.read_text())
+
+
+def set_key(key: str, value: Any):
+    def change(data: dict) -> None:
+        data[key] = value
+    return change
+
+
+def test_changes_are_written_once_after_delay(tmp_path: Path) -> None:
+    store: ConfigStore = create_store(tmp_path, {"a": 1})
+    for i in range(10):
+        store.update(set_key("a", i))
+
+    assert read(store) == {"a": 1}
+    assert store.get() == {"a": 9}
+
+    time.sleep(0.5)
+    assert read(store) == {"a": 9}
+    assert len(get_history(store.filepath)) == 1
+
+
+def test_flush_writes_immediately(tmp_path: Path) -> None:
+    store: ConfigStore = create_store(tmp_path, {"a": 1})
+    store.update(set_key("b", 2))
+    store.flush()
+
+    assert read(store) == {"a": 1, "b": 2}
+    assert not store.dirty
+    assert store.timer is None
+
+
+def test_get_reloads_file_changed_by_another_process(tmp_path: Path) -> None:
+    store: ConfigStore = create_store(tmp_path, {"a": 1})
+    assert store.get() == {"a": 1}
+
+    write_json(store.filepath, {"a": 2, "padding": True})
+    assert store.get() == {"a": 2, "padding": True}
+
+
+def test_pending_changes_are_applied_to_file_changed_by_another_process(tmp_path: Path) -> None:
+    store: ConfigStore = create_store(tmp_path, {"a": 1})
+    store.update(set_key("b", 2))
+    write_json(store.filepath, {"a": 3, "c": 4})
+    store.flush()
+
+    assert read(store) == {"a": 3, "b": 2, "c": 4}
+    assert store.get() == {"a": 3, "b": 2, "c": 4}
+
+
+def test_reload_discards_pending_changes(tmp_path: Path) -> None:
+    store: ConfigStore = create_store(tmp_path, {"a": 1})
+    store.update(set_key("a", 2))
+    store.reload()
+
+    assert store.get() == {"a": 1}
+    assert not store.dirty
+    store.flush()
+    assert read(store) == {"a": 1}
+
+
+def test_failed_transaction_is_reverted(tmp_path: Path) -> None:
+    store: ConfigStore = create_store(tmp_path, {"a": 1})
+    store.update(set_key("b", 2))
+
+    with pytest.raises(RuntimeError):
+        with store.transaction():
+            store.update(set_key("a", 3))
+            raise RuntimeError
+
+    assert store.get() == {"a": 1, "b": 2}
+    store.flush()
+    assert read(store) == {"a": 1, "b": 2}
+
+
+def test_corrupt_file_is_recovered_from_history(tmp_path: Path) -> None:
+    store: ConfigStore = create_store(tmp_path, {"a": 1})
+    store.update(set_key("a", 2))
+    store.flush()
+    store.filepath.write_text("{")
+
+    store.reload()
+    assert store.get() == {"a": 1}
+    store.flush()
+    assert read(store) == {"a": 1}
+
+
+def test_rollback_restores_previous_version(tmp_path: Path) -> None:
+    store: ConfigStore = create_store(tmp_path, {"a": 1})
+    store.update(set_key("a", 2))
+    store.flush()
+
+    assert store.rollback()
+    assert read(store) == {"a": 1}
\ No newline at end of file
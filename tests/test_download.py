@@ -0,0 +1,92 @@
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Thread
+from pathlib import Path
+from typing import Iterator
+import importlib
+import hashlib
+import re
+
+import pytest
+
+from modules.filesystem import download
+from modules.filesystem.exceptions import FileDownloadError
+
+# The package exports the function under the same name as the module
+download_module = importlib.import_module("modules.filesystem.download")
+
+
+DATA: bytes = bytes(range(256)) * 1024
+DROP_AFTER: int = 100000
+
+
+# Closes the connection after DROP_AFTER bytes of every response, but honours Range requests so the download can resume
+class DroppingHandler(BaseHTTPRequestHandler):
+    ranges: list[int] = []
+
+
+    def do_GET(self) -> None:
+        offset: int = 0
+        match: re.Match | None = re.fullmatch(r"bytes=(\d+)-", self.headers.get("Range", ""))
+        if match is not None:
+            offset = int(match.group(1))
+        self.ranges.append(offset)
+
+        if offset >= len(DATA):
+            self.send_response(416)
+            self.end_headers()
+            return
+
+        self.send_response(206 if offset else 200)
+        if offset:
+            self.send_header("Content-Range", f"bytes {offset}-{len(DATA) - 1}/{len(DATA)}")
+        self.send_header("Content-Length", str(len(DATA) - offset))
+        self.end_headers()
+        self.wfile.write(DATA[offset:offset + DROP_AFTER])
+        self.wfile.flush()
+        self.close_connection = True
+
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+
+@pytest.fixture
+def server(monkeypatch: pytest.MonkeyPatch) -> Iterator[str]:
+    monkeypatch.setattr(download_module, "COOLDOWN", 0)
+    monkeypatch.setenv("no_proxy", "*")
+    DroppingHandler.ranges = []
+
+    httpd: ThreadingHTTPServer = ThreadingHTTPServer(("127.0.0.1", 0), DroppingHandler)
+    thread: Thread = Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{httpd.server_address[1]}/file"
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+
+
+def test_download_resumes_after_dropped_connection(server: str, tmp_path: Path) -> None:
+    destination: Path = tmp_path / "file"
+    download(server, destination, attempts=2, md5=hashlib.md5(DATA).hexdigest(), size=len(DATA))
+
+    assert destination.read_bytes() == DATA
+    assert not destination.with_suffix(".tmp").exists()
+    assert DroppingHandler.ranges == list(range(0, len(DATA), DROP_AFTER))
+
+
+def test_download_resumes_existing_partial_file(server: str, tmp_path: Path) -> None:
+    destination: Path = tmp_path / "file"
+    destination.with_suffix(".tmp").write_bytes(DATA[:150000])
+    download(server, destination, attempts=2, md5=hashlib.md5(DATA).hexdigest(), size=len(DATA))
+
+    assert destination.read_bytes() == DATA
+    assert DroppingHandler.ranges[0] == 150000
+
+
+def test_download_rejects_wrong_hash(server: str, tmp_path: Path) -> None:
+    destination: Path = tmp_path / "file"
+    with pytest.raises(FileDownloadError):
+        download(server, destination, attempts=1, md5="0" * 32, size=len(DATA))
+
+    assert not destination.exists()
\ No newline at end of file
@@ -0,0 +1,71 @@
+from pathlib import Path
+import hashlib
+import os
+
+from modules.filesystem import md5
+from modules.filesystem.checksum import md5_digest
+from modules.launcher.download_index import DownloadIndex
+
+
+def test_md5_matches_hashlib(tmp_path: Path) -> None:
+    path: Path = tmp_path / "file"
+    data: bytes = os.urandom(3 * 1048576 + 123)
+    path.write_bytes(data)
+    assert md5(path) == hashlib.md5(data).hexdigest()
+
+
+def test_md5_digest_can_be_continued(tmp_path: Path) -> None:
+    path: Path = tmp_path / "file"
+    path.write_bytes(b"first")
+    digest = md5_digest(path)
+    digest.update(b"second")
+    assert digest.hexdigest() == hashlib.md5(b"firstsecond").hexdigest()
+
+
+def test_verified_file_survives_reload(tmp_path: Path) -> None:
+    (tmp_path / "hash").write_bytes(b"content")
+    index: DownloadIndex = DownloadIndex(tmp_path)
+    index.set_verified("hash")
+    index.save()
+    assert DownloadIndex(tmp_path).is_verified("hash")
+
+
+def test_changed_file_is_not_verified(tmp_path: Path) -> None:
+    path: Path = tmp_path / "hash"
+    path.write_bytes(b"content")
+    index: DownloadIndex = DownloadIndex(tmp_path)
+    index.set_verified("hash")
+
+    stat: os.stat_result = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000000))
+    assert not index.is_verified("hash")
+
+    index.set_verified("hash")
+    path.write_bytes(b"longer content")
+    assert not index.is_verified("hash")
+
+
+def test_missing_file_is_not_verified(tmp_path: Path) -> None:
+    (tmp_path / "hash").write_bytes(b"content")
+    index: DownloadIndex = DownloadIndex(tmp_path)
+    index.set_verified("hash")
+    (tmp_path / "hash").unlink()
+    assert not index.is_verified("hash")
+
+
+def test_prune_and_remove(tmp_path: Path) -> None:
+    index: DownloadIndex = DownloadIndex(tmp_path)
+    for hash in ("a", "b", "c"):
+        (tmp_path / hash).write_bytes(hash.encode())
+        index.set_verified(hash)
+
+    index.prune(["a", "b"])
+    index.remove("b")
+    assert index.is_verified("a")
+    assert not index.is_verified("b")
+    assert not index.is_verified("c")
+
+
+def test_corrupt_index_is_ignored(tmp_path: Path) -> None:
+    (tmp_path / DownloadIndex.FILENAME).write_text("{")
+    assert DownloadIndex(tmp_path).data == {}
\ No newline at end of file
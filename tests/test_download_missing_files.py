@@ -0,0 +1,82 @@
+from pathlib import Path
+from threading import Thread
+import time
+
+import pytest
+
+from modules.launcher.tasks.download_missing_files import BandwidthLimiter, DownloadProgress, _get_partial_size
+
+
+# Time only passes when the limiter sleeps, so the tests don't depend on the speed of the machine
+class FakeClock:
+    now: float = 0
+    slept: float = 0
+
+
+    def __call__(self) -> float:
+        return self.now
+
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+        self.slept += seconds
+
+
+def test_bandwidth_limiter_allows_burst_up_to_rate() -> None:
+    clock: FakeClock = FakeClock()
+    limiter: BandwidthLimiter = BandwidthLimiter(1000000, clock, clock.sleep)
+    limiter.consume(1000000)
+    assert clock.slept == 0
+
+
+def test_bandwidth_limiter_delays_above_rate() -> None:
+    clock: FakeClock = FakeClock()
+    limiter: BandwidthLimiter = BandwidthLimiter(1000000, clock, clock.sleep)
+    limiter.consume(1000000)
+    limiter.consume(500000)
+    assert clock.slept == pytest.approx(0.5)
+
+
+def test_bandwidth_limiter_refills_over_time() -> None:
+    clock: FakeClock = FakeClock()
+    limiter: BandwidthLimiter = BandwidthLimiter(1000000, clock, clock.sleep)
+    limiter.consume(1000000)
+    clock.now += 0.25
+    limiter.consume(500000)
+    assert clock.slept == pytest.approx(0.25)
+
+
+def test_bandwidth_limiter_is_shared_between_threads() -> None:
+    limiter: BandwidthLimiter = BandwidthLimiter(1000000)
+    limiter.consume(1000000)
+    start: float = time.monotonic()
+    threads: list[Thread] = [Thread(target=limiter.consume, args=(100000,)) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    # Only a lower bound, a slow machine can take longer but never less
+    assert time.monotonic() - start >= 0.3
+
+
+class TextVariable:
+    value: str = ""
+
+
+    def set(self, value: str) -> None:
+        self.value = value
+
+
+def test_progress_includes_resumed_bytes() -> None:
+    textvariable: TextVariable = TextVariable()
+    progress: DownloadProgress = DownloadProgress(2097152, "Downloading", textvariable, resumed=1048576)
+    progress.add(1048576)
+    progress.complete()
+    assert textvariable.value.startswith("Downloading (2.0/2.0 MB")
+
+
+def test_partial_size(tmp_path: Path) -> None:
+    (tmp_path / "hash.tmp").write_bytes(b"12345")
+    assert _get_partial_size(tmp_path / "hash", 10) == 5
+    assert _get_partial_size(tmp_path / "hash", 4) == 0
+    assert _get_partial_size(tmp_path / "missing", 10) == 0
\ No newline at end of file
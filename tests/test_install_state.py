@@ -0,0 +1,95 @@
+from pathlib import Path
+from zipfile import ZipFile
+import os
+
+from modules.launcher.install_state import InstallState
+
+
+def create_state(directory: Path) -> InstallState:
+    state: InstallState = InstallState(directory, load=False)
+    state.add_package("package", "content-fonts.zip", directory / "content")
+    for name, content in (("a.txt", b"first"), ("b.txt", b"second")):
+        path: Path = directory / "content" / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(content)
+        state.record(path, "package")
+    state.save()
+    return state
+
+
+def test_unchanged_files_are_not_modified(tmp_path: Path) -> None:
+    create_state(tmp_path)
+    assert InstallState(tmp_path).get_modified_files() == {}
+
+
+def test_changed_size_is_modified(tmp_path: Path) -> None:
+    create_state(tmp_path)
+    (tmp_path / "content" / "a.txt").write_bytes(b"changed content")
+    assert InstallState(tmp_path).get_modified_files() == {"package": {"content/a.txt"}}
+
+
+def test_missing_file_is_modified(tmp_path: Path) -> None:
+    create_state(tmp_path)
+    (tmp_path / "content" / "b.txt").unlink()
+    assert InstallState(tmp_path).get_modified_files() == {"package": {"content/b.txt"}}
+
+
+def test_same_size_is_checked_with_crc(tmp_path: Path) -> None:
+    create_state(tmp_path)
+    path: Path = tmp_path / "content" / "a.txt"
+    stat: os.stat_result = path.stat()
+
+    path.write_bytes(b"FIRST")
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000000))
+    assert InstallState(tmp_path).get_modified_files() == {"package": {"content/a.txt"}}
+
+
+def test_touched_file_with_same_content_is_not_modified(tmp_path: Path) -> None:
+    create_state(tmp_path)
+    path: Path = tmp_path / "content" / "a.txt"
+    stat: os.stat_result = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000000))
+
+    state: InstallState = InstallState(tmp_path)
+    assert state.get_modified_files() == {}
+    assert state.files["content/a.txt"]["mtime"] == path.stat().st_mtime_ns
+
+
+def test_ignored_files_are_skipped(tmp_path: Path) -> None:
+    create_state(tmp_path)
+    (tmp_path / "content" / "a.txt").unlink()
+    assert InstallState(tmp_path).get_modified_files(ignore={"content/a.txt"}) == {}
+
+
+def test_remove_untracked_files_only_removes_given_files(tmp_path: Path) -> None:
+    state: InstallState = create_state(tmp_path)
+    for key in ("content/mod.txt", "content/roblox.log", "ClientSettings/ClientAppSettings.json"):
+        (tmp_path / key).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / key).write_text("{}")
+
+    state.remove_untracked_files({"content/mod.txt", "content/a.txt", "ClientSettings/ClientAppSettings.json"})
+
+    assert not (tmp_path / "content" / "mod.txt").exists()
+    assert (tmp_path / "content" / "a.txt").is_file()
+    assert (tmp_path / "content" / "roblox.log").is_file()
+    assert (tmp_path / "ClientSettings" / "ClientAppSettings.json").is_file()
+
+
+def test_restore_files_replaces_hardlinks(tmp_path: Path) -> None:
+    install_directory: Path = tmp_path / "install"
+    package_directory: Path = tmp_path / "downloads"
+    package_directory.mkdir()
+    with ZipFile(package_directory / "package", "w") as archive:
+        archive.writestr("a.txt", b"first")
+
+    state: InstallState = create_state(install_directory)
+    mod_file: Path = tmp_path / "mod.txt"
+    mod_file.write_bytes(b"modded")
+    (install_directory / "content" / "a.txt").unlink()
+    os.link(mod_file, install_directory / "content" / "a.txt")
+
+    state.restore_files(["content/a.txt"], package_directory)
+
+    assert (install_directory / "content" / "a.txt").read_bytes() == b"first"
+    assert mod_file.read_bytes() == b"modded"
+    assert state.get_modified_files() == {}
@@ -0,0 +1,79 @@
+from pathlib import Path
+from zipfile import ZipFile
+import time
+import os
+
+from modules.launcher.package_cache import PackageCache
+from modules.filesystem import get_member_path
+
+
+def create_package(path: Path, files: dict[str, bytes]) -> Path:
+    with ZipFile(path, "w") as archive:
+        for name, content in files.items():
+            archive.writestr(name, content)
+    return path
+
+
+def set_age(path: Path, seconds: float) -> None:
+    timestamp: float = time.time() - seconds
+    os.utime(path, (timestamp, timestamp))
+
+
+def test_get_extracts_once(tmp_path: Path) -> None:
+    source: Path = create_package(tmp_path / "package.zip", {"content\\a.txt": b"first"})
+    cache: PackageCache = PackageCache(tmp_path / "cache")
+
+    directory: Path = cache.get("hash", source)
+    assert (directory / "content" / "a.txt").read_bytes() == b"first"
+    assert cache.index["hash"]["size"] == 5
+
+    (directory / "content" / "a.txt").write_bytes(b"cached")
+    assert (cache.get("hash", source) / "content" / "a.txt").read_bytes() == b"cached"
+
+
+def test_save_keeps_entries_of_other_processes(tmp_path: Path) -> None:
+    source: Path = create_package(tmp_path / "package.zip", {"a.txt": b"first"})
+    first: PackageCache = PackageCache(tmp_path / "cache")
+    second: PackageCache = PackageCache(tmp_path / "cache")
+
+    first.get("first", source)
+    second.get("second", source)
+    first.save()
+    second.save()
+
+    assert set(PackageCache(tmp_path / "cache").index) == {"first", "second"}
+
+
+def test_collect_garbage_skips_recent_and_temporary_entries(tmp_path: Path) -> None:
+    cache: PackageCache = PackageCache(tmp_path / "cache")
+    for name in ("extracting.1234.tmp", "unknown", "crashed.1234.tmp"):
+        (cache.directory / name).mkdir(parents=True)
+    set_age(cache.directory / "unknown", PackageCache.GRACE_PERIOD * 2)
+    set_age(cache.directory / "crashed.1234.tmp", PackageCache.GRACE_PERIOD * 2)
+
+    cache.collect_garbage(keep=set())
+
+    assert (cache.directory / "extracting.1234.tmp").is_dir()
+    assert not (cache.directory / "unknown").exists()
+    assert not (cache.directory / "crashed.1234.tmp").exists()
+
+
+def test_collect_garbage_removes_least_recently_used(tmp_path: Path) -> None:
+    source: Path = create_package(tmp_path / "package.zip", {"a.txt": b"12345"})
+    cache: PackageCache = PackageCache(tmp_path / "cache")
+    for hash in ("old", "kept", "new"):
+        cache.get(hash, source)
+    cache.index["old"]["last_used"] = 1
+    cache.index["kept"]["last_used"] = 0
+
+    cache.collect_garbage(keep={"kept"}, max_size=10)
+
+    assert set(cache.index) == {"kept", "new"}
+    assert not (cache.directory / "old").exists()
+    assert set(PackageCache(tmp_path / "cache").index) == {"kept", "new"}
+
+
+def test_member_paths_stay_inside_destination(tmp_path: Path) -> None:
+    assert get_member_path(tmp_path, "content\\fonts\\a.ttf") == tmp_path / "content" / "fonts" / "a.ttf"
+    assert get_member_path(tmp_path, "../../a.txt") == tmp_path / "a.txt"
+    assert get_member_path(tmp_path, "/etc/./a.txt") == tmp_path / "etc" / "a.txt"
\ No newline at end of file